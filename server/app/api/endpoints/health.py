@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends
-from app.models.common import HealthResponse
+from app.models.common import HealthResponse, CacheStatsResponse
+from app.services.cache.metadata import get_metadata_cache
+from app.services.cache.rendition import get_rendition_cache
 from app.services.kafka.producer import get_kafka_producer
 from app.services.storage.minio import get_minio_client
 from app.db.elasticsearch.client import get_elasticsearch_client
@@ -27,3 +29,17 @@ async def health_check(
             "redis": "up",
         },
     }
+
+
+@router.get("/health/cache", response_model=CacheStatsResponse)
+async def cache_stats(
+    rendition_cache=Depends(get_rendition_cache),
+    metadata_cache=Depends(get_metadata_cache),
+):
+    """캐시 적중/미스/제거 통계"""
+    return {
+        "caches": {
+            "rendition": rendition_cache.stats(),
+            "metadata": metadata_cache.stats(),
+        }
+    }
@@ -5,12 +5,15 @@ from fastapi import (
     Depends,
     HTTPException,
     BackgroundTasks,
+    Query,
+    Request,
     Response,
 )
 from fastapi.responses import StreamingResponse
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
 import uuid
-import io
 import time
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -20,91 +23,551 @@ from app.models.image import (
     ImageMetadata,
     ProcessingResult,
     ImageListResponse,
+    BatchUploadResponse,
+    BatchProcessingRequest,
+    BatchProcessingResult,
+    RenditionSpec,
+    SimilarImagesResponse,
 )
-from app.services.storage.minio import MinioService, get_minio_client
+from app.services.storage.minio import AsyncMinioService, get_async_minio_client
 from app.services.kafka.producer import KafkaProducerService, get_kafka_producer
-from app.services.image.validation import validate_image_file
+from app.services.image.hashing import hamming_distance, hash_bands
+from app.services.image.ops import (
+    FILTER_OPERATIONS,
+    OUTPUT_FORMATS,
+    available_output_formats,
+    build_operations,
+    build_output,
+    build_rendition_key,
+)
+from app.core.singleflight import SingleFlight
+from app.services.cache.metadata import MetadataCache, get_metadata_cache
+from app.services.cache.rendition import (
+    CachedRendition,
+    TieredRenditionCache,
+    get_rendition_cache,
+)
+from app.services.image.rendition import (
+    RenditionRenderer,
+    get_rendition_flight,
+    get_rendition_renderer,
+)
+from app.services.image.validation import ImageStreamValidator
+from app.services.storage.dedup import ContentIndex, get_content_index
+from app.services.storage.operations import HashingStreamReader, parse_range_header
 from app.db.elasticsearch.client import ElasticsearchClient, get_elasticsearch_client
+from app.db.elasticsearch.operations import decode_cursor, encode_cursor
 from app.db.redis.client import RedisClient, get_redis_client
-from app.core.exceptions import StorageException, ImageValidationException
+from app.core.exceptions import ImageProcessingException, StorageException
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# 목록 정렬 (image_id로 동순위 정렬을 고정해 search_after 커서가 안정적이도록)
+LIST_SORT = [
+    {"upload_time": {"order": "desc"}},
+    {"image_id": {"order": "asc"}},
+]
+# Accept 헤더 협상 시 선호 순서 (압축률 순)
+NEGOTIATED_FORMATS = ["avif", "webp"]
+# 목록 조회 시 반환할 필드
+LIST_SOURCE_FIELDS = [
+    "image_id",
+    "filename",
+    "content_type",
+    "size",
+    "upload_time",
+    "status",
+]
 
-@router.post("/upload", response_model=ImageUploadResponse)
-async def upload_image(
-    file: UploadFile = File(...),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    minio_client: MinioService = Depends(get_minio_client),
-    kafka_producer: KafkaProducerService = Depends(get_kafka_producer),
-    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+
+def _content_id(image_id: str, metadata: Dict[str, Any]) -> str:
+    """원본과 렌디션을 공유하는 콘텐츠 ID (중복 제거 이전 문서는 이미지 ID)"""
+    return metadata.get("content_id") or image_id
+
+
+def _original_object_name(image_id: str, metadata: Dict[str, Any]) -> str:
+    """원본 이미지 객체 이름"""
+    return (
+        metadata.get("object_name")
+        or f"{image_id}.{metadata.get('filename', '').split('.')[-1]}"
+    )
+
+
+def _validate_rendition_params(
+    width: Optional[int], height: Optional[int], filter_type: Optional[str]
 ):
-    """원본 이미지 업로드 엔드포인트"""
+    """렌디션 필터와 크기 검증"""
+    if filter_type not in (None, "original", *FILTER_OPERATIONS):
+        raise HTTPException(
+            status_code=400, detail=f"지원되지 않는 필터입니다: {filter_type}"
+        )
+
+    if any(
+        size is not None and not 0 < size <= settings.RENDER_MAX_DIMENSION
+        for size in (width, height)
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail=f"이미지 크기는 1~{settings.RENDER_MAX_DIMENSION} 사이여야 합니다.",
+        )
+
+
+def _preset_specs(names: List[str]) -> List[RenditionSpec]:
+    """프리셋 이름을 렌디션 파라미터로 변환"""
+    unknown = [name for name in names if name not in settings.RENDITION_PRESETS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 렌디션 프리셋입니다: {', '.join(unknown)}",
+        )
+
+    return [RenditionSpec(**settings.RENDITION_PRESETS[name]) for name in names]
+
+
+def _resolve_renditions(specs: List[RenditionSpec]) -> List[Dict[str, Any]]:
+    """렌디션 목록 검증 후 중복을 제거한 파라미터 목록 반환"""
+    renditions: Dict[str, Dict[str, Any]] = {}
+    for spec in specs:
+        _validate_rendition_params(spec.width, spec.height, spec.filter)
+        if not build_operations(spec.width, spec.height, spec.filter):
+            raise HTTPException(
+                status_code=400,
+                detail="크기나 필터가 없는 렌디션은 요청할 수 없습니다.",
+            )
+
+        output = _build_output(spec.format, spec.quality)
+        params = {
+            "width": spec.width,
+            "height": spec.height,
+            "filter": spec.filter,
+            "output_format": output,
+        }
+        key = build_rendition_key("", spec.filter, spec.width, spec.height, output)
+        renditions.setdefault(key, params)
+
+    return list(renditions.values())
+
+
+def _build_output(
+    image_format: Optional[str] = None,
+    quality: Optional[int] = None,
+    progressive: bool = False,
+    subsampling: Optional[str] = None,
+) -> Dict[str, Any]:
+    """출력 형식 파라미터 검증"""
     try:
-        content = await file.read()
-        validate_image_file(content, file.filename)
-    except ImageValidationException as e:
-        logger.e(f"이미지 유효성 검증 실패: {str(e)}")
-    finally:
-        await file.seek(0)
+        output = build_output(image_format, quality, progressive, subsampling)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if output["format"] not in available_output_formats():
+        raise HTTPException(
+            status_code=400,
+            detail=f"이 서버에서 지원하지 않는 출력 형식입니다: {output['format']}",
+        )
+
+    return output
+
 
+def _negotiate_output_format(accept: Optional[str]) -> str:
+    """Accept 헤더에서 클라이언트가 받을 수 있는 가장 작은 출력 형식 선택"""
+    accepted = set()
+    for item in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in item.split(";"))
+        if any(param.replace(" ", "") in ("q=0", "q=0.0") for param in params):
+            continue
+        accepted.add(media_type.lower())
+
+    available = available_output_formats()
+    for image_format in NEGOTIATED_FORMATS:
+        if (
+            image_format in available
+            and OUTPUT_FORMATS[image_format]["content_type"] in accepted
+        ):
+            return image_format
+
+    return "jpeg"
+
+
+def _rendition_message(
+    image_id: str, metadata: Dict[str, Any], renditions: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """원본 하나에서 여러 렌디션을 생성하도록 요청하는 Kafka 메시지"""
+    content_id = _content_id(image_id, metadata)
+    return {
+        "image_id": image_id,
+        "content_id": content_id,
+        "bucket": settings.MINIO_ORIGINAL_BUCKET,
+        "object_name": _original_object_name(image_id, metadata),
+        "renditions": [
+            {
+                **params,
+                "output": build_rendition_key(
+                    content_id,
+                    params["filter"],
+                    params["width"],
+                    params["height"],
+                    params["output_format"],
+                ),
+            }
+            for params in renditions
+        ],
+    }
+
+
+async def _get_metadata(
+    image_id: str, es_client: ElasticsearchClient, metadata_cache: MetadataCache
+) -> Optional[Dict[str, Any]]:
+    """이미지 메타데이터 조회 (캐시 미스 시에만 Elasticsearch 조회)"""
+    return await metadata_cache.get(
+        image_id,
+        lambda: es_client.get_document(
+            index_name=settings.ELASTICSEARCH_INDEX, doc_id=image_id
+        ),
+    )
+
+
+async def _update_metadata(
+    image_id: str,
+    document: Dict[str, Any],
+    current: Optional[Dict[str, Any]],
+    es_client: ElasticsearchClient,
+    metadata_cache: MetadataCache,
+):
+    """이미지 메타데이터 업데이트를 bulk 버퍼에 추가하고 캐시 갱신
+
+    bulk 전송 전에 캐시를 비우면 이전 문서가 다시 캐시될 수 있으므로,
+    현재 메타데이터를 알고 있으면 병합한 결과로 캐시를 갱신한다.
+    """
+    es_client.enqueue_update(
+        index_name=settings.ELASTICSEARCH_INDEX, doc_id=image_id, document=document
+    )
+
+    if current is not None:
+        await metadata_cache.set(image_id, {**current, **document})
+    else:
+        await metadata_cache.invalidate(image_id)
+
+
+async def _store_upload(
+    file: UploadFile, minio_client: AsyncMinioService, content_index: ContentIndex
+) -> Dict[str, Any]:
+    """업로드 파일을 검증하고 MinIO에 저장한 뒤 메타데이터 반환
+
+    멀티파트 본문은 이미 임시 파일로 받아져 있으므로 먼저 해시와 유효성을
+    확인하고, 같은 내용의 원본이 있으면 저장하지 않고 기존 원본을 참조한다.
+    """
     image_id = str(uuid.uuid4())
     file_extension = file.filename.split(".")[-1].lower()
     object_name = f"{image_id}.{file_extension}"
-
-    file_content = await file.read()
     content_type = file.content_type or "application/octet-stream"
 
-    upload_success = minio_client.upload_file(
-        buck_name=settings.MINIO_ORIGINAL_BUCKET,
-        object_name=object_name,
-        file_data=io.BytesIO(file_content),
-        content_type=content_type,
-    )
+    validator = ImageStreamValidator(file.filename)
+    reader = HashingStreamReader(file.file, validator=validator)
+    await asyncio.to_thread(reader.drain)
+    validator.finalize()
+    file.file.seek(0)
+
+    async def store():
+        upload_success = await minio_client.upload_stream(
+            bucket_name=settings.MINIO_ORIGINAL_BUCKET,
+            object_name=object_name,
+            stream=file.file,
+            content_type=content_type,
+        )
+        if not upload_success:
+            raise StorageException(detail="이미지 업로드에 실패했습니다.")
 
-    if not upload_success:
-        raise StorageException(detail="이미지 업로드에 실패했습니다.")
+    uploaded = False
+    if await content_index.lookup(reader.content_hash) is None:
+        await store()
+        uploaded = True
 
-    metadata = {
+    owner = await content_index.claim(reader.content_hash, image_id, object_name)
+    if owner is None:
+        # Redis 장애 시 중복 제거 없이 저장
+        owner = {"content_id": image_id, "object_name": object_name}
+
+    if owner["content_id"] == image_id and not uploaded:
+        # 조회 이후 기존 원본이 삭제된 경우
+        await store()
+    elif owner["content_id"] != image_id and uploaded:
+        # 동시에 같은 내용이 먼저 등록된 경우 방금 저장한 객체 제거
+        await minio_client.delete_file(
+            bucket_name=settings.MINIO_ORIGINAL_BUCKET, object_name=object_name
+        )
+
+    return {
         "image_id": image_id,
+        "content_id": owner["content_id"],
         "filename": file.filename,
         "content_type": content_type,
-        "size": len(file_content),
-        "object_name": object_name,
+        "size": reader.size,
+        "object_name": owner["object_name"],
+        "content_hash": reader.content_hash,
         "upload_time": int(time.time()),
         "status": "uploaded",
     }
 
+
+async def _release_upload(
+    metadata: Dict[str, Any],
+    minio_client: AsyncMinioService,
+    content_index: ContentIndex,
+):
+    """원본 참조 해제 (마지막 참조이면 원본과 렌디션 삭제)"""
+    image_id = metadata["image_id"]
+    content_id = _content_id(image_id, metadata)
+
+    refs = -1
+    if metadata.get("content_hash"):
+        refs = await content_index.release(metadata["content_hash"])
+
+    if refs is None:
+        # 참조 수를 확인할 수 없으면 공유 중일 수 있는 원본을 남겨둠
+        logger.warning(f"Could not release content reference for {image_id}")
+        return
+
+    if refs > 0 or (refs < 0 and content_id != image_id):
+        return
+
+    await minio_client.delete_file(
+        bucket_name=settings.MINIO_ORIGINAL_BUCKET,
+        object_name=_original_object_name(image_id, metadata),
+    )
+
+    renditions = await minio_client.list_objects(
+        bucket_name=settings.MINIO_PROCESSED_BUCKET, prefix=f"{content_id}/"
+    )
+    await asyncio.gather(
+        *(
+            minio_client.delete_file(
+                bucket_name=settings.MINIO_PROCESSED_BUCKET,
+                object_name=rendition["object_name"],
+            )
+            for rendition in renditions
+        )
+    )
+    logger.info(f"Deleted original and {len(renditions)} renditions of {content_id}")
+
+
+async def _index_perceptual_hash(
+    metadata: Dict[str, Any],
+    minio_client: AsyncMinioService,
+    renderer: RenditionRenderer,
+    es_client: ElasticsearchClient,
+    metadata_cache: MetadataCache,
+):
+    """업로드된 이미지의 지각 해시를 계산해 메타데이터에 추가 (백그라운드 작업)"""
+    image_id = metadata["image_id"]
+    content_id = _content_id(image_id, metadata)
+
+    hashes = None
+    if content_id != image_id:
+        # 같은 내용의 원본에 이미 계산된 해시가 있으면 재사용
+        owner = await _get_metadata(content_id, es_client, metadata_cache)
+        if owner and owner.get("phash"):
+            hashes = {"phash": owner["phash"], "dhash": owner.get("dhash")}
+
+    if hashes is None:
+        original = await minio_client.download_file(
+            bucket_name=settings.MINIO_ORIGINAL_BUCKET,
+            object_name=_original_object_name(image_id, metadata),
+        )
+        if not original:
+            return
+
+        try:
+            hashes = await renderer.compute_hashes(original)
+        except Exception as e:
+            logger.warning(f"Failed to compute perceptual hash for {image_id}: {e}")
+            return
+
+        if not hashes:
+            return
+
+    # 해시 계산 중 갱신되었을 수 있으므로 최신 메타데이터에 병합
+    current = await _get_metadata(image_id, es_client, metadata_cache)
+    await _update_metadata(
+        image_id,
+        {**hashes, "phash_bands": hash_bands(hashes["phash"], settings.PHASH_BANDS)},
+        current,
+        es_client,
+        metadata_cache,
+    )
+
+
+@router.post("/upload", response_model=ImageUploadResponse)
+async def upload_image(
+    file: UploadFile = File(...),
+    eager_renditions: bool = False,
+    background_tasks: BackgroundTasks = BackgroundTasks(),
+    minio_client: AsyncMinioService = Depends(get_async_minio_client),
+    kafka_producer: KafkaProducerService = Depends(get_kafka_producer),
+    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
+    content_index: ContentIndex = Depends(get_content_index),
+    renderer: RenditionRenderer = Depends(get_rendition_renderer),
+):
+    """원본 이미지 업로드 엔드포인트
+
+    eager_renditions가 참이면 기본 프리셋 렌디션 생성을 바로 큐에 추가해
+    첫 조회가 렌더링 대신 저장소 조회로 끝나도록 한다.
+    """
+    metadata = await _store_upload(file, minio_client, content_index)
+    image_id = metadata["image_id"]
+
+    if eager_renditions:
+        renditions = _resolve_renditions(
+            _preset_specs(settings.EAGER_RENDITION_PRESETS)
+        )
+        message = _rendition_message(image_id, metadata, renditions)
+
+        # 중복 업로드도 항상 요청한다 (기존 원본의 렌디션이 아직 없거나 요청이
+        # 실패했을 수 있으며, 같은 결과 키는 같은 바이트로 다시 쓰일 뿐이다)
+        if await kafka_producer.send_message_async(
+            topic=settings.KAFKA_IMAGE_TOPIC, key=image_id, value=message
+        ):
+            metadata["processed_objects"] = [
+                rendition["output"] for rendition in message["renditions"]
+            ]
+        else:
+            # 업로드는 성공했으므로 렌디션은 조회 시 온디맨드로 생성
+            logger.warning(f"Failed to enqueue eager renditions for {image_id}")
+
+    # bulk 인덱싱 전에도 바로 조회할 수 있도록 캐시에 먼저 저장
+    await metadata_cache.set(image_id, metadata)
+
+    es_client.enqueue_index(
+        index_name=settings.ELASTICSEARCH_INDEX, document=metadata, doc_id=image_id
+    )
+
     background_tasks.add_task(
-        es_client.index_document,
-        index_name=settings.ELASTICSEARCH_INDEX,
-        document=metadata,
-        doc_id=image_id,
+        _index_perceptual_hash,
+        metadata,
+        minio_client,
+        renderer,
+        es_client,
+        metadata_cache,
     )
 
     return {
         "image_id": image_id,
         "filename": file.filename,
-        "size": len(file_content),
-        "content_type": content_type,
+        "size": metadata["size"],
+        "content_type": metadata["content_type"],
         "status": "uploaded",
+        "processed_objects": metadata.get("processed_objects"),
         "message": "이미지가 성공적으로 업로드되었습니다",
     }
 
 
+@router.post("/upload/batch", response_model=BatchUploadResponse)
+async def upload_images_batch(
+    files: List[UploadFile] = File(...),
+    background_tasks: BackgroundTasks = BackgroundTasks(),
+    minio_client: AsyncMinioService = Depends(get_async_minio_client),
+    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
+    content_index: ContentIndex = Depends(get_content_index),
+    renderer: RenditionRenderer = Depends(get_rendition_renderer),
+):
+    """여러 이미지를 한 번에 업로드하는 엔드포인트
+
+    파일별 검증/저장은 제한된 동시성으로 병렬 수행하고, 메타데이터는
+    하나의 bulk 요청으로 인덱싱한다. 실패한 파일은 결과에만 기록된다.
+    """
+    if len(files) > settings.UPLOAD_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.UPLOAD_BATCH_MAX_FILES}개까지 업로드할 수 있습니다.",
+        )
+
+    semaphore = asyncio.Semaphore(settings.UPLOAD_BATCH_CONCURRENCY)
+
+    async def store(file: UploadFile) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await _store_upload(file, minio_client, content_index)
+            except HTTPException as e:
+                return {"filename": file.filename, "error": e.detail}
+            except Exception as e:
+                logger.error(f"Failed to upload {file.filename}: {str(e)}")
+                return {
+                    "filename": file.filename,
+                    "error": "이미지 업로드에 실패했습니다.",
+                }
+
+    stored = await asyncio.gather(*(store(file) for file in files))
+
+    documents = {item["image_id"]: item for item in stored if "error" not in item}
+    indexed = await es_client.index_documents(settings.ELASTICSEARCH_INDEX, documents)
+
+    results = []
+    for item in stored:
+        if "error" in item:
+            results.append(
+                {
+                    "filename": item["filename"],
+                    "status": "failed",
+                    "message": item["error"],
+                }
+            )
+            continue
+
+        image_id = item["image_id"]
+        if not indexed.get(image_id):
+            # 메타데이터 없이 남은 원본 참조는 조회할 수 없으므로 해제
+            await _release_upload(item, minio_client, content_index)
+            results.append(
+                {
+                    "filename": item["filename"],
+                    "status": "failed",
+                    "message": "이미지 메타데이터 저장에 실패했습니다.",
+                }
+            )
+            continue
+
+        await metadata_cache.set(image_id, item)
+        background_tasks.add_task(
+            _index_perceptual_hash,
+            item,
+            minio_client,
+            renderer,
+            es_client,
+            metadata_cache,
+        )
+        results.append(
+            {
+                "filename": item["filename"],
+                "status": "uploaded",
+                "image_id": image_id,
+                "size": item["size"],
+                "content_type": item["content_type"],
+            }
+        )
+
+    succeeded = sum(1 for result in results if result["status"] == "uploaded")
+
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
 @router.post("/process", response_model=ProcessingResult)
 async def process_image(
     request: ProcessingRequest,
     background_tasks: BackgroundTasks = BackgroundTasks(),
     kafka_producer: KafkaProducerService = Depends(get_kafka_producer),
     es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
 ):
     """이미지 처리 요청 엔드포인트"""
-    image_exists = await es_client.get_document(
-        index_name=settings.ELASTICSEARCH_INDEX,
-        doc_id=request.image_id,
-    )
+    image_exists = await _get_metadata(request.image_id, es_client, metadata_cache)
 
     if not image_exists:
         raise HTTPException(
@@ -114,7 +577,8 @@ async def process_image(
     message = {
         "image_id": request.image_id,
         "bucket": settings.MINIO_ORIGINAL_BUCKET,
-        "object_name": f"{request.image_id}.{image_exists.get('filename', '').split('.')[-1]}",
+        "object_name": _original_object_name(request.image_id, image_exists),
+        "content_id": _content_id(request.image_id, image_exists),
         "params": {
             "width": str(request.resize.width) if request.resize else None,
             "height": str(request.resize.height) if request.resize else None,
@@ -122,7 +586,7 @@ async def process_image(
         },
     }
 
-    message_sent = kafka_producer.send_message(
+    message_sent = await kafka_producer.send_message_async(
         topic=settings.KAFKA_IMAGE_TOPIC,
         key=request.image_id,
         value=message,
@@ -139,14 +603,12 @@ async def process_image(
             "resize": request.resize.dict() if request.resize else None,
             "filter": request.filter,
         },
+        "processing_completed": None,
         "status": "processing",
     }
 
-    background_tasks.add_task(
-        es_client.update_document,
-        indx_name=settings.ELASTICSEARCH_INDEX,
-        doc_id=request.image_id,
-        document=processing_metadata,
+    await _update_metadata(
+        request.image_id, processing_metadata, image_exists, es_client, metadata_cache
     )
 
     return {
@@ -156,14 +618,96 @@ async def process_image(
     }
 
 
+@router.post("/process/batch", response_model=BatchProcessingResult)
+async def process_images_batch(
+    request: BatchProcessingRequest,
+    kafka_producer: KafkaProducerService = Depends(get_kafka_producer),
+    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
+):
+    """여러 이미지에 여러 렌디션을 한 번에 요청하는 엔드포인트
+
+    렌디션 목록은 한 번만 검증하고, 이미지마다 모든 렌디션을 담은 메시지 하나를
+    전송해 처리 측에서 원본을 한 번만 디코딩하도록 한다.
+    """
+    image_ids = list(dict.fromkeys(request.image_ids))
+    specs = request.renditions + _preset_specs(request.presets)
+    if not image_ids or not specs:
+        raise HTTPException(
+            status_code=400, detail="이미지와 렌디션을 하나 이상 지정해야 합니다."
+        )
+
+    if len(image_ids) > settings.PROCESS_BATCH_MAX_IMAGES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.PROCESS_BATCH_MAX_IMAGES}개 이미지까지 요청할 수 있습니다.",
+        )
+
+    renditions = _resolve_renditions(specs)
+
+    found = await metadata_cache.get_many(
+        image_ids,
+        lambda missing: es_client.get_documents(settings.ELASTICSEARCH_INDEX, missing),
+    )
+
+    requested = [image_id for image_id in image_ids if image_id in found]
+    messages = {
+        image_id: _rendition_message(image_id, found[image_id], renditions)
+        for image_id in requested
+    }
+
+    async def send(image_id: str) -> bool:
+        return await kafka_producer.send_message_async(
+            topic=settings.KAFKA_IMAGE_TOPIC, key=image_id, value=messages[image_id]
+        )
+
+    sent = await asyncio.gather(*(send(image_id) for image_id in requested))
+
+    accepted = [image_id for image_id, ok in zip(requested, sent) if ok]
+    for image_id in accepted:
+        await _update_metadata(
+            image_id,
+            {
+                "processing_requested": int(time.time()),
+                # 결과 컨슈머가 outputs가 모두 반영되면 processing_completed 기록
+                "processing_params": {
+                    "renditions": renditions,
+                    "outputs": [
+                        rendition["output"]
+                        for rendition in messages[image_id]["renditions"]
+                    ],
+                },
+                "processing_completed": None,
+                "status": "processing",
+            },
+            found[image_id],
+            es_client,
+            metadata_cache,
+        )
+
+    return {
+        "status": "processing" if accepted else "failed",
+        "accepted": accepted,
+        "not_found": [image_id for image_id in image_ids if image_id not in found],
+        "failed": [image_id for image_id, ok in zip(requested, sent) if not ok],
+        "renditions": [
+            build_rendition_key(
+                "", r["filter"], r["width"], r["height"], r["output_format"]
+            ).lstrip("/")
+            for r in renditions
+        ],
+        "message": f"{len(accepted)}개 이미지의 처리 요청이 큐에 추가되었습니다",
+    }
+
+
 @router.get("/{image_id}", response_model=ImageMetadata)
 async def get_image_metadata(
-    image_id: str, es_client: ElasticsearchClient = Depends(get_elasticsearch_client)
+    image_id: str,
+    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
 ):
     """이미지 메타데이터 조회"""
-    metadata = await es_client.get_document(
-        index_name=settings.ELASTICSEARCH_INDEX, doc_id=image_id
-    )
+    metadata = await _get_metadata(image_id, es_client, metadata_cache)
 
     if not metadata:
         raise HTTPException(
@@ -173,69 +717,463 @@ async def get_image_metadata(
     return metadata
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교"""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = [
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    ]
+    return etag in candidates
+
+
+def _prepare_response(
+    request: Request, size: int, etag: str, vary: Optional[str] = None
+) -> Tuple[Optional[Response], int, int, int, Dict[str, str]]:
+    """ETag/Range 공통 처리
+
+    (즉시 반환할 응답, 시작 오프셋, 끝 오프셋, 상태 코드, 헤더)를 반환한다.
+    """
+    headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+    if vary:
+        headers["Vary"] = vary
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers), 0, -1, 304, headers
+
+    try:
+        byte_range = parse_range_header(request.headers.get("range"), size)
+    except ValueError:
+        response = Response(
+            status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"}
+        )
+        return response, 0, -1, 416, headers
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    headers["Content-Length"] = str(end - start + 1)
+    return None, start, end, status_code, headers
+
+
+def _stream_object_response(
+    request: Request,
+    minio_client: AsyncMinioService,
+    stat: Dict[str, Any],
+    media_type: str,
+    vary: Optional[str] = None,
+) -> Response:
+    """ETag/Range를 지원하는 객체 스트리밍 응답 생성"""
+    response, start, end, status_code, headers = _prepare_response(
+        request, stat["size"], f'"{stat["etag"]}"', vary
+    )
+    if response is not None:
+        return response
+
+    length = end - start + 1
+    if length <= 0:
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+
+    return StreamingResponse(
+        minio_client.iter_file(
+            bucket_name=stat["bucket_name"],
+            object_name=stat["object_name"],
+            offset=start,
+            length=length,
+        ),
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+    )
+
+
+def _bytes_response(
+    request: Request,
+    data: bytes,
+    etag: str,
+    media_type: str,
+    vary: Optional[str] = None,
+) -> Response:
+    """ETag/Range를 지원하는 메모리 데이터 응답 생성"""
+    response, start, end, status_code, headers = _prepare_response(
+        request, len(data), etag, vary
+    )
+    if response is not None:
+        return response
+
+    return Response(
+        content=data[start : end + 1],
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+    )
+
+
+async def _render_on_demand(
+    image_id: str,
+    metadata: Dict[str, Any],
+    processed_object: str,
+    operations: List[Dict[str, Any]],
+    minio_client: AsyncMinioService,
+    renderer: RenditionRenderer,
+    cache: TieredRenditionCache,
+    output: Optional[Dict[str, Any]] = None,
+) -> Optional[CachedRendition]:
+    """원본을 렌더링하여 처리된 이미지 버킷과 캐시에 저장"""
+    content_type = OUTPUT_FORMATS[(output or build_output())["format"]]["content_type"]
+
+    original = await minio_client.download_file(
+        bucket_name=settings.MINIO_ORIGINAL_BUCKET,
+        object_name=_original_object_name(image_id, metadata),
+    )
+
+    if not original:
+        return None
+
+    rendered = await renderer.render(original, operations, output)
+
+    if rendered is None:
+        raise ImageProcessingException(detail="이미지 렌더링에 실패했습니다.")
+
+    await minio_client.upload_file(
+        bucket_name=settings.MINIO_PROCESSED_BUCKET,
+        object_name=processed_object,
+        file_data=rendered,
+        content_type=content_type,
+    )
+
+    # 단일 파트 업로드의 MinIO ETag(MD5)와 동일한 값 사용
+    entry = CachedRendition(
+        data=rendered,
+        content_type=content_type,
+        etag=f'"{hashlib.md5(rendered).hexdigest()}"',
+    )
+    await cache.set(processed_object, entry)
+
+    return entry
+
+
+async def _fetch_rendition(
+    processed_object: str,
+    minio_client: AsyncMinioService,
+    cache: TieredRenditionCache,
+    stat: Optional[Dict[str, Any]] = None,
+) -> Optional[CachedRendition]:
+    """저장된 렌더링 결과를 읽어 캐시에 저장"""
+    if stat is None:
+        stat = await minio_client.stat_file(
+            bucket_name=settings.MINIO_PROCESSED_BUCKET, object_name=processed_object
+        )
+
+    if not stat:
+        return None
+
+    data = await minio_client.download_file(
+        bucket_name=settings.MINIO_PROCESSED_BUCKET, object_name=processed_object
+    )
+
+    if data is None:
+        return None
+
+    entry = CachedRendition(
+        data=data,
+        content_type=stat.get("content_type") or "image/jpeg",
+        etag=f'"{stat["etag"]}"',
+    )
+    await cache.set(processed_object, entry)
+
+    return entry
+
+
+@router.get("/{image_id}/similar", response_model=SimilarImagesResponse)
+async def find_similar_images(
+    image_id: str,
+    max_distance: Optional[int] = None,
+    limit: int = 20,
+    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
+):
+    """지각 해시 해밍 거리로 유사 이미지 검색
+
+    pHash를 PHASH_BANDS개 구간으로 나눠 색인하므로, 거리가 구간 수 미만인
+    이미지는 적어도 한 구간이 일치한다. 구간 일치 후보만 가져와 정확한 거리를
+    계산하므로 전체 이미지와 쌍별 비교하지 않는다.
+    """
+    if max_distance is None:
+        max_distance = settings.PHASH_MAX_DISTANCE
+
+    if not 0 <= max_distance < settings.PHASH_BANDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"max_distance는 0~{settings.PHASH_BANDS - 1} 사이여야 합니다.",
+        )
+
+    metadata = await _get_metadata(image_id, es_client, metadata_cache)
+
+    if not metadata:
+        raise HTTPException(
+            status_code=404, detail=f"이미지를 찾을 수 없습니다: {image_id}"
+        )
+
+    if not metadata.get("phash"):
+        raise HTTPException(
+            status_code=409, detail="이미지 해시가 아직 계산되지 않았습니다."
+        )
+
+    result = await es_client.search_documents(
+        index_name=settings.ELASTICSEARCH_INDEX,
+        query={
+            "bool": {
+                "filter": {
+                    "terms": {
+                        "phash_bands": hash_bands(
+                            metadata["phash"], settings.PHASH_BANDS
+                        )
+                    }
+                },
+                "must_not": {"ids": {"values": [image_id]}},
+            }
+        },
+        size=settings.PHASH_CANDIDATE_LIMIT,
+        source_includes=["image_id", "filename", "content_id", "phash"],
+    )
+
+    matches = []
+    for candidate in result.get("hits", []):
+        distance = hamming_distance(metadata["phash"], candidate["phash"])
+        if distance <= max_distance:
+            matches.append({**candidate, "distance": distance})
+
+    matches.sort(key=lambda match: match["distance"])
+
+    return {
+        "image_id": image_id,
+        "phash": metadata["phash"],
+        "max_distance": max_distance,
+        "matches": matches[:limit],
+    }
+
+
 @router.get("/{image_id}/download")
 async def download_processed_image(
     image_id: str,
+    request: Request,
     width: Optional[int] = None,
     height: Optional[int] = None,
     filter_type: Optional[str] = None,
-    minio_client: MinioService = Depends(get_minio_client),
+    preset: Optional[str] = None,
+    output_format: Optional[str] = Query(None, alias="format"),
+    quality: Optional[int] = None,
+    progressive: bool = False,
+    subsampling: Optional[str] = None,
+    on_demand: Optional[bool] = None,
+    minio_client: AsyncMinioService = Depends(get_async_minio_client),
     es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    renderer: RenditionRenderer = Depends(get_rendition_renderer),
+    flight: SingleFlight = Depends(get_rendition_flight),
+    cache: TieredRenditionCache = Depends(get_rendition_cache),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
 ):
-    """처리된 이미지 다운로드"""
-    metadata = await es_client.get_document(
-        index_name=settings.ELASTICSEARCH_INDEX, doc_id=image_id
-    )
+    """처리된 이미지 다운로드 (캐시 미스 시 온디맨드 렌더링)
+
+    출력 형식은 format 파라미터로 지정하거나, 생략하면 Accept 헤더에 따라
+    AVIF/WebP/JPEG 중에서 선택하며 형식마다 다른 객체로 저장된다.
+    """
+    if preset:
+        spec = _preset_specs([preset])[0]
+        width, height, filter_type = spec.width, spec.height, spec.filter
+        output_format = output_format or spec.format
+        quality = quality or spec.quality
+
+    _validate_rendition_params(width, height, filter_type)
+
+    vary = None
+    if output_format is None:
+        output_format = _negotiate_output_format(request.headers.get("accept"))
+        vary = "Accept"
+    output = _build_output(output_format, quality, progressive, subsampling)
+
+    # 메타데이터는 캐시되어 있으므로 먼저 조회해 삭제된 이미지를 걸러내고,
+    # 같은 내용의 이미지들이 공유하는 콘텐츠 ID로 렌디션 키를 만든다
+    metadata = await _get_metadata(image_id, es_client, metadata_cache)
 
     if not metadata:
         raise HTTPException(
             status_code=404, detail=f"이미지를 찾을 수 없습니다: {image_id}"
         )
 
-    filter_name = filter_type or "original"
-    width_str = str(width) if width else "orig"
-    height_str = str(height) if height else "orig"
+    processed_object = build_rendition_key(
+        _content_id(image_id, metadata), filter_type, width, height, output
+    )
+    operations = build_operations(width, height, filter_type)
 
-    processed_object = f"{image_id}/{filter_name}_{width_str}x{height_str}.jpg"
+    # 자주 요청되는 렌더링 결과는 백엔드 조회 없이 캐시에서 바로 응답
+    if operations:
+        cached = await cache.get(processed_object)
+        if cached is not None:
+            return _bytes_response(
+                request, cached.data, cached.etag, cached.content_type, vary
+            )
 
-    image_data = minio_client.download_file(
+    stat = await minio_client.stat_file(
         bucket_name=settings.MINIO_PROCESSED_BUCKET,
         object_name=processed_object,
     )
 
-    if not image_data:
+    if stat and operations and stat["size"] <= settings.RENDITION_CACHE_MAX_ITEM_BYTES:
+        # 캐시에 담을 수 있는 작은 렌더링 결과는 읽어서 캐시에 저장
+        entry = await _fetch_rendition(processed_object, minio_client, cache, stat)
+        if entry is not None:
+            return _bytes_response(
+                request, entry.data, entry.etag, entry.content_type, vary
+            )
+
+    if on_demand is None:
+        on_demand = settings.RENDER_ON_DEMAND
+
+    if not stat and operations and on_demand:
+        # 같은 렌더링 결과 키((이미지, 필터, 크기, 형식))의 동시 요청은 한 번만 렌더링
+        entry = await flight.do(
+            processed_object,
+            lambda: _render_on_demand(
+                image_id,
+                metadata,
+                processed_object,
+                operations,
+                minio_client,
+                renderer,
+                cache,
+                output,
+            ),
+            recheck=lambda: _fetch_rendition(processed_object, minio_client, cache),
+        )
+
+        if entry is None:
+            raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+
+        return _bytes_response(
+            request, entry.data, entry.etag, entry.content_type, vary
+        )
+
+    if not stat:
         # 처리된 이미지가 없다면 원본 반환
-        image_data = minio_client.download_file(
+        stat = await minio_client.stat_file(
             bucket_name=settings.MINIO_ORIGINAL_BUCKET,
-            object_name=f"{image_id}.{metadata.get('filename', '').split('.')[-1]}",
+            object_name=_original_object_name(image_id, metadata),
         )
 
-        if not image_data:
+        if not stat:
             raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
 
-    return StreamingResponse(
-        io.BytesIO(image_data), media_type=metadata.get("content_type", "image/jpeg")
+    media_type = stat.get("content_type") or metadata.get("content_type", "image/jpeg")
+    return _stream_object_response(request, minio_client, stat, media_type, vary)
+
+
+@router.delete("/{image_id}", response_model=ProcessingResult)
+async def delete_image(
+    image_id: str,
+    minio_client: AsyncMinioService = Depends(get_async_minio_client),
+    es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
+    metadata_cache: MetadataCache = Depends(get_metadata_cache),
+    content_index: ContentIndex = Depends(get_content_index),
+):
+    """이미지 삭제 (같은 내용의 다른 이미지가 없을 때만 원본과 렌디션 삭제)"""
+    metadata = await _get_metadata(image_id, es_client, metadata_cache)
+
+    if not metadata:
+        raise HTTPException(
+            status_code=404, detail=f"이미지를 찾을 수 없습니다: {image_id}"
+        )
+
+    # 아직 bulk 버퍼에 있는 인덱싱이 삭제 이후에 반영되지 않도록 먼저 전송
+    await es_client.flush()
+    deleted = await es_client.delete_document(
+        index_name=settings.ELASTICSEARCH_INDEX, doc_id=image_id
     )
+    if not deleted:
+        raise HTTPException(
+            status_code=500, detail="이미지 메타데이터 삭제에 실패했습니다."
+        )
+
+    await metadata_cache.invalidate(image_id)
+    await _release_upload(metadata, minio_client, content_index)
+
+    return {
+        "image_id": image_id,
+        "status": "deleted",
+        "message": "이미지가 삭제되었습니다",
+    }
 
 
 @router.get("", response_model=ImageListResponse)
 async def list_images(
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    snapshot: bool = False,
     es_client: ElasticsearchClient = Depends(get_elasticsearch_client),
 ):
-    """이미지 목록 조회"""
-    from_ = (page - 1) * limit
+    """이미지 목록 조회
+
+    cursor가 주어지면 search_after로 이어서 조회하므로 페이지 깊이와 무관하게
+    비용이 일정하다. 응답의 next_cursor로 다음 페이지를 요청한다.
+    snapshot=true로 첫 페이지를 조회하면 PIT를 열어 커서에 담으므로 이어지는
+    페이지가 같은 스냅샷을 본다. 페이지 번호 조회는 PIT 없이 from/size로 조회한다.
+    """
+    search_after = None
+    pit_id = None
+
+    if cursor:
+        try:
+            decoded = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        search_after = decoded["after"]
+        # PIT가 만료되어 스냅샷 없이 이어 온 커서는 그대로 스냅샷 없이 조회
+        pit_id = decoded.get("pit")
+    elif page * limit > settings.ELASTICSEARCH_MAX_RESULT_WINDOW:
+        raise HTTPException(
+            status_code=400,
+            detail="페이지 범위를 초과했습니다. cursor를 사용해 조회해주세요.",
+        )
+    elif snapshot and page == 1:
+        # 커서 순회를 시작할 때만 PIT를 열어 다음 커서로 넘김
+        pit_id = await es_client.open_point_in_time(settings.ELASTICSEARCH_INDEX)
 
     result = await es_client.search_documents(
         index_name=settings.ELASTICSEARCH_INDEX,
         query={"match_all": {}},
-        from_=from_,
+        from_=(page - 1) * limit,
         size=limit,
-        sort=[{"upload_time": {"order": "desc"}}],
+        sort=LIST_SORT,
+        search_after=search_after,
+        pit_id=pit_id,
+        source_includes=LIST_SOURCE_FIELDS,
     )
 
     total = result.get("total", {}).get("value", 0)
     images = result.get("hits", [])
 
-    return {"total": total, "page": page, "limit": limit, "images": images}
+    next_cursor = None
+    if len(images) == limit and result.get("sort"):
+        next_cursor = encode_cursor(result["sort"], result.get("pit_id"))
+    elif result.get("pit_id"):
+        # 마지막 페이지이면 PIT 정리
+        await es_client.close_point_in_time(result["pit_id"])
+
+    return {
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "images": images,
+        "next_cursor": next_cursor,
+    }
@@ -1,7 +1,7 @@
 import os
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import List
+from typing import Any, Dict, List
 
 
 class Settings(BaseSettings):
@@ -24,6 +24,40 @@ class Settings(BaseSettings):
     KAFKA_RESULT_TOPIC: str = Field(
         default="image-processing-results", env="KAFKA_RESULT_TOPIC"
     )
+    KAFKA_PRODUCER_LINGER_MS: int = Field(default=5, env="KAFKA_PRODUCER_LINGER_MS")
+    KAFKA_DELIVERY_TIMEOUT: float = Field(default=10.0, env="KAFKA_DELIVERY_TIMEOUT")
+    KAFKA_CONSUMER_BATCH_SIZE: int = Field(default=500, env="KAFKA_CONSUMER_BATCH_SIZE")
+    KAFKA_CONSUMER_WORKERS: int = Field(default=8, env="KAFKA_CONSUMER_WORKERS")
+    KAFKA_CONSUMER_COMMIT_INTERVAL: float = Field(
+        default=5.0, env="KAFKA_CONSUMER_COMMIT_INTERVAL"
+    )
+    KAFKA_CONSUMER_MAX_RETRIES: int = Field(default=3, env="KAFKA_CONSUMER_MAX_RETRIES")
+    KAFKA_CONSUMER_RETRY_BACKOFF: float = Field(
+        default=0.5, env="KAFKA_CONSUMER_RETRY_BACKOFF"
+    )
+    # 재시도 후에도 처리하지 못한 메시지를 보낼 토픽 (비우면 로그만 남기고 건너뜀)
+    KAFKA_DEAD_LETTER_TOPIC: str = Field(
+        default="image-processing-dead-letters", env="KAFKA_DEAD_LETTER_TOPIC"
+    )
+
+    # 처리 결과 컨슈머 설정
+    RESULT_CONSUMER_ENABLED: bool = Field(default=True, env="RESULT_CONSUMER_ENABLED")
+    RESULT_CONSUMER_GROUP: str = Field(
+        default="image-result-consumer", env="RESULT_CONSUMER_GROUP"
+    )
+    RESULT_CONSUMER_BATCH_SIZE: int = Field(
+        default=500, env="RESULT_CONSUMER_BATCH_SIZE"
+    )
+    RESULT_CONSUMER_POLL_TIMEOUT: float = Field(
+        default=1.0, env="RESULT_CONSUMER_POLL_TIMEOUT"
+    )
+    RESULT_CONSUMER_RETRY_BACKOFF: float = Field(
+        default=1.0, env="RESULT_CONSUMER_RETRY_BACKOFF"
+    )
+    # 아직 인덱싱되지 않은 문서(404)의 결과를 다시 시도하는 최대 시간 (초)
+    RESULT_CONSUMER_NOT_FOUND_WINDOW: float = Field(
+        default=60.0, env="RESULT_CONSUMER_NOT_FOUND_WINDOW"
+    )
 
     # MinIO 설정
     MINIO_ENDPOINT: str = Field(default="minio:9000", env="MINIO_ENDPOINT")
@@ -38,16 +72,122 @@ class Settings(BaseSettings):
     MINIO_PROCESSED_BUCKET: str = Field(
         default="processed-images", env="MINIO_PROCESSED_BUCKET"
     )
+    MINIO_POOL_SIZE: int = Field(default=64, env="MINIO_POOL_SIZE")
+    MINIO_EXECUTOR_WORKERS: int = Field(default=64, env="MINIO_EXECUTOR_WORKERS")
+    MINIO_CONNECT_TIMEOUT: float = Field(default=5.0, env="MINIO_CONNECT_TIMEOUT")
+    MINIO_READ_TIMEOUT: float = Field(default=60.0, env="MINIO_READ_TIMEOUT")
+
+    # 멀티파트 업로드 파트 크기 (S3 최소 5MB)
+    MINIO_UPLOAD_PART_SIZE: int = Field(
+        default=10 * 1024 * 1024, env="MINIO_UPLOAD_PART_SIZE"
+    )
+    MINIO_DOWNLOAD_CHUNK_SIZE: int = Field(
+        default=256 * 1024, env="MINIO_DOWNLOAD_CHUNK_SIZE"
+    )
 
     # Elasticsearch 설정
     ELASTICSEARCH_HOST: str = Field(default="elasticsearch", env="ELASTICSEARCH_HOST")
     ELASTICSEARCH_PORT: int = Field(default=9200, env="ELASTICSEARCH_PORT")
     ELASTICSEARCH_INDEX: str = Field(default="images", env="ELASTICSEARCH_INDEX")
+    ELASTICSEARCH_MAX_CONNECTIONS: int = Field(
+        default=25, env="ELASTICSEARCH_MAX_CONNECTIONS"
+    )
+    ELASTICSEARCH_REQUEST_TIMEOUT: float = Field(
+        default=10.0, env="ELASTICSEARCH_REQUEST_TIMEOUT"
+    )
+    ELASTICSEARCH_BULK_MAX_ACTIONS: int = Field(
+        default=500, env="ELASTICSEARCH_BULK_MAX_ACTIONS"
+    )
+    ELASTICSEARCH_BULK_FLUSH_INTERVAL: float = Field(
+        default=1.0, env="ELASTICSEARCH_BULK_FLUSH_INTERVAL"
+    )
+    ELASTICSEARCH_BULK_MAX_RETRIES: int = Field(
+        default=5, env="ELASTICSEARCH_BULK_MAX_RETRIES"
+    )
+    ELASTICSEARCH_BULK_RETRY_BACKOFF: float = Field(
+        default=0.5, env="ELASTICSEARCH_BULK_RETRY_BACKOFF"
+    )
+    ELASTICSEARCH_REFRESH_INTERVAL: str = Field(
+        default="5s", env="ELASTICSEARCH_REFRESH_INTERVAL"
+    )
+    ELASTICSEARCH_ROLLOVER_MAX_AGE: str = Field(
+        default="30d", env="ELASTICSEARCH_ROLLOVER_MAX_AGE"
+    )
+    ELASTICSEARCH_ROLLOVER_MAX_SHARD_SIZE: str = Field(
+        default="50gb", env="ELASTICSEARCH_ROLLOVER_MAX_SHARD_SIZE"
+    )
+    ELASTICSEARCH_PIT_KEEP_ALIVE: str = Field(
+        default="1m", env="ELASTICSEARCH_PIT_KEEP_ALIVE"
+    )
+    # from/size 페이지네이션 한도 (index.max_result_window)
+    ELASTICSEARCH_MAX_RESULT_WINDOW: int = Field(
+        default=10000, env="ELASTICSEARCH_MAX_RESULT_WINDOW"
+    )
 
     # Redis 설정
     REDIS_HOST: str = Field(default="redis", env="REDIS_HOST")
     REDIS_PORT: int = Field(default=6379, env="REDIS_PORT")
     REDIS_DB: int = Field(default=0, env="REDIS_DB")
+    REDIS_MAX_CONNECTIONS: int = Field(default=50, env="REDIS_MAX_CONNECTIONS")
+    REDIS_POOL_TIMEOUT: float = Field(default=5.0, env="REDIS_POOL_TIMEOUT")
+
+    # 온디맨드 렌더링 설정
+    RENDER_ON_DEMAND: bool = Field(default=True, env="RENDER_ON_DEMAND")
+    RENDER_WORKERS: int = Field(default=os.cpu_count() or 2, env="RENDER_WORKERS")
+    RENDER_QUEUE_SIZE: int = Field(default=16, env="RENDER_QUEUE_SIZE")
+    RENDER_TIMEOUT: float = Field(default=5.0, env="RENDER_TIMEOUT")
+    RENDER_RETRY_AFTER: int = Field(default=2, env="RENDER_RETRY_AFTER")
+    RENDER_MAX_DIMENSION: int = Field(default=4000, env="RENDER_MAX_DIMENSION")
+
+    # 렌디션 프리셋 (이름 → width/height/filter)
+    RENDITION_PRESETS: Dict[str, Dict[str, Any]] = Field(
+        default={
+            "thumbnail": {"width": 150, "height": 150},
+            "medium": {"width": 800},
+            "large": {"width": 1600},
+        },
+        env="RENDITION_PRESETS",
+    )
+    # 업로드 직후 미리 생성할 프리셋
+    EAGER_RENDITION_PRESETS: List[str] = Field(
+        default=["thumbnail", "medium", "large"], env="EAGER_RENDITION_PRESETS"
+    )
+
+    # 유사 이미지 검색 설정
+    PHASH_BANDS: int = Field(default=4, env="PHASH_BANDS")
+    PHASH_MAX_DISTANCE: int = Field(default=3, env="PHASH_MAX_DISTANCE")
+    PHASH_CANDIDATE_LIMIT: int = Field(default=1000, env="PHASH_CANDIDATE_LIMIT")
+
+    # 렌더링 결과 캐시 설정
+    RENDITION_CACHE_MAX_BYTES: int = Field(
+        default=256 * 1024 * 1024, env="RENDITION_CACHE_MAX_BYTES"
+    )
+    RENDITION_CACHE_MAX_ITEM_BYTES: int = Field(
+        default=1024 * 1024, env="RENDITION_CACHE_MAX_ITEM_BYTES"
+    )
+    RENDITION_CACHE_TTL: int = Field(default=3600, env="RENDITION_CACHE_TTL")
+
+    # 메타데이터 캐시 설정
+    METADATA_CACHE_LOCAL_TTL: float = Field(default=5.0, env="METADATA_CACHE_LOCAL_TTL")
+    METADATA_CACHE_TTL: int = Field(default=300, env="METADATA_CACHE_TTL")
+    METADATA_CACHE_MAX_ENTRIES: int = Field(
+        default=10000, env="METADATA_CACHE_MAX_ENTRIES"
+    )
+
+    # 동일 렌더링 요청 병합 설정
+    SINGLEFLIGHT_DISTRIBUTED: bool = Field(default=True, env="SINGLEFLIGHT_DISTRIBUTED")
+    SINGLEFLIGHT_LOCK_TTL: float = Field(default=15.0, env="SINGLEFLIGHT_LOCK_TTL")
+    SINGLEFLIGHT_POLL_INTERVAL: float = Field(
+        default=0.05, env="SINGLEFLIGHT_POLL_INTERVAL"
+    )
+    SINGLEFLIGHT_WAIT_TIMEOUT: float = Field(
+        default=10.0, env="SINGLEFLIGHT_WAIT_TIMEOUT"
+    )
+
+    # 일괄 업로드/처리 설정
+    UPLOAD_BATCH_MAX_FILES: int = Field(default=100, env="UPLOAD_BATCH_MAX_FILES")
+    UPLOAD_BATCH_CONCURRENCY: int = Field(default=8, env="UPLOAD_BATCH_CONCURRENCY")
+    PROCESS_BATCH_MAX_IMAGES: int = Field(default=1000, env="PROCESS_BATCH_MAX_IMAGES")
 
     # Spark 설정
     SPARK_MASTER: str = Field(default="spark://spark-master:7077", env="SPARK_MASTER")
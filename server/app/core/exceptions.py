@@ -41,3 +41,18 @@ class ImageValidationException(HTTPException):
         super().__init__(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail
         )
+
+
+class ServiceUnavailableException(HTTPException):
+    """일시적 과부하 예외"""
+
+    def __init__(
+        self,
+        detail: str = "요청이 많아 잠시 후 다시 시도해주세요",
+        retry_after: int = 1,
+    ):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
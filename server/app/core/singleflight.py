@@ -0,0 +1,115 @@
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from app.core.logging import get_logger
+from app.db.redis.client import RedisClient
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """프로세스 내 요청 병합
+
+    같은 키로 동시에 들어온 호출 중 하나만 실행하고, 나머지는 그 결과를 공유한다.
+    fn은 호출한 요청과 분리된 작업으로 실행되므로 먼저 들어온 요청이 취소되어도
+    나머지 요청은 결과를 받는다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        recheck: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """키 단위로 fn을 한 번만 실행"""
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.create_task(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda task: self._settle(key, task))
+
+        # 호출한 요청이 취소되어도 공유 작업은 계속 실행
+        return await asyncio.shield(call)
+
+    def _settle(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # 대기자가 모두 취소되었을 때의 미확인 예외 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+
+class DistributedSingleFlight(SingleFlight):
+    """Redis 잠금 기반 다중 워커 요청 병합
+
+    프로세스 내에서는 SingleFlight로 병합하고, 워커 간에는 Redis 잠금을 잡은
+    하나의 워커만 fn을 실행한다. 잠금을 얻지 못한 워커는 잠금이 풀릴 때까지
+    기다린 뒤 recheck로 공유 저장소의 결과를 가져온다. 잠금 획득부터 해제까지
+    분리된 공유 작업 안에서 실행되므로 잠금은 실제로 fn을 실행한 작업만 해제한다.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        lock_ttl: float,
+        poll_interval: float,
+        wait_timeout: float,
+        prefix: str = "singleflight",
+    ):
+        super().__init__()
+        self.redis_client = redis_client
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        self.prefix = prefix
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        recheck: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """키 단위로 전체 워커에서 fn을 한 번만 실행"""
+        return await super().do(key, lambda: self._do_distributed(key, fn, recheck))
+
+    async def _do_distributed(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        recheck: Optional[Callable[[], Awaitable[Any]]],
+    ) -> Any:
+        lock_name = f"{self.prefix}:{key}"
+        token = uuid.uuid4().hex
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+
+        while True:
+            acquired = await self.redis_client.acquire_lock(
+                lock_name, token, self.lock_ttl
+            )
+
+            if acquired is None:
+                # Redis 장애 시 병합 없이 실행
+                return await fn()
+
+            if acquired:
+                try:
+                    # 잠금 대기 중 다른 워커가 결과를 만들었는지 확인
+                    if recheck is not None:
+                        result = await recheck()
+                        if result is not None:
+                            return result
+                    return await fn()
+                finally:
+                    await self.redis_client.release_lock(lock_name, token)
+
+            # 잠금이 풀리면 다음 시도에서 recheck로 결과를 가져옴
+            await asyncio.sleep(self.poll_interval)
+
+            if loop.time() >= deadline:
+                logger.warning(f"Single-flight wait timed out for {key}, running")
+                return await fn()
@@ -1,10 +1,25 @@
-from elasticsearch import AsyncElasticsearch
+import asyncio
+import time
+from elasticsearch import AsyncElasticsearch, NotFoundError
 from app.core.config import settings
 from app.core.logging import get_logger
-from typing import Dict, Any, Optional, List
+from app.db.elasticsearch.operations import (
+    IMAGE_INDEX_MAPPINGS,
+    image_ilm_policy,
+    image_index_template,
+    initial_index_name,
+    strip_pit_tiebreaker,
+)
+from typing import Dict, Any, Optional, List, Set, Tuple
 
 logger = get_logger(__name__)
 
+# 별칭 → 실제 인덱스 목록 캐시 유지 시간 (초, 롤오버 주기보다 충분히 짧게)
+ALIAS_CACHE_TTL = 60.0
+
+# bulk 항목 재시도 대상 상태 코드 (거부/과부하)
+BULK_RETRY_STATUSES = {429, 502, 503, 504}
+
 
 class ElasticsearchClient:
     """Elasticsearch 클라이언트"""
@@ -13,8 +28,19 @@ class ElasticsearchClient:
         self.client = AsyncElasticsearch(
             hosts=[
                 f"http://{settings.ELASTICSEARCH_HOST}:{settings.ELASTICSEARCH_PORT}"
-            ]
+            ],
+            connections_per_node=settings.ELASTICSEARCH_MAX_CONNECTIONS,
+            request_timeout=settings.ELASTICSEARCH_REQUEST_TIMEOUT,
         )
+        # 존재가 확인된 인덱스 (매 쓰기마다 exists 요청 방지)
+        self._known_indices: Set[str] = set()
+        # 별칭별 (조회 시각, 실제 인덱스 목록)
+        self._alias_indices: Dict[str, Tuple[float, List[str]]] = {}
+        # 버퍼링된 bulk 작업
+        self._bulk_buffer: List[Dict[str, Any]] = []
+        self._bulk_lock = asyncio.Lock()
+        self._bulk_task: Optional[asyncio.Task] = None
+        self._pending_flushes: Set[asyncio.Task] = set()
         logger.info(
             f"Elasticsearch client initialized with host: {settings.ELASTICSEARCH_HOST}:{settings.ELASTICSEARCH_PORT}"
         )
@@ -23,8 +49,14 @@ class ElasticsearchClient:
         self, index_name: str, mappings: Optional[Dict[str, Any]] = None
     ) -> bool:
         """인덱스 존재 확인 및 생성"""
+        if index_name in self._known_indices:
+            return True
+
         try:
-            if not await self.client.indices.exists(index=index_name):
+            if index_name == settings.ELASTICSEARCH_INDEX:
+                # 이미지 메타데이터는 템플릿/ILM으로 관리되는 롤오버 별칭 사용
+                await self._ensure_rollover_alias(index_name)
+            elif not await self.client.indices.exists(index=index_name):
                 if mappings:
                     # 매핑이 있는 경우 매핑과 함께 인덱스 생성
                     await self.client.indices.create(
@@ -35,8 +67,8 @@ class ElasticsearchClient:
                     await self.client.indices.create(index=index_name)
 
                 logger.info(f"Created Elasticsearch index: {index_name}")
-                return True
 
+            self._known_indices.add(index_name)
             return True
 
         except Exception as e:
@@ -45,6 +77,139 @@ class ElasticsearchClient:
             )
             return False
 
+    async def _ensure_rollover_alias(self, alias: str):
+        """ILM 정책과 인덱스 템플릿 등록 후 최초 인덱스와 쓰기 별칭 생성"""
+        policy_name = f"{alias}-policy"
+
+        await self.client.ilm.put_lifecycle(
+            name=policy_name,
+            policy=image_ilm_policy(
+                max_age=settings.ELASTICSEARCH_ROLLOVER_MAX_AGE,
+                max_primary_shard_size=settings.ELASTICSEARCH_ROLLOVER_MAX_SHARD_SIZE,
+            ),
+        )
+        await self.client.indices.put_index_template(
+            name=alias,
+            priority=100,
+            **image_index_template(
+                alias, policy_name, settings.ELASTICSEARCH_REFRESH_INTERVAL
+            ),
+        )
+
+        if await self.client.indices.exists_alias(name=alias):
+            # 템플릿은 다음 롤오버부터 적용되므로 새 필드는 기존 인덱스에도 추가
+            await self.client.indices.put_mapping(
+                index=alias, properties=IMAGE_INDEX_MAPPINGS["properties"]
+            )
+            return
+
+        if await self.client.indices.exists(index=alias):
+            logger.warning(
+                f"Elasticsearch index {alias} exists as a concrete index; "
+                "it is not managed by the rollover policy"
+            )
+            return
+
+        try:
+            await self.client.indices.create(
+                index=initial_index_name(alias),
+                aliases={alias: {"is_write_index": True}},
+            )
+            logger.info(f"Created Elasticsearch rollover alias: {alias}")
+
+        except Exception:
+            # 다른 프로세스가 먼저 생성한 경우
+            if not await self.client.indices.exists_alias(name=alias):
+                raise
+
+    async def _concrete_indices(
+        self, index_name: str, refresh: bool = False
+    ) -> List[str]:
+        """별칭이 가리키는 실제 인덱스 목록 (최신 인덱스 우선, 짧게 캐시)
+
+        별칭이 아니면 이름 그대로의 인덱스 하나를 반환한다.
+        """
+        now = time.monotonic()
+        cached = self._alias_indices.get(index_name)
+        if cached is not None and not refresh and now - cached[0] < ALIAS_CACHE_TTL:
+            return cached[1]
+
+        try:
+            response = await self.client.indices.get_alias(name=index_name)
+            # 롤오버 인덱스 이름은 날짜/순번 순으로 정렬됨
+            indices = sorted(response.keys(), reverse=True)
+        except NotFoundError:
+            indices = [index_name]
+
+        self._alias_indices[index_name] = (now, indices)
+        return indices
+
+    async def _mget(
+        self, indices: List[str], doc_ids: List[str], source: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """실시간 mget으로 여러 인덱스에서 문서 조회 (찾은 문서만 ID별로 반환)"""
+        response = await self.client.mget(
+            docs=[
+                {"_index": index, "_id": doc_id}
+                for doc_id in doc_ids
+                for index in indices
+            ],
+            source=source,
+        )
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for doc in response["docs"]:
+            if doc.get("found"):
+                found.setdefault(doc["_id"], doc)
+        return found
+
+    async def _locate(
+        self, index_name: str, doc_ids: List[str], source: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """별칭 뒤의 실제 인덱스에서 실시간 조회 (문서 ID별 _index/_source 반환)
+
+        refresh 전 문서도 찾을 수 있도록 검색 대신 mget을 사용한다. 찾지 못한
+        문서가 있으면 롤오버로 인덱스가 바뀌었을 수 있으므로 별칭을 다시 확인한다.
+        별칭 조회 자체가 실패한 경우에만 ids 검색으로 대신한다.
+        """
+        try:
+            indices = await self._concrete_indices(index_name)
+        except Exception as e:
+            logger.warning(f"Failed to resolve alias {index_name}: {str(e)}")
+            response = await self.client.search(
+                index=index_name,
+                query={"ids": {"values": doc_ids}},
+                size=len(doc_ids),
+                source=source,
+            )
+            return {hit["_id"]: hit for hit in response["hits"]["hits"]}
+
+        found = await self._mget(indices, doc_ids, source)
+
+        missing = [doc_id for doc_id in doc_ids if doc_id not in found]
+        if missing:
+            refreshed = await self._concrete_indices(index_name, refresh=True)
+            new_indices = [index for index in refreshed if index not in indices]
+            if new_indices:
+                found.update(await self._mget(new_indices, missing, source))
+
+        return found
+
+    async def resolve_indices(
+        self, index_name: str, doc_ids: List[str]
+    ) -> Dict[str, str]:
+        """별칭 뒤에서 각 문서가 저장된 실제 인덱스 조회 (실시간)"""
+        if not doc_ids:
+            return {}
+
+        try:
+            found = await self._locate(index_name, doc_ids, source=False)
+            return {doc_id: doc["_index"] for doc_id, doc in found.items()}
+
+        except Exception as e:
+            logger.error(f"Failed to resolve indices in {index_name}: {str(e)}")
+            return {}
+
     async def index_document(
         self, index_name: str, document: Dict[str, Any], doc_id: Optional[str] = None
     ) -> bool:
@@ -65,26 +230,38 @@ class ElasticsearchClient:
     async def get_document(
         self, index_name: str, doc_id: str
     ) -> Optional[Dict[str, Any]]:
-        """문서 조회"""
+        """문서 조회 (별칭 뒤의 실제 인덱스에서 실시간 조회)"""
         try:
-            response = await self.client.get(
-                index=index_name,
-                id=doc_id,
-            )
-
-            return response["_source"]
+            found = await self._locate(index_name, [doc_id])
+            return found[doc_id]["_source"] if doc_id in found else None
 
         except Exception as e:
             logger.error(f"Failed to get document from Elasticsearch: {str(e)}")
             return None
 
+    async def get_documents(
+        self, index_name: str, doc_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """여러 문서를 한 번에 조회 (찾은 문서만 ID별로 반환)"""
+        if not doc_ids:
+            return {}
+
+        try:
+            found = await self._locate(index_name, doc_ids)
+            return {doc_id: doc["_source"] for doc_id, doc in found.items()}
+
+        except Exception as e:
+            logger.error(f"Failed to get documents from Elasticsearch: {str(e)}")
+            return {}
+
     async def update_document(
         self, index_name: str, doc_id: str, document: Dict[str, Any]
     ) -> bool:
         """문서 업데이트"""
         try:
+            resolved = await self.resolve_indices(index_name, [doc_id])
             await self.client.update(
-                index=index_name,
+                index=resolved.get(doc_id, index_name),
                 id=doc_id,
                 doc=document,
             )
@@ -103,33 +280,97 @@ class ElasticsearchClient:
         from_: int = 0,
         size: int = 10,
         sort: Optional[List[Dict[str, Any]]] = None,
+        search_after: Optional[List[Any]] = None,
+        pit_id: Optional[str] = None,
+        source_includes: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """문서 검색"""
+        """문서 검색
+
+        search_after가 주어지면 from_ 대신 마지막 정렬 값 이후부터 조회하고,
+        pit_id가 주어지면 해당 point-in-time 스냅샷에서 조회한다.
+        """
         try:
-            body = {"query": query, "from": from_, "size": size}
+            body: Dict[str, Any] = {"query": query, "size": size}
+
+            if search_after is not None:
+                body["search_after"] = search_after
+            else:
+                body["from"] = from_
 
             if sort:
                 body["sort"] = sort
 
-            response = await self.client.search(index=index_name, body=body)
+            if source_includes is not None:
+                body["_source"] = {"includes": source_includes}
+
+            if pit_id:
+                # PIT 검색은 인덱스를 지정하지 않음
+                body["pit"] = {
+                    "id": pit_id,
+                    "keep_alive": settings.ELASTICSEARCH_PIT_KEEP_ALIVE,
+                }
+                response = await self.client.search(body=body)
+            else:
+                response = await self.client.search(index=index_name, body=body)
 
             # 결과 변환
             hits = response["hits"]
             results = {
                 "total": hits["total"],
                 "hits": [hit["_source"] for hit in hits["hits"]],
+                "sort": hits["hits"][-1].get("sort") if hits["hits"] else None,
+                "pit_id": response.get("pit_id"),
             }
 
             return results
 
         except Exception as e:
+            if pit_id:
+                # PIT가 만료된 경우 스냅샷 없이 search_after로 이어서 조회
+                # (PIT 전용 _shard_doc 값은 제거하고 정렬의 동순위 필드로 구분)
+                logger.warning(
+                    f"Point-in-time search failed, retrying without PIT: {str(e)}"
+                )
+                return await self.search_documents(
+                    index_name=index_name,
+                    query=query,
+                    from_=from_,
+                    size=size,
+                    sort=sort,
+                    search_after=strip_pit_tiebreaker(search_after, sort),
+                    source_includes=source_includes,
+                )
+
             logger.error(f"Failed to search documents in Elasticsearch: {str(e)}")
-            return {"total": {"value": 0}, "hits": []}
+            return {"total": {"value": 0}, "hits": [], "sort": None, "pit_id": None}
+
+    async def open_point_in_time(self, index_name: str) -> Optional[str]:
+        """point-in-time 열기"""
+        try:
+            response = await self.client.open_point_in_time(
+                index=index_name, keep_alive=settings.ELASTICSEARCH_PIT_KEEP_ALIVE
+            )
+            return response["id"]
+
+        except Exception as e:
+            logger.error(f"Failed to open point-in-time on {index_name}: {str(e)}")
+            return None
+
+    async def close_point_in_time(self, pit_id: str) -> bool:
+        """point-in-time 닫기"""
+        try:
+            await self.client.close_point_in_time(id=pit_id)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to close point-in-time: {str(e)}")
+            return False
 
     async def delete_document(self, index_name: str, doc_id: str) -> bool:
         """문서 삭제"""
         try:
-            await self.client.delete(index=index_name, id=doc_id)
+            resolved = await self.resolve_indices(index_name, [doc_id])
+            await self.client.delete(index=resolved.get(doc_id, index_name), id=doc_id)
 
             logger.debug(f"Deleted document from {index_name} with ID {doc_id}")
             return True
@@ -138,15 +379,264 @@ class ElasticsearchClient:
             logger.error(f"Failed to delete document from Elasticsearch: {str(e)}")
             return False
 
+    async def bulk(self, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """_bulk API로 여러 작업을 한 번에 실행
+
+        각 작업은 {"op": "index" | "update" | "delete", "index": ..., "id": ...,
+        "doc": ...} 형태이며 (update는 "doc" 대신 "script" 사용 가능, "source"가
+        참이면 결과의 get._source에 갱신 후 문서 포함), 작업별 결과 목록을 반환한다.
+        """
+        if not actions:
+            return []
+
+        operations: List[Dict[str, Any]] = []
+        for action in actions:
+            op = action["op"]
+            meta = {"_index": action["index"], "_id": action.get("id")}
+            if action.get("retry_on_conflict"):
+                meta["retry_on_conflict"] = action["retry_on_conflict"]
+            operations.append({op: meta})
+
+            if op == "index":
+                operations.append(action["doc"])
+            elif op == "update":
+                if "script" in action:
+                    body = {"script": action["script"]}
+                else:
+                    body = {"doc": action["doc"]}
+                if action.get("source"):
+                    body["_source"] = True
+                operations.append(body)
+
+        try:
+            response = await self.client.bulk(operations=operations)
+
+            items = [next(iter(item.values())) for item in response["items"]]
+            if response.get("errors"):
+                failed = [item for item in items if item.get("error")]
+                logger.error(
+                    f"Elasticsearch bulk request had {len(failed)} failed items: "
+                    f"{failed[0].get('error')}"
+                )
+
+            logger.debug(f"Executed {len(actions)} Elasticsearch bulk actions")
+            return items
+
+        except Exception as e:
+            logger.error(f"Failed to execute Elasticsearch bulk request: {str(e)}")
+            return [{"_id": action.get("id"), "error": str(e)} for action in actions]
+
+    async def index_documents(
+        self, index_name: str, documents: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, bool]:
+        """여러 문서를 하나의 bulk 요청으로 즉시 인덱싱 (문서 ID별 성공 여부 반환)"""
+        if not documents:
+            return {}
+
+        await self.ensure_index(index_name)
+
+        items = await self.bulk(
+            [
+                {"op": "index", "index": index_name, "id": doc_id, "doc": document}
+                for doc_id, document in documents.items()
+            ]
+        )
+
+        return {
+            doc_id: not item.get("error")
+            for doc_id, item in zip(documents.keys(), items)
+        }
+
+    async def update_documents(
+        self, index_name: str, updates: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """여러 문서 업데이트를 하나의 bulk 요청으로 즉시 실행 (문서 ID별 결과 반환)
+
+        각 업데이트는 {"doc": ...} 또는 {"script": ...} 형태이며
+        "retry_on_conflict"와 "source"(갱신 후 문서 반환)를 함께 지정할 수 있다.
+        """
+        if not updates:
+            return {}
+
+        actions = await self._resolve_actions(
+            [
+                {"op": "update", "index": index_name, "id": doc_id, **update}
+                for doc_id, update in updates.items()
+            ]
+        )
+        items = await self.bulk(actions)
+
+        return dict(zip(updates.keys(), items))
+
+    def enqueue_index(
+        self, index_name: str, document: Dict[str, Any], doc_id: Optional[str] = None
+    ):
+        """문서 인덱싱을 bulk 버퍼에 추가"""
+        self._enqueue(
+            {"op": "index", "index": index_name, "id": doc_id, "doc": document}
+        )
+
+    def enqueue_update(self, index_name: str, doc_id: str, document: Dict[str, Any]):
+        """문서 업데이트를 bulk 버퍼에 추가"""
+        self._enqueue(
+            {"op": "update", "index": index_name, "id": doc_id, "doc": document}
+        )
+
+    def _enqueue(self, action: Dict[str, Any]):
+        self._bulk_buffer.append(action)
+
+        # 건수 기준 즉시 전송
+        if len(self._bulk_buffer) >= settings.ELASTICSEARCH_BULK_MAX_ACTIONS:
+            task = asyncio.create_task(self.flush())
+            self._pending_flushes.add(task)
+            task.add_done_callback(self._pending_flushes.discard)
+
+    async def flush(self):
+        """버퍼링된 bulk 작업 전송"""
+        async with self._bulk_lock:
+            actions, self._bulk_buffer = self._bulk_buffer, []
+            if not actions:
+                return
+
+            for index_name in {a["index"] for a in actions if a["op"] == "index"}:
+                await self.ensure_index(index_name)
+
+            actions = await self._resolve_actions(actions)
+            items = await self.bulk(actions)
+
+        retries = [
+            action
+            for action, item in zip(actions, items)
+            if self._is_retryable(action, item)
+        ]
+        if retries:
+            self._schedule_retry(retries)
+
+    @staticmethod
+    def _is_retryable(action: Dict[str, Any], item: Dict[str, Any]) -> bool:
+        """일시적인 실패인지 확인 (거부/과부하, 요청 자체 실패)
+
+        update의 404는 재시도 중인 index 작업이 아직 반영되지 않은 경우일 수 있다.
+        """
+        if not item.get("error"):
+            return False
+
+        status = item.get("status")
+        if status is None or status in BULK_RETRY_STATUSES:
+            return True
+        return status == 404 and action["op"] == "update"
+
+    def _schedule_retry(self, actions: List[Dict[str, Any]]):
+        """실패한 작업을 지수 백오프 후 bulk 버퍼에 다시 추가 (최대 재시도 횟수 제한)"""
+        by_attempt: Dict[int, List[Dict[str, Any]]] = {}
+        for action in actions:
+            attempt = action.get("attempt", 0) + 1
+            if attempt > settings.ELASTICSEARCH_BULK_MAX_RETRIES:
+                logger.error(
+                    f"Dropping Elasticsearch bulk {action['op']} for "
+                    f"{action.get('id')} after {attempt - 1} retries"
+                )
+                continue
+            by_attempt.setdefault(attempt, []).append({**action, "attempt": attempt})
+
+        for attempt, retries in by_attempt.items():
+            delay = settings.ELASTICSEARCH_BULK_RETRY_BACKOFF * 2 ** (attempt - 1)
+            task = asyncio.create_task(self._retry_later(retries, delay))
+            self._pending_flushes.add(task)
+            task.add_done_callback(self._pending_flushes.discard)
+
+        logger.warning(f"Retrying {len(actions)} failed Elasticsearch bulk actions")
+
+    async def _retry_later(self, actions: List[Dict[str, Any]], delay: float):
+        await asyncio.sleep(delay)
+        for action in actions:
+            self._enqueue(action)
+
+    async def _resolve_actions(
+        self, actions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """update/delete 작업 대상을 별칭에서 실제 인덱스로 변환
+
+        찾지 못한 문서는 최근 인덱싱된 것으로 보고 별칭(쓰기 인덱스)을 그대로 사용한다.
+        """
+        targets: Dict[str, Set[str]] = {}
+        for action in actions:
+            if action["op"] != "index":
+                targets.setdefault(action["index"], set()).add(action["id"])
+
+        resolved: Dict[str, Dict[str, str]] = {}
+        for index_name, doc_ids in targets.items():
+            resolved[index_name] = await self.resolve_indices(
+                index_name, sorted(doc_ids)
+            )
+
+        return [
+            (
+                {
+                    **action,
+                    "index": resolved[action["index"]].get(
+                        action["id"], action["index"]
+                    ),
+                }
+                if action["op"] != "index"
+                else action
+            )
+            for action in actions
+        ]
+
+    async def _flush_periodically(self, interval: float):
+        """시간 기준 주기적 전송"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush Elasticsearch bulk buffer: {str(e)}")
+
+    def start_bulk_writer(self, interval: Optional[float] = None):
+        """백그라운드 bulk 전송 작업 시작"""
+        if self._bulk_task is None:
+            self._bulk_task = asyncio.create_task(
+                self._flush_periodically(
+                    interval or settings.ELASTICSEARCH_BULK_FLUSH_INTERVAL
+                )
+            )
+
     async def close(self):
-        """클라이언트 연결 종료"""
+        """남은 bulk 작업 전송 후 클라이언트 연결 종료"""
+        if self._bulk_task is not None:
+            self._bulk_task.cancel()
+            self._bulk_task = None
+
+        await self.flush()
+
+        # 재시도 대기 중인 작업까지 전송 (재시도 횟수가 제한되어 있으므로 종료됨)
+        while self._pending_flushes:
+            await asyncio.gather(*self._pending_flushes, return_exceptions=True)
+            await self.flush()
+
         await self.client.close()
 
 
-async def get_elasticsearch_client():
+_elasticsearch_client: Optional[ElasticsearchClient] = None
+
+
+def init_elasticsearch_client() -> ElasticsearchClient:
+    """프로세스 공용 Elasticsearch 클라이언트 생성"""
+    global _elasticsearch_client
+    if _elasticsearch_client is None:
+        _elasticsearch_client = ElasticsearchClient()
+    return _elasticsearch_client
+
+
+async def close_elasticsearch_client():
+    """프로세스 공용 Elasticsearch 클라이언트 종료"""
+    global _elasticsearch_client
+    if _elasticsearch_client is not None:
+        await _elasticsearch_client.close()
+        _elasticsearch_client = None
+
+
+def get_elasticsearch_client() -> ElasticsearchClient:
     """종속성 주입용 함수"""
-    client = ElasticsearchClient()
-    try:
-        yield client
-    finally:
-        await client.close()
+    return init_elasticsearch_client()
@@ -0,0 +1,116 @@
+import base64
+import json
+from typing import Any, Dict, List, Optional
+
+
+def encode_cursor(search_after: List[Any], pit_id: Optional[str] = None) -> str:
+    """search_after 값과 PIT ID를 불투명한 커서 문자열로 인코딩"""
+    payload: Dict[str, Any] = {"after": search_after}
+    if pit_id:
+        payload["pit"] = pit_id
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """커서 문자열 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("after"), list):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+
+    return payload
+
+
+def strip_pit_tiebreaker(
+    search_after: Optional[List[Any]], sort: Optional[List[Dict[str, Any]]]
+) -> Optional[List[Any]]:
+    """PIT 검색의 암묵적 _shard_doc 정렬 값을 제거
+
+    PIT 없이 같은 정렬로 이어서 조회할 때 정렬 필드 수와 값의 수를 맞춘다.
+    """
+    if search_after is None or not sort or len(search_after) <= len(sort):
+        return search_after
+    return search_after[: len(sort)]
+
+
+# 이미지 메타데이터 매핑 (정의되지 않은 필드는 _source에만 저장)
+IMAGE_INDEX_MAPPINGS: Dict[str, Any] = {
+    "dynamic": False,
+    "properties": {
+        "image_id": {"type": "keyword"},
+        "filename": {"type": "keyword", "ignore_above": 512},
+        "content_type": {"type": "keyword"},
+        "size": {"type": "integer"},
+        "object_name": {"type": "keyword", "index": False},
+        "content_hash": {"type": "keyword"},
+        "content_id": {"type": "keyword"},
+        # 지각 해시 (phash_bands 구간 일치로 유사 이미지 후보 검색)
+        "phash": {"type": "keyword", "index": False},
+        "dhash": {"type": "keyword", "index": False},
+        "phash_bands": {"type": "keyword"},
+        "status": {"type": "keyword"},
+        # 정렬 전용 필드 (doc_values만 유지)
+        "upload_time": {"type": "long", "index": False},
+        "processing_requested": {"type": "long", "index": False},
+        "processing_completed": {"type": "long", "index": False},
+        # 조회용으로만 보관
+        "processing_params": {"type": "object", "enabled": False},
+        "processed_objects": {"type": "keyword", "index": False},
+        "error": {"type": "keyword", "index": False, "doc_values": False},
+    },
+}
+
+
+def image_index_pattern(alias: str) -> str:
+    """롤오버 인덱스 이름 패턴"""
+    return f"{alias}-*"
+
+
+def initial_index_name(alias: str) -> str:
+    """최초 인덱스 이름 (월 단위 날짜 수식)"""
+    return f"<{alias}-{{now/M{{yyyy.MM}}}}-000001>"
+
+
+def image_ilm_policy(max_age: str, max_primary_shard_size: str) -> Dict[str, Any]:
+    """월 단위 롤오버 ILM 정책"""
+    return {
+        "phases": {
+            "hot": {
+                "actions": {
+                    "rollover": {
+                        "max_age": max_age,
+                        "max_primary_shard_size": max_primary_shard_size,
+                    }
+                }
+            }
+        }
+    }
+
+
+def image_index_template(
+    alias: str, policy_name: str, refresh_interval: str
+) -> Dict[str, Any]:
+    """이미지 메타데이터 인덱스 템플릿"""
+    return {
+        "index_patterns": [image_index_pattern(alias)],
+        "template": {
+            "settings": {
+                "index": {
+                    "refresh_interval": refresh_interval,
+                    "lifecycle": {"name": policy_name, "rollover_alias": alias},
+                    # 목록 조회 정렬 순서로 세그먼트를 정렬해 조기 종료 가능하도록
+                    "sort": {
+                        "field": ["upload_time", "image_id"],
+                        "order": ["desc", "asc"],
+                    },
+                }
+            },
+            "mappings": IMAGE_INDEX_MAPPINGS,
+        },
+    }
@@ -5,17 +5,37 @@ from typing import Any, Optional, Union, List, Dict
 
 logger = get_logger(__name__)
 
+# 토큰이 일치할 때만 잠금 해제 (다른 소유자의 잠금을 지우지 않도록)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisClient:
     """Redis 클라이언트"""
 
     def __init__(self):
-        self.client = redis.Redis(
+        self.pool = redis.BlockingConnectionPool(
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             db=settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
             decode_responses=True,  # 문자열 응답 자동 디코딩
         )
+        self.client = redis.Redis(connection_pool=self.pool)
+        # 이미지 등 바이너리 값 전용 (응답 디코딩 없음)
+        self.binary_pool = redis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+        )
+        self.binary_client = redis.Redis(connection_pool=self.binary_pool)
         logger.info(
             f"Redis client initialized with host: {settings.REDIS_HOST}:{settings.REDIS_PORT}"
         )
@@ -56,6 +76,20 @@ class RedisClient:
             logger.error(f"Failed to delete Redis key {key}: {str(e)}")
             return False
 
+    async def delete_many(self, keys: List[str]) -> bool:
+        """여러 키를 한 번에 삭제"""
+        if not keys:
+            return True
+
+        try:
+            await self.client.delete(*keys)
+            logger.debug(f"Deleted {len(keys)} Redis keys")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete Redis keys: {str(e)}")
+            return False
+
     async def hset(self, name: str, key: str, value: str) -> bool:
         """해시 필드 설정"""
         try:
@@ -77,6 +111,24 @@ class RedisClient:
             logger.error(f"Failed to get Redis hash field {name}[{key}]: {str(e)}")
             return None
 
+    async def hset_mapping(
+        self, name: str, mapping: Dict[str, str], expire: Optional[int] = None
+    ) -> bool:
+        """해시 필드 일괄 설정"""
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hset(name, mapping=mapping)
+                if expire:
+                    pipe.expire(name, expire)
+                await pipe.execute()
+
+            logger.debug(f"Set Redis hash fields: {name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to set Redis hash fields {name}: {str(e)}")
+            return False
+
     async def hgetall(self, name: str) -> Dict[str, str]:
         """해시 모든 필드 조회"""
         try:
@@ -87,15 +139,106 @@ class RedisClient:
             logger.error(f"Failed to get all Redis hash fields {name}: {str(e)}")
             return {}
 
+    async def hgetall_many(self, names: List[str]) -> List[Dict[str, str]]:
+        """여러 해시의 모든 필드를 파이프라인으로 조회"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.hgetall(name)
+                return await pipe.execute()
+
+        except Exception as e:
+            logger.error(f"Failed to get Redis hashes: {str(e)}")
+            return [{} for _ in names]
+
+    async def hset_binary(
+        self,
+        name: str,
+        mapping: Dict[str, Union[bytes, str]],
+        expire: Optional[int] = None,
+    ) -> bool:
+        """바이너리 해시 필드 일괄 설정"""
+        try:
+            async with self.binary_client.pipeline(transaction=True) as pipe:
+                pipe.hset(name, mapping=mapping)
+                if expire:
+                    pipe.expire(name, expire)
+                await pipe.execute()
+
+            logger.debug(f"Set Redis binary hash: {name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to set Redis binary hash {name}: {str(e)}")
+            return False
+
+    async def hgetall_binary(self, name: str) -> Dict[bytes, bytes]:
+        """바이너리 해시 모든 필드 조회"""
+        try:
+            return await self.binary_client.hgetall(name)
+
+        except Exception as e:
+            logger.error(f"Failed to get Redis binary hash {name}: {str(e)}")
+            return {}
+
+    async def acquire_lock(self, name: str, token: str, ttl: float) -> Optional[bool]:
+        """분산 잠금 획득 (Redis 오류 시 None)"""
+        try:
+            acquired = await self.client.set(name, token, nx=True, px=int(ttl * 1000))
+            return bool(acquired)
+
+        except Exception as e:
+            logger.error(f"Failed to acquire Redis lock {name}: {str(e)}")
+            return None
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """분산 잠금 해제"""
+        try:
+            released = await self.client.eval(RELEASE_LOCK_SCRIPT, 1, name, token)
+            return bool(released)
+
+        except Exception as e:
+            logger.error(f"Failed to release Redis lock {name}: {str(e)}")
+            return False
+
+    async def run_script(
+        self, script: str, keys: List[str], args: List[Any]
+    ) -> Optional[Any]:
+        """Lua 스크립트 원자적 실행 (Redis 오류 시 None)"""
+        try:
+            return await self.client.eval(script, len(keys), *keys, *args)
+
+        except Exception as e:
+            logger.error(f"Failed to run Redis script on {keys}: {str(e)}")
+            return None
+
     async def close(self):
         """클라이언트 연결 종료"""
-        await self.client.close()
+        await self.client.aclose()
+        await self.binary_client.aclose()
+        await self.pool.disconnect()
+        await self.binary_pool.disconnect()
+
+
+_redis_client: Optional[RedisClient] = None
+
+
+def init_redis_client() -> RedisClient:
+    """프로세스 공용 Redis 클라이언트 생성"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = RedisClient()
+    return _redis_client
+
+
+async def close_redis_client():
+    """프로세스 공용 Redis 클라이언트 종료"""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
 
 
-async def get_redis_client():
+def get_redis_client() -> RedisClient:
     """종속성 주입용 함수"""
-    client = RedisClient()
-    try:
-        yield client
-    finally:
-        await client.close()
+    return init_redis_client()
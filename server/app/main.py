@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -13,9 +14,48 @@ from app.core.exceptions import (
     KafkaException,
 )
 from app.core.logging import get_logger
+from app.db.elasticsearch.client import (
+    init_elasticsearch_client,
+    close_elasticsearch_client,
+)
+from app.db.redis.client import init_redis_client, close_redis_client
+from app.services.kafka.producer import init_kafka_producer, close_kafka_producer
+from app.services.kafka.result_consumer import (
+    init_result_consumer,
+    close_result_consumer,
+)
+from app.services.image.rendition import (
+    init_rendition_renderer,
+    close_rendition_renderer,
+)
+from app.services.storage.minio import init_async_minio_client, close_minio_client
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """프로세스 공용 클라이언트 생성 및 종료"""
+    init_async_minio_client()
+    init_kafka_producer()
+    init_elasticsearch_client().start_bulk_writer()
+    init_redis_client()
+    init_rendition_renderer()
+    if settings.RESULT_CONSUMER_ENABLED:
+        init_result_consumer()
+    logger.info("Shared service clients initialized")
+
+    yield
+
+    await close_result_consumer()
+    close_rendition_renderer()
+    close_kafka_producer()
+    await close_elasticsearch_client()
+    await close_redis_client()
+    close_minio_client()
+    logger.info("Shared service clients closed")
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="이미지 크기 조정 및 필터링 API",
@@ -23,6 +63,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_prefix="/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -33,3 +74,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+app.include_router(health.router, tags=["health"])
+app.include_router(
+    images.router, prefix=f"{settings.API_V1_STR}/images", tags=["images"]
+)
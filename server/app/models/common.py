@@ -9,6 +9,12 @@ class HealthResponse(BaseModel):
     services: Dict[str, str]
 
 
+class CacheStatsResponse(BaseModel):
+    """캐시 통계 응답 모델"""
+
+    caches: Dict[str, Dict[str, int]]
+
+
 class PaginatedResponse(BaseModel):
     """페이지네이션 응답 기본 모델"""
 
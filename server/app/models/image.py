@@ -20,6 +20,24 @@ class ProcessingRequest(BaseModel):
     filter: Optional[str] = None
 
 
+class RenditionSpec(BaseModel):
+    """생성할 렌디션 파라미터"""
+
+    width: Optional[int] = None
+    height: Optional[int] = None
+    filter: Optional[str] = None
+    format: Optional[str] = None
+    quality: Optional[int] = None
+
+
+class BatchProcessingRequest(BaseModel):
+    """여러 이미지에 여러 렌디션을 한 번에 요청하는 모델"""
+
+    image_ids: List[str]
+    renditions: List[RenditionSpec] = []
+    presets: List[str] = []
+
+
 class ImageUploadResponse(BaseModel):
     """이미지 업로드 응답 모델"""
 
@@ -28,9 +46,30 @@ class ImageUploadResponse(BaseModel):
     size: int
     content_type: str
     status: str
+    processed_objects: Optional[List[str]] = None
     message: Optional[str] = None
 
 
+class BatchUploadResult(BaseModel):
+    """일괄 업로드 파일별 결과 모델"""
+
+    filename: str
+    status: str
+    image_id: Optional[str] = None
+    size: Optional[int] = None
+    content_type: Optional[str] = None
+    message: Optional[str] = None
+
+
+class BatchUploadResponse(BaseModel):
+    """일괄 업로드 응답 모델"""
+
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BatchUploadResult]
+
+
 class ImageMetadata(BaseModel):
     """이미지 메타데이터 모델"""
 
@@ -39,6 +78,10 @@ class ImageMetadata(BaseModel):
     content_type: str
     size: int
     object_name: str
+    content_hash: Optional[str] = None
+    content_id: Optional[str] = None
+    phash: Optional[str] = None
+    dhash: Optional[str] = None
     upload_time: int
     status: str
     processing_requested: Optional[int] = None
@@ -56,7 +99,37 @@ class ProcessingResult(BaseModel):
     message: str
 
 
+class BatchProcessingResult(BaseModel):
+    """일괄 처리 요청 결과 모델"""
+
+    status: str
+    accepted: List[str]
+    not_found: List[str]
+    failed: List[str]
+    renditions: List[str]
+    message: str
+
+
+class SimilarImage(BaseModel):
+    """유사 이미지 항목 모델"""
+
+    image_id: str
+    distance: int
+    filename: Optional[str] = None
+    content_id: Optional[str] = None
+
+
+class SimilarImagesResponse(BaseModel):
+    """유사 이미지 검색 응답 모델"""
+
+    image_id: str
+    phash: str
+    max_distance: int
+    matches: List[SimilarImage]
+
+
 class ImageListResponse(PaginatedResponse):
     """이미지 목록 응답 모델"""
 
     images: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,173 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.redis.client import RedisClient, init_redis_client
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """항목 수와 만료 시간으로 제한되는 프로세스 내 캐시"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """만료되지 않은 항목 조회"""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any):
+        """항목 저장 (항목 수 초과 시 가장 오래된 항목 제거)"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        """항목 삭제"""
+        self._entries.pop(key, None)
+
+
+class MetadataCache:
+    """이미지 메타데이터 읽기 캐시 (짧은 TTL 로컬 캐시 + Redis 해시)"""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        local: TTLCache,
+        ttl: int,
+        prefix: str = "image-metadata",
+    ):
+        self.redis_client = redis_client
+        self.local = local
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def _redis_key(self, image_id: str) -> str:
+        return f"{self.prefix}:{image_id}"
+
+    async def get(
+        self,
+        image_id: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """로컬 → Redis → loader(Elasticsearch) 순으로 조회"""
+        metadata = self.local.get(image_id)
+        if metadata is not None:
+            self.hits += 1
+            return metadata
+
+        fields = await self.redis_client.hgetall(self._redis_key(image_id))
+        if fields:
+            self.hits += 1
+            metadata = {name: json.loads(value) for name, value in fields.items()}
+            self.local.set(image_id, metadata)
+            return metadata
+
+        self.misses += 1
+        metadata = await loader()
+        if metadata:
+            await self.set(image_id, metadata)
+
+        return metadata
+
+    async def get_many(
+        self,
+        image_ids: List[str],
+        loader: Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """여러 이미지 메타데이터 조회 (미스만 모아 loader 한 번 호출)"""
+        found: Dict[str, Dict[str, Any]] = {}
+        remote_ids = []
+        for image_id in image_ids:
+            metadata = self.local.get(image_id)
+            if metadata is not None:
+                found[image_id] = metadata
+            else:
+                remote_ids.append(image_id)
+
+        missing = []
+        if remote_ids:
+            values = await self.redis_client.hgetall_many(
+                [self._redis_key(image_id) for image_id in remote_ids]
+            )
+            for image_id, fields in zip(remote_ids, values):
+                if fields:
+                    metadata = {name: json.loads(v) for name, v in fields.items()}
+                    self.local.set(image_id, metadata)
+                    found[image_id] = metadata
+                else:
+                    missing.append(image_id)
+
+        self.hits += len(image_ids) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            loaded = await loader(missing)
+            for image_id, metadata in loaded.items():
+                await self.set(image_id, metadata)
+            found.update(loaded)
+
+        return found
+
+    async def set(self, image_id: str, metadata: Dict[str, Any]):
+        """두 계층 모두에 저장"""
+        self.local.set(image_id, metadata)
+        await self.redis_client.hset_mapping(
+            self._redis_key(image_id),
+            {name: json.dumps(value) for name, value in metadata.items()},
+            expire=self.ttl,
+        )
+
+    async def invalidate(self, image_id: str):
+        """두 계층 모두에서 삭제"""
+        self.local.delete(image_id)
+        await self.redis_client.delete(self._redis_key(image_id))
+
+    async def invalidate_many(self, image_ids: List[str]):
+        """여러 항목을 두 계층 모두에서 삭제 (Redis는 한 번의 요청)"""
+        for image_id in image_ids:
+            self.local.delete(image_id)
+        await self.redis_client.delete_many(
+            [self._redis_key(image_id) for image_id in image_ids]
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_metadata_cache: Optional[MetadataCache] = None
+
+
+def get_metadata_cache() -> MetadataCache:
+    """프로세스 공용 메타데이터 캐시"""
+    global _metadata_cache
+    if _metadata_cache is None:
+        _metadata_cache = MetadataCache(
+            init_redis_client(),
+            TTLCache(
+                ttl=settings.METADATA_CACHE_LOCAL_TTL,
+                max_entries=settings.METADATA_CACHE_MAX_ENTRIES,
+            ),
+            ttl=settings.METADATA_CACHE_TTL,
+        )
+    return _metadata_cache
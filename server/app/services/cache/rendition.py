@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.redis.client import RedisClient, init_redis_client
+
+logger = get_logger(__name__)
+
+
+class CachedRendition(NamedTuple):
+    """캐시된 렌더링 결과"""
+
+    data: bytes
+    content_type: str
+    etag: str
+
+
+class LRUByteCache:
+    """전체 바이트 크기로 제한되는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_bytes: int, max_item_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CachedRendition]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedRendition]:
+        """항목 조회 (조회된 항목은 최근 사용으로 이동)"""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, entry: CachedRendition) -> bool:
+        """항목 저장 (크기 한도를 넘는 항목은 저장하지 않음)"""
+        size = len(entry.data)
+        if size > self.max_item_bytes:
+            return False
+
+        self.delete(key)
+        self._entries[key] = entry
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted.data)
+            self.evictions += 1
+
+        return True
+
+    def delete(self, key: str):
+        """항목 삭제"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= len(entry.data)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class TieredRenditionCache:
+    """프로세스 내 LRU + Redis 2단계 렌더링 결과 캐시"""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        local: LRUByteCache,
+        ttl: int,
+        prefix: str = "rendition",
+    ):
+        self.redis_client = redis_client
+        self.local = local
+        self.ttl = ttl
+        self.prefix = prefix
+        self.redis_hits = 0
+        self.redis_misses = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[CachedRendition]:
+        """로컬 → Redis 순으로 조회 (Redis 적중 시 로컬 캐시 채움)"""
+        entry = self.local.get(key)
+        if entry is not None:
+            return entry
+
+        values = await self.redis_client.hgetall_binary(self._redis_key(key))
+        if not values or b"data" not in values:
+            self.redis_misses += 1
+            return None
+
+        self.redis_hits += 1
+        entry = CachedRendition(
+            data=values[b"data"],
+            content_type=values.get(b"content_type", b"image/jpeg").decode(),
+            etag=values.get(b"etag", b"").decode(),
+        )
+        self.local.set(key, entry)
+        return entry
+
+    async def set(self, key: str, entry: CachedRendition) -> bool:
+        """두 계층 모두에 저장"""
+        if len(entry.data) > self.local.max_item_bytes:
+            return False
+
+        self.local.set(key, entry)
+        return await self.redis_client.hset_binary(
+            self._redis_key(key),
+            {
+                "data": entry.data,
+                "content_type": entry.content_type,
+                "etag": entry.etag,
+            },
+            expire=self.ttl,
+        )
+
+    async def delete(self, key: str):
+        """두 계층 모두에서 삭제"""
+        self.local.delete(key)
+        await self.redis_client.delete(self._redis_key(key))
+
+    def stats(self) -> Dict[str, int]:
+        """계층별 캐시 통계"""
+        return {
+            **{f"local_{name}": value for name, value in self.local.stats().items()},
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+        }
+
+
+_rendition_cache: Optional[TieredRenditionCache] = None
+
+
+def get_rendition_cache() -> TieredRenditionCache:
+    """프로세스 공용 렌더링 결과 캐시"""
+    global _rendition_cache
+    if _rendition_cache is None:
+        _rendition_cache = TieredRenditionCache(
+            init_redis_client(),
+            LRUByteCache(
+                max_bytes=settings.RENDITION_CACHE_MAX_BYTES,
+                max_item_bytes=settings.RENDITION_CACHE_MAX_ITEM_BYTES,
+            ),
+            ttl=settings.RENDITION_CACHE_TTL,
+        )
+    return _rendition_cache
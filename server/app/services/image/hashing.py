@@ -0,0 +1,61 @@
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# 해시 비트 수 (8x8)
+HASH_SIZE = 8
+# pHash 계산용 DCT 입력 크기
+PHASH_DCT_SIZE = 32
+
+
+def _to_hex(bits: np.ndarray) -> str:
+    """불리언 비트 배열을 16진수 문자열로 변환"""
+    return np.packbits(bits.astype(np.uint8).ravel()).tobytes().hex()
+
+
+def dhash(gray: np.ndarray, hash_size: int = HASH_SIZE) -> str:
+    """차이 해시: 가로로 인접한 픽셀 밝기 비교"""
+    resized = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    return _to_hex(resized[:, 1:] > resized[:, :-1])
+
+
+def phash(gray: np.ndarray, hash_size: int = HASH_SIZE) -> str:
+    """지각 해시: 저주파 DCT 계수를 중앙값과 비교"""
+    resized = cv2.resize(
+        gray, (PHASH_DCT_SIZE, PHASH_DCT_SIZE), interpolation=cv2.INTER_AREA
+    )
+    low = cv2.dct(resized.astype(np.float32))[:hash_size, :hash_size]
+    # DC 성분은 전체 밝기이므로 중앙값 계산에서 제외
+    median = np.median(low.ravel()[1:])
+    return _to_hex(low > median)
+
+
+def compute_image_hashes(image_data: bytes) -> Optional[Dict[str, str]]:
+    """워커 프로세스에서 실행되는 해시 계산 함수
+
+    해시는 32x32 이하로 축소해 계산하므로 1/8 축소 디코딩으로 충분하다.
+    """
+    buffer = np.frombuffer(image_data, np.uint8)
+    gray = cv2.imdecode(buffer, cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    if gray is None or min(gray.shape) < PHASH_DCT_SIZE:
+        gray = cv2.imdecode(buffer, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None
+
+    return {"phash": phash(gray), "dhash": dhash(gray)}
+
+
+def hash_bands(hex_hash: str, bands: int) -> List[str]:
+    """다중 인덱스 해싱용 밴드 분할
+
+    해시를 bands개 구간으로 나누면, 해밍 거리가 bands 미만인 두 해시는
+    적어도 한 구간이 정확히 일치하므로 구간 일치 검색으로 후보를 찾을 수 있다.
+    """
+    width = len(hex_hash) // bands
+    return [f"{i}:{hex_hash[i * width : (i + 1) * width]}" for i in range(bands)]
+
+
+def hamming_distance(a: str, b: str) -> int:
+    """16진수 해시 간 해밍 거리"""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
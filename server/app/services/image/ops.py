@@ -0,0 +1,355 @@
+import io
+from typing import Any, Dict, List, Optional, Tuple
+import cv2
+import numpy as np
+from PIL import Image
+
+# 서버 온디맨드 렌더링과 Spark 작업이 함께 사용하는 이미지 연산
+# (결과가 바이트 단위로 같도록 이 모듈은 app 내 다른 모듈에 의존하지 않음)
+
+# 세피아 필터 행렬
+SEPIA_KERNEL = np.array(
+    [
+        [0.272, 0.534, 0.131],
+        [0.349, 0.686, 0.168],
+        [0.393, 0.769, 0.189],
+    ]
+)
+
+# 파이프라인에서 지원하는 필터 연산
+FILTER_OPERATIONS = {"grayscale", "blur", "edge", "sepia"}
+
+# JPEG DCT 스케일링 축소 디코딩 플래그 (큰 배율 우선)
+REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+EXIF_ORIENTATION_TAG = 0x0112
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+# 출력 형식 (확장자, MIME 타입, 기본 품질)
+OUTPUT_FORMATS: Dict[str, Dict[str, Any]] = {
+    "jpeg": {"extension": "jpg", "content_type": "image/jpeg", "quality": 85},
+    "webp": {"extension": "webp", "content_type": "image/webp", "quality": 80},
+    "avif": {"extension": "avif", "content_type": "image/avif", "quality": 60},
+    "png": {"extension": "png", "content_type": "image/png", "quality": None},
+}
+DEFAULT_OUTPUT_FORMAT = "jpeg"
+# 알파 채널(투명도)을 유지하는 출력 형식
+ALPHA_OUTPUT_FORMATS = {"png", "webp"}
+
+# JPEG 크로마 서브샘플링 (OpenCV 4.5.5 이상)
+JPEG_SUBSAMPLING = {
+    name: getattr(cv2, f"IMWRITE_JPEG_SAMPLING_FACTOR_{name}")
+    for name in ("420", "422", "444")
+    if hasattr(cv2, f"IMWRITE_JPEG_SAMPLING_FACTOR_{name}")
+}
+
+
+def available_output_formats() -> List[str]:
+    """현재 OpenCV 빌드에서 인코딩 가능한 출력 형식"""
+    formats = []
+    for name, spec in OUTPUT_FORMATS.items():
+        if name == "avif" and not hasattr(cv2, "IMWRITE_AVIF_QUALITY"):
+            continue
+        if cv2.haveImageWriter(f".{spec['extension']}"):
+            formats.append(name)
+    return formats
+
+
+def build_output(
+    image_format: Optional[str] = None,
+    quality: Optional[int] = None,
+    progressive: bool = False,
+    subsampling: Optional[str] = None,
+) -> Dict[str, Any]:
+    """출력 형식 파라미터 검증 및 정규화 (잘못된 값이면 ValueError)"""
+    image_format = (image_format or DEFAULT_OUTPUT_FORMAT).lower()
+    if image_format == "jpg":
+        image_format = "jpeg"
+
+    if image_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원되지 않는 출력 형식입니다: {image_format}")
+
+    if quality is not None:
+        if OUTPUT_FORMATS[image_format]["quality"] is None:
+            raise ValueError(f"{image_format} 형식은 품질을 지정할 수 없습니다")
+        if not 1 <= quality <= 100:
+            raise ValueError("품질은 1~100 사이여야 합니다")
+
+    if (progressive or subsampling) and image_format != "jpeg":
+        raise ValueError("progressive/subsampling은 JPEG에서만 지정할 수 있습니다")
+
+    if subsampling is not None and subsampling not in JPEG_SUBSAMPLING:
+        raise ValueError(f"지원되지 않는 서브샘플링입니다: {subsampling}")
+
+    return {
+        "format": image_format,
+        "quality": quality or OUTPUT_FORMATS[image_format]["quality"],
+        "progressive": progressive,
+        "subsampling": subsampling,
+    }
+
+
+def build_operations(
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    filter_type: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """크기 조정/필터 파라미터를 파이프라인 연산 목록으로 변환"""
+    operations: List[Dict[str, Any]] = []
+
+    if width or height:
+        operations.append({"op": "resize", "width": width, "height": height})
+
+    if filter_type and filter_type in FILTER_OPERATIONS:
+        operations.append({"op": filter_type})
+
+    return operations
+
+
+def build_rendition_key(
+    image_id: str,
+    filter_type: Optional[str] = None,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    output: Optional[Dict[str, Any]] = None,
+) -> str:
+    """처리된 이미지 객체 이름 생성
+
+    기본 출력(기본 품질 JPEG)은 기존 키를 유지하고, 그 외에는 품질과 옵션을
+    이름에 포함해 형식별로 다른 객체로 저장한다.
+    """
+    filter_name = filter_type or "original"
+    width_str = str(width) if width else "orig"
+    height_str = str(height) if height else "orig"
+    output = output or build_output()
+
+    options = ""
+    if output != build_output():
+        options = f"_q{output['quality']}" if output["quality"] else ""
+        if output["progressive"]:
+            options += "_p"
+        if output["subsampling"]:
+            options += f"_s{output['subsampling']}"
+
+    extension = OUTPUT_FORMATS[output["format"]]["extension"]
+    return f"{image_id}/{filter_name}_{width_str}x{height_str}{options}.{extension}"
+
+
+def target_size(
+    src_width: int,
+    src_height: int,
+    width: Optional[int],
+    height: Optional[int],
+) -> Tuple[int, int]:
+    """목표 크기 계산 (한쪽만 지정된 경우 비율 유지)"""
+    if width and height:
+        return int(width), int(height)
+    if width:
+        return int(width), max(1, round(src_height * int(width) / src_width))
+    if height:
+        return max(1, round(src_width * int(height) / src_height)), int(height)
+
+    return src_width, src_height
+
+
+def source_size(image_data: bytes) -> Optional[Tuple[int, int]]:
+    """헤더만 읽어 EXIF 회전이 반영된 원본 크기 반환 (픽셀 디코딩 없음)"""
+    try:
+        with Image.open(io.BytesIO(image_data)) as header:
+            src_width, src_height = header.size
+            orientation = header.getexif().get(EXIF_ORIENTATION_TAG, 1)
+    except Exception:
+        return None
+
+    # imdecode는 EXIF 회전을 적용하므로 90도 회전된 이미지는 가로/세로 교환
+    if orientation in ROTATED_ORIENTATIONS:
+        return src_height, src_width
+    return src_width, src_height
+
+
+def decode_flag(
+    image_data: bytes,
+    operations: List[Dict[str, Any]],
+    size: Optional[Tuple[int, int]] = None,
+    output: Optional[Dict[str, Any]] = None,
+) -> int:
+    """연산 목록과 출력 형식에 맞는 디코딩 플래그 선택
+
+    JPEG가 아닌 원본은 출력 형식이 투명도를 지원하면 알파 채널까지 디코딩한다.
+    첫 연산이 크기 조정인 JPEG는 목표 크기보다 큰 최소 2의 거듭제곱 배율로
+    축소 디코딩한다.
+    """
+    if image_data[:2] != b"\xff\xd8":
+        if (output or build_output())["format"] in ALPHA_OUTPUT_FORMATS:
+            return cv2.IMREAD_UNCHANGED
+        return cv2.IMREAD_COLOR
+    if not operations or operations[0].get("op") != "resize":
+        return cv2.IMREAD_COLOR
+
+    size = size or source_size(image_data)
+    if size is None:
+        return cv2.IMREAD_COLOR
+
+    src_width, src_height = size
+    target_width, target_height = target_size(
+        src_width, src_height, operations[0].get("width"), operations[0].get("height")
+    )
+
+    for factor, flag in REDUCED_DECODE_FLAGS:
+        # libjpeg은 축소 크기를 올림 처리
+        if (
+            -(-src_width // factor) >= target_width
+            and -(-src_height // factor) >= target_height
+        ):
+            return flag
+
+    return cv2.IMREAD_COLOR
+
+
+def decode_image(image_data: bytes, flag: int = cv2.IMREAD_COLOR) -> np.ndarray:
+    """바이트 배열을 CV2 이미지로 디코딩"""
+    img = cv2.imdecode(np.frombuffer(image_data, np.uint8), flag)
+
+    if img is None:
+        raise ValueError("이미지를 디코딩할 수 없습니다")
+
+    # IMREAD_UNCHANGED는 16비트 PNG를 그대로 읽으므로 8비트로 변환
+    if img.dtype == np.uint16:
+        img = cv2.convertScaleAbs(img, alpha=1 / 257)
+
+    return img
+
+
+def has_alpha(img: np.ndarray) -> bool:
+    """알파 채널이 있는 BGRA 이미지인지 여부"""
+    return img.ndim == 3 and img.shape[2] == 4
+
+
+def apply_filter(img: np.ndarray, filter_type: str) -> np.ndarray:
+    """디코딩된 이미지에 필터 적용 (알파 채널은 그대로 유지)"""
+    if has_alpha(img):
+        filtered = apply_filter(img[:, :, :3], filter_type)
+        if filtered.ndim == 2:
+            filtered = cv2.cvtColor(filtered, cv2.COLOR_GRAY2BGR)
+        return np.dstack([filtered, img[:, :, 3]])
+
+    if filter_type == "grayscale":
+        if img.ndim == 2:
+            return img
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+    if filter_type == "blur":
+        return cv2.GaussianBlur(img, (15, 15), 0)
+
+    if filter_type == "edge":
+        return cv2.Canny(img, 100, 200)
+
+    if filter_type == "sepia":
+        # 흑백 이미지는 3채널로 확장 후 세피아 적용
+        if img.ndim == 2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        return cv2.transform(img, SEPIA_KERNEL)
+
+    raise ValueError(f"지원되지 않는 연산입니다: {filter_type}")
+
+
+def apply_operation(img: np.ndarray, operation: Dict[str, Any]) -> np.ndarray:
+    """메모리 상의 이미지에 단일 연산 적용"""
+    if operation.get("op") == "resize":
+        src_height, src_width = img.shape[:2]
+        size = target_size(
+            src_width, src_height, operation.get("width"), operation.get("height")
+        )
+        if size == (src_width, src_height):
+            return img
+        return cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+
+    return apply_filter(img, operation.get("op"))
+
+
+def encode_image(img: np.ndarray, output: Optional[Dict[str, Any]] = None) -> bytes:
+    """CV2 이미지를 출력 형식에 맞게 인코딩 (기본값: JPEG)"""
+    output = output or build_output()
+    image_format = output["format"]
+    quality = output.get("quality")
+    params: List[int] = []
+
+    # JPEG/AVIF는 투명도를 지원하지 않으므로 3채널로 변환
+    if image_format not in ALPHA_OUTPUT_FORMATS and has_alpha(img):
+        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+
+    if image_format == "jpeg":
+        params += [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+        if output.get("progressive"):
+            params += [cv2.IMWRITE_JPEG_PROGRESSIVE, 1]
+        if output.get("subsampling"):
+            params += [
+                cv2.IMWRITE_JPEG_SAMPLING_FACTOR,
+                JPEG_SUBSAMPLING[output["subsampling"]],
+            ]
+    elif image_format == "webp":
+        params += [cv2.IMWRITE_WEBP_QUALITY, quality]
+    elif image_format == "avif":
+        params += [cv2.IMWRITE_AVIF_QUALITY, quality]
+
+    extension = OUTPUT_FORMATS[image_format]["extension"]
+    success, buffer = cv2.imencode(f".{extension}", img, params)
+
+    if not success:
+        raise ValueError("이미지를 인코딩할 수 없습니다")
+
+    return buffer.tobytes()
+
+
+def render(
+    image_data: bytes,
+    operations: List[Dict[str, Any]],
+    output: Optional[Dict[str, Any]] = None,
+    decoded: Optional[Dict[int, np.ndarray]] = None,
+    size: Optional[Tuple[int, int]] = None,
+) -> bytes:
+    """이미지를 한 번 디코딩하여 모든 연산을 적용한 뒤 한 번 인코딩 (실패 시 예외)
+
+    decoded가 주어지면 디코딩 플래그별 결과를 재사용하므로 같은 원본의 여러
+    렌디션은 필요한 배율마다 한 번씩만 디코딩된다.
+    """
+    flag = decode_flag(image_data, operations, size, output)
+
+    if decoded is None:
+        img = decode_image(image_data, flag)
+    else:
+        if flag not in decoded:
+            decoded[flag] = decode_image(image_data, flag)
+        img = decoded[flag]
+
+    for operation in operations:
+        img = apply_operation(img, operation)
+
+    return encode_image(img, output)
+
+
+def render_renditions(
+    image_data: bytes, renditions: List[Dict[str, Any]]
+) -> List[Tuple[Dict[str, Any], Optional[bytes], Optional[str]]]:
+    """원본 하나에서 여러 렌디션 생성 ((렌디션, 결과 바이트, 오류) 목록 반환)"""
+    size = source_size(image_data) if image_data[:2] == b"\xff\xd8" else None
+    decoded: Dict[int, np.ndarray] = {}
+    results = []
+
+    for rendition in renditions:
+        operations = build_operations(
+            rendition.get("width"), rendition.get("height"), rendition.get("filter")
+        )
+        try:
+            data = render(
+                image_data, operations, rendition.get("output_format"), decoded, size
+            )
+            results.append((rendition, data, None))
+
+        except Exception as e:
+            results.append((rendition, None, str(e)))
+
+    return results
@@ -1,74 +1,70 @@
 import cv2
 import numpy as np
-import io
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from app.core.logging import get_logger
+from app.services.image import ops
+from app.services.image.ops import FILTER_OPERATIONS
 
 logger = get_logger(__name__)
 
 
 class ImageProcessor:
-    """서버 측 이미지 처리 서비스"""
+    """서버 측 이미지 처리 서비스 (연산은 Spark 작업과 공유하는 ops 모듈 사용)"""
 
     @staticmethod
-    def resize_image(image_data: bytes, width: int, height: int) -> bytes:
-        """이미지 크기 조정"""
-        try:
-            # 바이트 배열을 CV2 이미지로 변환
-            image_array = np.frombuffer(image_data, np.uint8)
-            img = cv2.imdecode(image_array, cv2.IMREAD_UNCHANGED)
+    def decode_image(
+        image_data: bytes,
+        target_size: Optional[Tuple[Optional[int], Optional[int]]] = None,
+    ) -> np.ndarray:
+        """바이트 배열을 CV2 이미지로 디코딩 (목표 크기가 작으면 축소 디코딩)"""
+        operations = []
+        if target_size is not None:
+            width, height = target_size
+            operations = [{"op": "resize", "width": width, "height": height}]
+
+        return ops.decode_image(image_data, ops.decode_flag(image_data, operations))
 
-            # 이미지 크기 조정
-            resized_img = cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)
+    @staticmethod
+    def encode_image(img: np.ndarray, output: Optional[Dict[str, Any]] = None) -> bytes:
+        """CV2 이미지를 출력 형식에 맞게 인코딩 (기본값: JPEG)"""
+        return ops.encode_image(img, output)
+
+    @staticmethod
+    def apply_operation(img: np.ndarray, operation: Dict[str, Any]) -> np.ndarray:
+        """메모리 상의 이미지에 단일 연산 적용"""
+        return ops.apply_operation(img, operation)
 
-            # 처리된 이미지를 바이트 배열로 변환
-            _, buffer = cv2.imencode(".jpg", resized_img)
-            return buffer.tobytes()
+    @staticmethod
+    def process_pipeline(
+        image_data: bytes,
+        operations: List[Dict[str, Any]],
+        output: Optional[Dict[str, Any]] = None,
+    ) -> Optional[bytes]:
+        """이미지를 한 번만 디코딩하여 모든 연산을 적용한 뒤 한 번만 인코딩"""
+        try:
+            return ops.render(image_data, operations, output)
 
         except Exception as e:
-            logger.error(f"Failed to resize image: {str(e)}")
+            logger.error(f"Failed to process image pipeline {operations}: {str(e)}")
+            return None
+
+    @staticmethod
+    def resize_image(image_data: bytes, width: int, height: int) -> bytes:
+        """이미지 크기 조정"""
+        return ImageProcessor.process_pipeline(
+            image_data, [{"op": "resize", "width": width, "height": height}]
+        )
 
     @staticmethod
     def apply_filter(image_data: bytes, filter_type: str) -> bytes:
         """이미지 필터 적용"""
-        try:
-            # 바이트 배열을 CV2 이미지로 변환
-            image_array = np.frombuffer(image_data, np.uint8)
-            img = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-
-            # 필터 적용
-            if filter_type == "grayscale":
-                filtered_img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            elif filter_type == "blur":
-                filtered_img = cv2.GaussianBlur(img, (15, 15), 0)
-            elif filter_type == "edge":
-                filtered_img = cv2.Canny(img, 100, 200)
-            elif filter_type == "sepia":
-                # 세피아 필터 행렬
-                sepia_kernel = np.array(
-                    [
-                        [0.272, 0.534, 0.131],
-                        [0.349, 0.686, 0.168],
-                        [0.393, 0.769, 0.189],
-                    ]
-                )
-                filtered_img = cv2.transform(img, sepia_kernel)
-            else:
-                # 기본값: 원본 이미지 반환
-                return image_data
-
-            # 처리된 이미지를 바이트 배열로 변환
-            if len(filtered_img.shape) == 2:  # 흑백 이미지인 경우
-                _, buffer = cv2.imencode(".jpg", filtered_img)
-            else:
-                _, buffer = cv2.imencode(".jpg", filtered_img)
-
-            return buffer.tobytes()
-
-        except Exception as e:
-            logger.error(f"Failed to apply filter {filter_type}: {str(e)}")
+        if filter_type not in FILTER_OPERATIONS:
+            # 기본값: 원본 이미지 반환
             return image_data
 
+        processed = ImageProcessor.process_pipeline(image_data, [{"op": filter_type}])
+        return processed if processed is not None else image_data
+
     @staticmethod
     def get_image_info(image_data: bytes) -> Dict[str, Any]:
         """이미지 정보 추출"""
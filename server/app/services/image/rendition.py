@@ -0,0 +1,141 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import cv2
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.core.logging import get_logger
+from app.core.singleflight import DistributedSingleFlight, SingleFlight
+from app.db.redis.client import init_redis_client
+from app.services.image.hashing import compute_image_hashes
+from app.services.image.processor import ImageProcessor
+
+logger = get_logger(__name__)
+
+
+def _init_worker():
+    """렌더링 워커 프로세스 초기화 (프로세스 간 CPU 과다 구독 방지)"""
+    cv2.setNumThreads(1)
+
+
+def render_rendition(
+    image_data: bytes,
+    operations: List[Dict[str, Any]],
+    output: Optional[Dict[str, Any]] = None,
+) -> Optional[bytes]:
+    """워커 프로세스에서 실행되는 렌더링 함수"""
+    return ImageProcessor.process_pipeline(image_data, operations, output)
+
+
+class RenditionRenderer:
+    """프로세스 풀 기반 온디맨드 렌더러
+
+    실행 중/대기 중인 렌더링 수를 제한하고, 한도를 넘으면 대기열에 쌓지 않고
+    즉시 503으로 거절한다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.max_workers = max_workers or settings.RENDER_WORKERS
+        self.timeout = timeout or settings.RENDER_TIMEOUT
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker
+        )
+        self._slots = asyncio.Semaphore(
+            self.max_workers + (max_queue or settings.RENDER_QUEUE_SIZE)
+        )
+        logger.info(f"Rendition renderer initialized with {self.max_workers} workers")
+
+    def _release(self, future: asyncio.Future):
+        """워커 작업이 실제로 끝난 뒤 슬롯 반환"""
+        self._slots.release()
+        if not future.cancelled():
+            # 시간 초과로 버려진 작업의 예외 로그 억제
+            future.exception()
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """워커 프로세스에서 함수 실행 (과부하/시간 초과 시 ServiceUnavailableException)"""
+        if self._slots.locked():
+            logger.warning("Rendition renderer saturated, rejecting request")
+            raise ServiceUnavailableException(retry_after=settings.RENDER_RETRY_AFTER)
+
+        await self._slots.acquire()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, fn, *args)
+        future.add_done_callback(self._release)
+
+        try:
+            # 시간 초과 시에도 워커 작업이 끝날 때까지 슬롯을 점유하도록 shield
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"{fn.__name__} timed out after {self.timeout}s")
+            raise ServiceUnavailableException(
+                detail="이미지 렌더링 시간이 초과되었습니다",
+                retry_after=settings.RENDER_RETRY_AFTER,
+            )
+
+    async def render(
+        self,
+        image_data: bytes,
+        operations: List[Dict[str, Any]],
+        output: Optional[Dict[str, Any]] = None,
+    ) -> Optional[bytes]:
+        """렌더링 실행"""
+        return await self.submit(render_rendition, image_data, operations, output)
+
+    async def compute_hashes(self, image_data: bytes) -> Optional[Dict[str, str]]:
+        """지각 해시(pHash/dHash) 계산"""
+        return await self.submit(compute_image_hashes, image_data)
+
+    def close(self):
+        """워커 프로세스 종료"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("Rendition renderer closed")
+
+
+_renderer: Optional[RenditionRenderer] = None
+
+
+def init_rendition_renderer() -> RenditionRenderer:
+    """프로세스 공용 렌더러 생성"""
+    global _renderer
+    if _renderer is None:
+        _renderer = RenditionRenderer()
+    return _renderer
+
+
+def close_rendition_renderer():
+    """프로세스 공용 렌더러 종료"""
+    global _renderer
+    if _renderer is not None:
+        _renderer.close()
+        _renderer = None
+
+
+def get_rendition_renderer() -> RenditionRenderer:
+    """종속성 주입용 함수"""
+    return init_rendition_renderer()
+
+
+_flight: Optional[SingleFlight] = None
+
+
+def get_rendition_flight() -> SingleFlight:
+    """렌더링 요청 병합기 (다중 워커 배포 시 Redis 잠금 사용)"""
+    global _flight
+    if _flight is None:
+        if settings.SINGLEFLIGHT_DISTRIBUTED:
+            _flight = DistributedSingleFlight(
+                init_redis_client(),
+                lock_ttl=settings.SINGLEFLIGHT_LOCK_TTL,
+                poll_interval=settings.SINGLEFLIGHT_POLL_INTERVAL,
+                wait_timeout=settings.SINGLEFLIGHT_WAIT_TIMEOUT,
+                prefix="rendition-lock",
+            )
+        else:
+            _flight = SingleFlight()
+    return _flight
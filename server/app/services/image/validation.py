@@ -1,7 +1,4 @@
-import io
 from typing import Optional, Tuple
-import imghdr
-from PIL import Image
 from app.core.logging import get_logger
 from app.core.exceptions import ImageValidationException
 
@@ -13,45 +10,255 @@ SUPPORTED_FORMATS = {"jpeg", "jpg", "png", "gif", "bmp", "webp"}
 MAX_IMAGE_SIZE = 20 * 1024 * 1024
 # 최대 이미지 해상도
 MAX_RESOLUTION = 8000 * 8000
+# 헤더 분석 시 한 번에 버퍼링하는 크기
+SNIFF_CHUNK_SIZE = 4 * 1024
+# 헤더 분석용 버퍼 최대 크기
+HEADER_MAX_BYTES = 64 * 1024
 
+# 크기 정보를 담고 있는 JPEG SOF 마커
+JPEG_SOF_MARKERS = {
+    0xC0,
+    0xC1,
+    0xC2,
+    0xC3,
+    0xC5,
+    0xC6,
+    0xC7,
+    0xC9,
+    0xCA,
+    0xCB,
+    0xCD,
+    0xCE,
+    0xCF,
+}
+# 길이 필드가 없는 JPEG 마커
+JPEG_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD9)}
 
-def validate_image_file(
-    file_content: bytes, filename: Optional[str] = None
-) -> Tuple[bool, str]:
-    """이미지 파일 유효성 검증"""
-    # 파일 크기 검사
-    file_size = len(file_content)
-    if file_size > MAX_IMAGE_SIZE:
-        logger.warning(f"Image too large: {file_size} bytes (max: {MAX_IMAGE_SIZE})")
-        raise ImageValidationException(
-            detail=f"이미지 파일 크기가 너무 큽니다. 최대 20MB까지 허용됩니다."
-        )
 
-    # 이미지 형식 검사
-    image_format = imghdr.what(None, h=file_content)
-    if not image_format:
-        logger.warning(f"Unknown image format for file: {filename}")
-        raise ImageValidationException(detail="알 수 없는 이미지 형식입니다.")
+def detect_image_format(head: bytes) -> Optional[str]:
+    """매직 바이트로 이미지 형식 판별"""
+    if head[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head[:2] == b"BM":
+        return "bmp"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
 
-    if image_format.lower() not in SUPPORTED_FORMATS:
-        logger.warning(f"Unsupported image format: {image_format}")
-        raise ImageValidationException(
-            detail=f"지원되지 않는 이미지 형식입니다. 지원 형식: {', '.join(SUPPORTED_FORMATS)}"
+def _parse_dimensions(image_format: str, head: bytes) -> Optional[Tuple[int, int]]:
+    """JPEG 이외 형식의 헤더에서 크기 추출 (데이터가 부족하면 None)"""
+    if image_format == "png":
+        # IHDR 청크: 가로/세로 4바이트 빅엔디언
+        if len(head) < 24:
+            return None
+        return int.from_bytes(head[16:20], "big"), int.from_bytes(head[20:24], "big")
+
+    if image_format == "gif":
+        if len(head) < 10:
+            return None
+        return int.from_bytes(head[6:8], "little"), int.from_bytes(head[8:10], "little")
+
+    if image_format == "bmp":
+        if len(head) < 26:
+            return None
+        if int.from_bytes(head[14:18], "little") == 12:
+            # BITMAPCOREHEADER
+            return (
+                int.from_bytes(head[18:20], "little"),
+                int.from_bytes(head[20:22], "little"),
+            )
+        return (
+            abs(int.from_bytes(head[18:22], "little", signed=True)),
+            abs(int.from_bytes(head[22:26], "little", signed=True)),
         )
 
-    # 이미지 해상도 검증
-    try:
-        with Image.open(io.BytesIO(file_content)) as img:
-            width, height = img.size
-            resolution = width * height
+    if image_format == "webp":
+        if len(head) < 30:
+            return None
+        chunk = head[12:16]
+        if chunk == b"VP8 ":
+            return (
+                int.from_bytes(head[26:28], "little") & 0x3FFF,
+                int.from_bytes(head[28:30], "little") & 0x3FFF,
+            )
+        if chunk == b"VP8L":
+            bits = int.from_bytes(head[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X":
+            return (
+                int.from_bytes(head[24:27], "little") + 1,
+                int.from_bytes(head[27:30], "little") + 1,
+            )
+        raise ImageValidationException(detail="손상된 WebP 이미지입니다.")
+
+    return None
+
+
+def _scan_jpeg(buffer: bytes) -> Tuple[Optional[Tuple[int, int]], int, int]:
+    """JPEG 세그먼트를 따라가며 SOF 마커 탐색
+
+    (크기, 소비한 바이트 수, 건너뛸 남은 바이트 수)를 반환한다.
+    """
+    pos = 0
+    while True:
+        if pos + 4 > len(buffer):
+            return None, pos, 0
+
+        if buffer[pos] != 0xFF:
+            raise ImageValidationException(detail="손상된 JPEG 이미지입니다.")
+
+        marker = buffer[pos + 1]
+        if marker == 0xFF:
+            # 채움 바이트
+            pos += 1
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            pos += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            raise ImageValidationException(detail="손상된 JPEG 이미지입니다.")
+
+        if marker in JPEG_SOF_MARKERS:
+            if pos + 9 > len(buffer):
+                return None, pos, 0
+            height = int.from_bytes(buffer[pos + 5 : pos + 7], "big")
+            width = int.from_bytes(buffer[pos + 7 : pos + 9], "big")
+            return (width, height), pos, 0
+
+        end = pos + 2 + int.from_bytes(buffer[pos + 2 : pos + 4], "big")
+        if end > len(buffer):
+            # 세그먼트 본문은 버퍼링하지 않고 건너뜀
+            return None, len(buffer), end - len(buffer)
+        pos = end
+
+
+class ImageStreamValidator:
+    """스트리밍 이미지 유효성 검증기
+
+    업로드 청크를 순서대로 전달받아 크기 제한을 점진적으로 검사하고,
+    선두 헤더만으로 형식과 해상도를 판별한다. 본문은 보관하지 않는다.
+    """
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        max_size: int = MAX_IMAGE_SIZE,
+        max_resolution: int = MAX_RESOLUTION,
+    ):
+        self.filename = filename
+        self.max_size = max_size
+        self.max_resolution = max_resolution
+        self.size = 0
+        self.image_format: Optional[str] = None
+        self.width: Optional[int] = None
+        self.height: Optional[int] = None
+        self._buffer = bytearray()
+        self._skip = 0
+
+    @property
+    def header_validated(self) -> bool:
+        return self.width is not None
+
+    def feed(self, chunk: bytes):
+        """업로드 청크 검증"""
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            logger.warning(
+                f"Image too large: over {self.max_size} bytes ({self.filename})"
+            )
+            raise ImageValidationException(
+                detail="이미지 파일 크기가 너무 큽니다. 최대 20MB까지 허용됩니다."
+            )
 
-            if resolution > MAX_RESOLUTION:
-                logger.warning(f"Image resolution too high: {width} x {height}")
+        view = memoryview(chunk)
+        while view and not self.header_validated:
+            if self._skip:
+                skipped = min(self._skip, len(view))
+                self._skip -= skipped
+                view = view[skipped:]
+                continue
+
+            piece = view[:SNIFF_CHUNK_SIZE]
+            view = view[len(piece) :]
+            self._buffer.extend(piece)
+            self._inspect(final=False)
+
+            if len(self._buffer) > HEADER_MAX_BYTES:
+                logger.warning(f"Image header too large: {self.filename}")
                 raise ImageValidationException(
-                    detail=f"이미지 해상도가 너무 높습니다. 최대 8000x8000까지 허용됩니다."
+                    detail="이미지 파일을 처리할 수 없습니다."
                 )
-    except Exception as e:
-        logger.error(f"Failed to open image: {str(e)}")
-        raise ImageValidationException(detail="이미지 파일을 처리할 수 없습니다.")
+
+    def finalize(self) -> str:
+        """스트림 종료 시 헤더 검증 완료 여부 확인 후 이미지 형식 반환"""
+        if not self.header_validated:
+            self._inspect(final=True)
+
+        if not self.header_validated:
+            logger.warning(f"Failed to read image header: {self.filename}")
+            raise ImageValidationException(detail="이미지 파일을 처리할 수 없습니다.")
+
+        return self.image_format
+
+    def _inspect(self, final: bool):
+        """버퍼링된 헤더 분석"""
+        if self.image_format is None:
+            if len(self._buffer) < 12 and not final:
+                return
+
+            image_format = detect_image_format(bytes(self._buffer[:12]))
+            if not image_format:
+                logger.warning(f"Unknown image format for file: {self.filename}")
+                raise ImageValidationException(detail="알 수 없는 이미지 형식입니다.")
+
+            if image_format not in SUPPORTED_FORMATS:
+                logger.warning(f"Unsupported image format: {image_format}")
+                raise ImageValidationException(
+                    detail=f"지원되지 않는 이미지 형식입니다. 지원 형식: {', '.join(SUPPORTED_FORMATS)}"
+                )
+
+            self.image_format = image_format
+            if image_format == "jpeg":
+                # SOI 마커 이후부터 세그먼트 탐색
+                del self._buffer[:2]
+
+        if self.image_format == "jpeg":
+            dimensions, consumed, skip = _scan_jpeg(self._buffer)
+            del self._buffer[:consumed]
+            self._skip = skip
+        else:
+            dimensions = _parse_dimensions(self.image_format, bytes(self._buffer))
+
+        if dimensions:
+            self._validate_resolution(*dimensions)
+            self._buffer.clear()
+
+    def _validate_resolution(self, width: int, height: int):
+        """이미지 해상도 검증"""
+        if width <= 0 or height <= 0:
+            raise ImageValidationException(detail="이미지 파일을 처리할 수 없습니다.")
+
+        if width * height > self.max_resolution:
+            logger.warning(f"Image resolution too high: {width} x {height}")
+            raise ImageValidationException(
+                detail="이미지 해상도가 너무 높습니다. 최대 8000x8000까지 허용됩니다."
+            )
+
+        self.width = width
+        self.height = height
+
+
+def validate_image_file(
+    file_content: bytes, filename: Optional[str] = None
+) -> Tuple[bool, str]:
+    """이미지 파일 유효성 검증"""
+    validator = ImageStreamValidator(filename)
+    validator.feed(file_content)
+    image_format = validator.finalize()
 
     return True, image_format
@@ -1,12 +1,98 @@
-from confluent_kafka import Consumer, KafkaError
+from confluent_kafka import Consumer, KafkaError, Producer, TopicPartition
 from app.core.config import settings
 from app.core.logging import get_logger
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import json
-from typing import Dict, Any, Callable, List, Optional
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 logger = get_logger(__name__)
 
 
+class ConsumedMessage(NamedTuple):
+    """디코딩된 Kafka 메시지 (JSON 파싱에 실패하면 value는 None)"""
+
+    topic: str
+    partition: int
+    offset: int
+    key: Optional[str]
+    value: Optional[Dict[str, Any]]
+
+
+Partition = Tuple[str, int]
+
+
+class OffsetTracker:
+    """파티션별 커밋 가능 오프셋 계산 (동기화는 호출 측에서 담당)
+
+    처리 중이거나 처리에 실패한 오프셋이 있으면 그중 가장 작은 오프셋까지만,
+    없으면 받은 가장 큰 오프셋 다음 위치까지 커밋할 수 있다. 실패한 오프셋은
+    커밋 범위 밖에 남으므로 재시작/리밸런싱 후 다시 전달된다.
+    """
+
+    def __init__(self):
+        self.pending: Dict[Partition, Set[int]] = {}
+        self.failed: Dict[Partition, Set[int]] = {}
+        self.highest: Dict[Partition, int] = {}
+        self.committed: Dict[Partition, int] = {}
+
+    def add(self, message: ConsumedMessage):
+        """처리를 시작할 메시지 등록"""
+        partition = (message.topic, message.partition)
+        self.pending.setdefault(partition, set()).add(message.offset)
+        self.highest[partition] = max(self.highest.get(partition, -1), message.offset)
+
+    def complete(self, message: ConsumedMessage, succeeded: bool):
+        """메시지 처리 완료 (실패하면 커밋 범위를 그 오프셋 앞에 묶어 둠)"""
+        partition = (message.topic, message.partition)
+        self.pending[partition].discard(message.offset)
+        if not succeeded:
+            self.failed.setdefault(partition, set()).add(message.offset)
+
+    def in_flight(self, partitions: Iterable[Partition]) -> int:
+        """파티션들에서 처리 중인 메시지 수"""
+        return sum(len(self.pending.get(partition, ())) for partition in partitions)
+
+    def position(self, partition: Partition) -> int:
+        """파티션의 커밋 가능 위치"""
+        held = self.pending.get(partition, set()) | self.failed.get(partition, set())
+        return min(held) if held else self.highest[partition] + 1
+
+    def committable(
+        self, force: bool = False, partitions: Optional[Iterable[Partition]] = None
+    ) -> List[TopicPartition]:
+        """마지막 커밋 이후 전진한 파티션의 커밋 위치 (force면 전진 여부와 무관)"""
+        offsets = []
+        for partition in list(self.highest if partitions is None else partitions):
+            if partition not in self.highest:
+                continue
+
+            position = self.position(partition)
+            if force or position > self.committed.get(partition, -1):
+                self.committed[partition] = position
+                offsets.append(TopicPartition(*partition, position))
+        return offsets
+
+    def remove(self, partitions: Iterable[Partition]):
+        """할당이 해제된 파티션 상태 제거"""
+        for partition in partitions:
+            for state in (self.pending, self.failed, self.highest, self.committed):
+                state.pop(partition, None)
+
+
 class KafkaConsumerService:
     """Kafka 컨슈머 서비스"""
 
@@ -21,10 +107,19 @@ class KafkaConsumerService:
             "group.id": group_id,
             "auto.offset.reset": auto_offset_reset,
             "enable.auto.commit": False,
+            "on_commit": self._on_commit,
         }
         self.topics = topics
+        # consume_messages 실행 중에만 설정되는 오프셋 추적 상태
+        self._condition = threading.Condition()
+        self._tracker: Optional[OffsetTracker] = None
+        # 처리하지 못한 메시지를 보낼 프로듀서 (처음 필요할 때 생성)
+        self._dead_letter_lock = threading.Lock()
+        self._dead_letter_producer: Optional[Producer] = None
         self.consumer = Consumer(self.config)
-        self.consumer.subscribe(topics)
+        self.consumer.subscribe(
+            topics, on_revoke=self._on_revoke, on_lost=self._on_lost
+        )
         logger.info(f"Kafka consumer initialized for topics: {topics}")
 
     def consume_messages(
@@ -32,51 +127,297 @@ class KafkaConsumerService:
         process_message: Callable[[str, Optional[str], Dict[str, Any]], bool],
         timeout: float = 1.0,
         max_messages: int = 100,
-    ):
-        """메시지 소비 및 처리"""
-        messages_processed = 0
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        commit_interval: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> int:
+        """메시지 소비 및 처리 (성공적으로 처리한 메시지 수 반환)
 
-        try:
-            while messages_processed < max_messages:
-                msg = self.consumer.poll(timeout)
-
-                if msg is None:
-                    continue
-
-                if msg.error():
-                    if msg.error().code() == KafkaError._PARTITION_EOF:
-                        logger.debug(
-                            f"Reached end of partition {msg.topic()}/{msg.partition()}"
-                        )
-                    else:
-                        logger.error(f"Consumer error: {msg.error()}")
-                    continue
-
-                try:
-                    topic = msg.topic()
-                    key = msg.key().decode("utf-8") if msg.key() else None
-                    value = json.loads(msg.value().decode("utf-8"))
-
-                    # 메시지 처리 콜백 함수 호출
-                    processed = process_message(topic, key, value)
-
-                    # 처리 완료된 메시지만 오프셋 커밋
+        consume()로 배치를 가져와 워커 풀에서 동시에 처리한다. 같은 키의
+        메시지는 도착 순서대로 하나씩 처리되며, 파티션별로 앞선 메시지가 모두
+        끝난 지점(연속 완료 오프셋)까지만 주기적으로 비동기 커밋한다.
+
+        기존과 같이 max_messages개를 성공적으로 처리할 때까지 소비한다. 처리에
+        실패한 메시지는 백오프하며 max_retries번 다시 시도하고, 그래도 실패하면
+        dead letter 토픽으로 보내고 커밋에 포함한다. dead letter 전송마저
+        실패하면 커밋 범위 밖에 남겨 재시작/리밸런싱 후 다시 전달받는다. JSON으로
+        읽을 수 없는 메시지는 다시 받아도 실패하므로 로그만 남기고 커밋에 포함한다.
+        """
+        batch_size = batch_size or settings.KAFKA_CONSUMER_BATCH_SIZE
+        max_workers = max_workers or settings.KAFKA_CONSUMER_WORKERS
+        commit_interval = commit_interval or settings.KAFKA_CONSUMER_COMMIT_INTERVAL
+        if max_retries is None:
+            max_retries = settings.KAFKA_CONSUMER_MAX_RETRIES
+
+        condition = self._condition
+        tracker = OffsetTracker()
+        key_queues: Dict[Any, Deque[ConsumedMessage]] = {}
+        counts = {"processed": 0, "in_flight": 0}
+
+        def handle(message: ConsumedMessage) -> bool:
+            try:
+                # 메시지 처리 콜백 함수 호출
+                return bool(process_message(message.topic, message.key, message.value))
+            except Exception as e:
+                logger.error(f"Error processing message: {str(e)}")
+                return False
+
+        def handle_with_retries(message: ConsumedMessage) -> bool:
+            for attempt in range(max_retries + 1):
+                if attempt:
+                    time.sleep(
+                        settings.KAFKA_CONSUMER_RETRY_BACKOFF * 2 ** (attempt - 1)
+                    )
+                if handle(message):
+                    return True
+
+            logger.error(
+                f"Failed to process {message.topic}/{message.partition}@"
+                f"{message.offset} after {max_retries} retries"
+            )
+            return False
+
+        def drain_key(key: Any):
+            # 같은 키의 메시지는 한 워커가 순서대로 처리
+            while True:
+                with condition:
+                    queue = key_queues[key]
+                    if not queue:
+                        del key_queues[key]
+                        return
+                    message = queue.popleft()
+
+                skipped = message.value is None
+                processed = not skipped and handle_with_retries(message)
+                # 재시도가 끝난 메시지는 dead letter로 넘기고 커밋 범위를 전진
+                settled = processed or skipped or self.dead_letter(message)
+
+                with condition:
+                    tracker.complete(message, settled)
+                    counts["in_flight"] -= 1
                     if processed:
-                        self.consumer.commit(msg)
-                        messages_processed += 1
+                        counts["processed"] += 1
+                    condition.notify_all()
 
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse message: {msg.value()}")
-                except Exception as e:
-                    logger.error(f"Error processing message: {str(e)}")
+        def commit(asynchronous: bool):
+            # 마지막 동기 커밋은 실패했을 수 있는 비동기 커밋까지 다시 반영
+            with condition:
+                offsets = tracker.committable(force=not asynchronous)
+            if offsets:
+                self.consumer.commit(offsets=offsets, asynchronous=asynchronous)
+
+        def room() -> int:
+            # 처리 중인 메시지 수를 제한해 메모리 사용량을 묶어 두고,
+            # 처리 중인 메시지가 모두 성공해도 max_messages를 넘지 않을 만큼만 받음
+            return min(
+                max_workers * batch_size - counts["in_flight"],
+                max_messages - counts["processed"] - counts["in_flight"],
+                batch_size,
+            )
+
+        last_commit = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kafka-consumer"
+        )
+        with condition:
+            self._tracker = tracker
+
+        try:
+            while counts["processed"] < max_messages:
+                if time.monotonic() - last_commit >= commit_interval:
+                    commit(asynchronous=True)
+                    last_commit = time.monotonic()
+
+                with condition:
+                    if not condition.wait_for(lambda: room() > 0, timeout=timeout):
+                        continue
+                    num_messages = room()
+
+                # 리밸런싱 콜백은 consume() 호출 안에서 이 스레드로 실행됨
+                messages = self.consume_batch(num_messages, timeout)
+
+                with condition:
+                    for message in messages:
+                        tracker.add(message)
+                        counts["in_flight"] += 1
+
+                        # 키가 없는 메시지는 순서 제약 없이 개별 처리
+                        key = message.key
+                        if key is None:
+                            key = (message.topic, message.partition, message.offset)
+                        if key in key_queues:
+                            key_queues[key].append(message)
+                        else:
+                            key_queues[key] = deque([message])
+                            executor.submit(drain_key, key)
 
         except Exception as e:
             logger.error(f"Consumer Error: {str(e)}")
         finally:
-            return messages_processed
+            # 남은 메시지 처리 후 최종 오프셋은 동기 커밋
+            executor.shutdown(wait=True)
+            try:
+                commit(asynchronous=False)
+            except Exception as e:
+                logger.error(f"Failed to commit offsets: {str(e)}")
+            with condition:
+                self._tracker = None
+            return counts["processed"]
+
+    def dead_letter(self, message: ConsumedMessage) -> bool:
+        """처리하지 못한 메시지를 dead letter 토픽으로 전송 (전달 확인 시 True)"""
+        topic = settings.KAFKA_DEAD_LETTER_TOPIC
+        source = f"{message.topic}/{message.partition}@{message.offset}"
+        if not topic:
+            logger.error(f"Skipping unprocessable message {source}")
+            return True
+
+        with self._dead_letter_lock:
+            if self._dead_letter_producer is None:
+                self._dead_letter_producer = Producer(
+                    {
+                        "bootstrap.servers": settings.KAFKA_BOOTSTRAP_SERVERS,
+                        "client.id": f"{settings.SERVICE_NAME}-dead-letter",
+                        "acks": "all",
+                    }
+                )
+            producer = self._dead_letter_producer
+
+        errors = []
+        try:
+            producer.produce(
+                topic=topic,
+                key=message.key.encode("utf-8") if message.key else None,
+                value=json.dumps(
+                    {
+                        "topic": message.topic,
+                        "partition": message.partition,
+                        "offset": message.offset,
+                        "value": message.value,
+                    }
+                ).encode("utf-8"),
+                callback=lambda err, msg: errors.append(err),
+            )
+            remaining = producer.flush(settings.KAFKA_DELIVERY_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Failed to dead-letter {source}: {str(e)}")
+            return False
+
+        if remaining or errors != [None]:
+            logger.error(
+                f"Failed to dead-letter {source}; holding its offset for redelivery"
+            )
+            return False
+
+        logger.warning(f"Moved unprocessable message {source} to {topic}")
+        return True
+
+    def _drain_partitions(self, partitions: List[TopicPartition], commit: bool):
+        """해제되는 파티션의 처리 중인 메시지를 기다린 뒤 (커밋하고) 상태 제거"""
+        revoked = [(partition.topic, partition.partition) for partition in partitions]
+
+        with self._condition:
+            tracker = self._tracker
+            if tracker is None:
+                return
+            self._condition.wait_for(lambda: tracker.in_flight(revoked) == 0)
+            offsets = tracker.committable(force=True, partitions=revoked)
+            tracker.remove(revoked)
+
+        if commit and offsets:
+            try:
+                self.consumer.commit(offsets=offsets, asynchronous=False)
+            except Exception as e:
+                logger.error(f"Failed to commit revoked partitions: {str(e)}")
+
+    def _on_revoke(self, consumer: Consumer, partitions: List[TopicPartition]):
+        """리밸런싱으로 파티션이 해제되기 전에 처리 중인 작업을 마치고 동기 커밋"""
+        self._drain_partitions(partitions, commit=True)
+        logger.info(f"Kafka partitions revoked: {len(partitions)}")
+
+    def _on_lost(self, consumer: Consumer, partitions: List[TopicPartition]):
+        """이미 다른 컨슈머에 넘어간 파티션은 커밋하지 않고 상태만 정리"""
+        self._drain_partitions(partitions, commit=False)
+        logger.warning(f"Kafka partitions lost: {len(partitions)}")
+
+    @staticmethod
+    def _on_commit(err, partitions):
+        """비동기 커밋 결과 확인"""
+        if err is not None:
+            logger.error(f"Failed to commit offsets: {err}")
+
+    def consume_batch(
+        self, num_messages: int = 500, timeout: float = 1.0
+    ) -> List[ConsumedMessage]:
+        """consume()로 최대 num_messages개의 메시지를 한 번에 가져와 디코딩"""
+        messages: List[ConsumedMessage] = []
+
+        for msg in self.consumer.consume(num_messages=num_messages, timeout=timeout):
+            if msg.error():
+                if msg.error().code() != KafkaError._PARTITION_EOF:
+                    logger.error(f"Consumer error: {msg.error()}")
+                continue
+
+            try:
+                value = json.loads(msg.value().decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.error(f"Failed to parse message: {msg.value()}")
+                value = None
+
+            messages.append(
+                ConsumedMessage(
+                    topic=msg.topic(),
+                    partition=msg.partition(),
+                    offset=msg.offset(),
+                    key=msg.key().decode("utf-8") if msg.key() else None,
+                    value=value,
+                )
+            )
+
+        return messages
+
+    @staticmethod
+    def _partition_offsets(
+        messages: List[ConsumedMessage], pick: Callable[[List[int]], int]
+    ) -> List[TopicPartition]:
+        offsets: Dict[Tuple[str, int], List[int]] = {}
+        for message in messages:
+            offsets.setdefault((message.topic, message.partition), []).append(
+                message.offset
+            )
+
+        return [
+            TopicPartition(topic, partition, pick(values))
+            for (topic, partition), values in offsets.items()
+        ]
+
+    def commit_batch(self, messages: List[ConsumedMessage], asynchronous: bool = False):
+        """배치에서 파티션별 가장 큰 오프셋 다음 위치를 커밋"""
+        if not messages:
+            return
+
+        self.consumer.commit(
+            offsets=self._partition_offsets(messages, lambda values: max(values) + 1),
+            asynchronous=asynchronous,
+        )
+
+    def rewind(self, messages: List[ConsumedMessage]):
+        """처리에 실패한 배치를 다시 받도록 파티션별 첫 오프셋으로 되돌림"""
+        for partition in self._partition_offsets(messages, min):
+            try:
+                self.consumer.seek(partition)
+            except Exception as e:
+                # 리밸런싱으로 할당이 바뀌었으면 커밋된 오프셋부터 다시 받음
+                logger.warning(
+                    f"Failed to rewind {partition.topic}/{partition.partition}: "
+                    f"{str(e)}"
+                )
 
     def close(self):
         """컨슈머 연결 종료"""
+        if self._dead_letter_producer is not None:
+            self._dead_letter_producer.flush(settings.KAFKA_DELIVERY_TIMEOUT)
         self.consumer.close()
         logger.info("Kafka consumer closed")
 
@@ -1,7 +1,9 @@
 from confluent_kafka import Producer
 from app.core.config import settings
 from app.core.logging import get_logger
+import asyncio
 import json
+import threading
 import time
 from typing import Dict, Any, Optional, Callable
 
@@ -18,8 +20,11 @@ class KafkaProducerService:
             "acks": "all",
             "retries": 3,
             "retry.backoff.ms": 100,
+            "linger.ms": settings.KAFKA_PRODUCER_LINGER_MS,
         }
         self.producer = Producer(self.config)
+        self._poll_thread: Optional[threading.Thread] = None
+        self._stop_polling = threading.Event()
         logger.info(
             f"Kafka producer initialized with bootstrap servers: {settings.KAFKA_BOOTSTRAP_SERVERS}"
         )
@@ -50,6 +55,55 @@ class KafkaProducerService:
             return True
         except Exception as e:
             logger.error(f"Kafka 메시지 생성에 실패했습니다: {str(e)}")
+            return False
+
+    async def send_message_async(
+        self,
+        topic: str,
+        key: str,
+        value: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """kafka 토픽으로 메시지 전송 후 브로커 전달 완료까지 비동기 대기"""
+        loop = asyncio.get_running_loop()
+        delivery = loop.create_future()
+
+        def _resolve(err, msg):
+            if not delivery.done():
+                delivery.set_result(err is None)
+
+        def _on_delivery(err, msg):
+            # librdkafka 폴링 스레드에서 호출되므로 이벤트 루프로 전달
+            self._delivery_report(err, msg)
+            loop.call_soon_threadsafe(_resolve, err, msg)
+
+        if not self.send_message(topic, key, value, callback=_on_delivery):
+            return False
+
+        try:
+            return await asyncio.wait_for(
+                delivery, timeout or settings.KAFKA_DELIVERY_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Kafka 메시지 전달 대기 시간 초과: topic {topic} with key {key}"
+            )
+            return False
+
+    def start_polling(self, interval: float = 0.1):
+        """전달 콜백 처리를 위한 백그라운드 폴링 스레드 시작"""
+        if self._poll_thread is not None:
+            return
+
+        def _poll_loop():
+            while not self._stop_polling.is_set():
+                self.producer.poll(interval)
+
+        self._stop_polling.clear()
+        self._poll_thread = threading.Thread(
+            target=_poll_loop, name="kafka-producer-poll", daemon=True
+        )
+        self._poll_thread.start()
 
     def _delivery_report(self, err, msg):
         """메시지 전송 결과 콜백"""
@@ -68,11 +122,37 @@ class KafkaProducerService:
         """대기 중인 모든 메시지 전송"""
         self.producer.flush(timeout)
 
+    def close(self):
+        """대기 중인 메시지 전송 후 프로듀서 종료"""
+        if self._poll_thread is not None:
+            self._stop_polling.set()
+            self._poll_thread.join()
+            self._poll_thread = None
+
+        self.flush()
+        logger.info("Kafka producer closed")
+
+
+_kafka_producer: Optional[KafkaProducerService] = None
+
+
+def init_kafka_producer() -> KafkaProducerService:
+    """프로세스 공용 Kafka 프로듀서 생성"""
+    global _kafka_producer
+    if _kafka_producer is None:
+        _kafka_producer = KafkaProducerService()
+        _kafka_producer.start_polling()
+    return _kafka_producer
+
+
+def close_kafka_producer():
+    """프로세스 공용 Kafka 프로듀서 종료"""
+    global _kafka_producer
+    if _kafka_producer is not None:
+        _kafka_producer.close()
+        _kafka_producer = None
+
 
-def get_kafka_producer():
+def get_kafka_producer() -> KafkaProducerService:
     """종속성 주입용 함수"""
-    producer = KafkaProducerService()
-    try:
-        yield producer
-    finally:
-        producer.flush()
+    return init_kafka_producer()
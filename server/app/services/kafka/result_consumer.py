@@ -0,0 +1,229 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from pydantic import ValidationError
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.elasticsearch.client import ElasticsearchClient, init_elasticsearch_client
+from app.services.cache.metadata import MetadataCache, get_metadata_cache
+from app.services.kafka.consumer import ConsumedMessage, KafkaConsumerService
+from app.services.kafka.schemas import ImageProcessingResult
+
+logger = get_logger(__name__)
+
+# 처리 결과 반영 (같은 결과를 다시 적용해도 결과가 같도록 렌디션 목록은 합집합)
+# 요청한 렌디션(processing_params.outputs)이 모두 반영되면 완료 시각을 기록하고,
+# 목록이 없는 단일 처리 요청은 첫 성공 결과에서 완료로 본다.
+APPLY_RESULT_SCRIPT = """
+if (ctx._source.processed_objects == null) {
+    ctx._source.processed_objects = [];
+}
+for (name in params.processed_objects) {
+    if (!ctx._source.processed_objects.contains(name)) {
+        ctx._source.processed_objects.add(name);
+    }
+}
+ctx._source.status = params.status;
+ctx._source.error = params.error;
+def requested = ctx._source.processing_params;
+def expected = requested instanceof Map ? requested.outputs : null;
+if (params.status == 'completed'
+        && ctx._source.processing_completed == null
+        && (expected == null
+            || ctx._source.processed_objects.containsAll(expected))) {
+    ctx._source.processing_completed = params.completed_at;
+}
+"""
+
+
+class ResultConsumer:
+    """처리 결과 토픽 컨슈머
+
+    결과 메시지를 배치로 읽어 이미지별로 합친 뒤 하나의 _bulk 요청으로
+    메타데이터를 갱신하고, bulk가 성공한 경우에만 오프셋을 커밋한다.
+    """
+
+    def __init__(
+        self,
+        es_client: ElasticsearchClient,
+        metadata_cache: MetadataCache,
+        consumer: Optional[KafkaConsumerService] = None,
+    ):
+        self.es_client = es_client
+        self.metadata_cache = metadata_cache
+        self.consumer = consumer or KafkaConsumerService(
+            topics=[settings.KAFKA_RESULT_TOPIC],
+            group_id=settings.RESULT_CONSUMER_GROUP,
+        )
+        # 404를 처음 받은 시각 (업로드 직후 bulk 인덱싱 전일 수 있어 잠시 재시도)
+        self._missing: Dict[str, float] = {}
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def merge_results(messages: List[ConsumedMessage]) -> Dict[str, Dict[str, Any]]:
+        """배치 안의 결과를 이미지별 스크립트 파라미터로 병합"""
+        merged: Dict[str, Dict[str, Any]] = {}
+
+        for message in messages:
+            if message.value is None:
+                continue
+
+            try:
+                result = ImageProcessingResult(**message.value)
+            except ValidationError as e:
+                logger.error(f"Invalid processing result at {message.offset}: {e}")
+                continue
+
+            entry = merged.setdefault(
+                result.image_id,
+                {"processed_objects": [], "status": "completed", "errors": []},
+            )
+            for name in result.processed_objects or [result.processed_object]:
+                if name and name not in entry["processed_objects"]:
+                    entry["processed_objects"].append(name)
+            if result.status == "failed":
+                entry["status"] = "failed"
+            if result.error:
+                entry["errors"].append(result.error)
+
+        return {
+            image_id: {
+                "processed_objects": entry["processed_objects"],
+                "status": entry["status"],
+                "error": "; ".join(entry["errors"]) or None,
+            }
+            for image_id, entry in merged.items()
+        }
+
+    async def apply_results(self, messages: List[ConsumedMessage]) -> bool:
+        """결과 배치를 Elasticsearch에 반영 (재시도가 필요하면 False)"""
+        merged = self.merge_results(messages)
+        if not merged:
+            return True
+
+        completed_at = int(time.time())
+        items = await self.es_client.update_documents(
+            settings.ELASTICSEARCH_INDEX,
+            {
+                image_id: {
+                    "script": {
+                        "source": APPLY_RESULT_SCRIPT,
+                        "lang": "painless",
+                        "params": {**params, "completed_at": completed_at},
+                    },
+                    "retry_on_conflict": 3,
+                    "source": True,
+                }
+                for image_id, params in merged.items()
+            },
+        )
+
+        # 갱신 후 문서로 캐시를 채우고, 문서를 받지 못한 항목만 무효화
+        updated = {
+            image_id: item["get"]["_source"]
+            for image_id, item in items.items()
+            if not item.get("error") and item.get("get", {}).get("_source")
+        }
+        await asyncio.gather(
+            *(
+                self.metadata_cache.set(image_id, source)
+                for image_id, source in updated.items()
+            )
+        )
+        stale = [image_id for image_id in merged if image_id not in updated]
+        if stale:
+            await self.metadata_cache.invalidate_many(stale)
+
+        failed = [
+            image_id
+            for image_id, item in items.items()
+            if item.get("error") and item.get("status") != 404
+        ]
+        if failed:
+            logger.error(f"Failed to apply {len(failed)} processing results")
+            return False
+
+        # 문서가 없으면(404) 인덱싱을 기다리며 재시도하고, 제한 시간이 지나면
+        # 삭제된 이미지로 보고 결과를 버림
+        now = time.monotonic()
+        waiting = []
+        for image_id in merged:
+            if items.get(image_id, {}).get("status") != 404:
+                self._missing.pop(image_id, None)
+                continue
+
+            first_seen = self._missing.setdefault(image_id, now)
+            if now - first_seen < settings.RESULT_CONSUMER_NOT_FOUND_WINDOW:
+                waiting.append(image_id)
+            else:
+                logger.warning(f"Dropping processing result for missing {image_id}")
+                del self._missing[image_id]
+        if waiting:
+            logger.info(f"Waiting for {len(waiting)} documents to be indexed")
+            return False
+
+        logger.debug(f"Applied {len(merged)} processing results")
+        return True
+
+    async def _run(self):
+        while self._running:
+            messages = await asyncio.to_thread(
+                self.consumer.consume_batch,
+                settings.RESULT_CONSUMER_BATCH_SIZE,
+                settings.RESULT_CONSUMER_POLL_TIMEOUT,
+            )
+            if not messages:
+                continue
+
+            try:
+                applied = await self.apply_results(messages)
+            except Exception as e:
+                logger.error(f"Failed to apply processing results: {str(e)}")
+                applied = False
+
+            if applied:
+                await asyncio.to_thread(self.consumer.commit_batch, messages, True)
+            else:
+                await asyncio.to_thread(self.consumer.rewind, messages)
+                await asyncio.sleep(settings.RESULT_CONSUMER_RETRY_BACKOFF)
+
+    def start(self):
+        """백그라운드 소비 작업 시작"""
+        if self._task is None:
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """진행 중인 배치를 마친 뒤 컨슈머 종료"""
+        self._running = False
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as e:
+                logger.error(f"Result consumer stopped with error: {str(e)}")
+            self._task = None
+
+        self.consumer.close()
+
+
+_result_consumer: Optional[ResultConsumer] = None
+
+
+def init_result_consumer() -> ResultConsumer:
+    """프로세스 공용 결과 컨슈머 생성 및 시작"""
+    global _result_consumer
+    if _result_consumer is None:
+        _result_consumer = ResultConsumer(
+            init_elasticsearch_client(), get_metadata_cache()
+        )
+        _result_consumer.start()
+    return _result_consumer
+
+
+async def close_result_consumer():
+    """프로세스 공용 결과 컨슈머 종료"""
+    global _result_consumer
+    if _result_consumer is not None:
+        await _result_consumer.close()
+        _result_consumer = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class ImageProcessingRequest(BaseModel):
@@ -18,7 +18,8 @@ class ImageProcessingResult(BaseModel):
     original_bucket: str
     original_object: str
     processed_bucket: str
-    processed_object: str
+    processed_object: Optional[str] = None
+    processed_objects: List[str] = Field(default_factory=list)
     processing_time: float
     params: Dict[str, Any] = Field(default_factory=dict)
     status: str = "completed"
@@ -0,0 +1,83 @@
+import json
+from typing import Any, Dict, Optional
+from app.core.logging import get_logger
+from app.db.redis.client import RedisClient, init_redis_client
+
+logger = get_logger(__name__)
+
+# 해시에 대한 원본이 없으면 등록하고, 있으면 참조 수를 늘려 기존 원본 반환
+CLAIM_CONTENT_SCRIPT = """
+local owner = redis.call("get", KEYS[1])
+if owner then
+    redis.call("incr", KEYS[2])
+    return owner
+end
+redis.call("set", KEYS[1], ARGV[1])
+redis.call("set", KEYS[2], 1)
+return ARGV[1]
+"""
+
+# 참조 수를 줄이고, 더 이상 참조가 없으면 해시 항목 제거 후 남은 참조 수 반환
+RELEASE_CONTENT_SCRIPT = """
+if redis.call("exists", KEYS[2]) == 0 then
+    return -1
+end
+local refs = redis.call("decr", KEYS[2])
+if refs <= 0 then
+    redis.call("del", KEYS[1], KEYS[2])
+end
+return refs
+"""
+
+
+class ContentIndex:
+    """콘텐츠 해시 → 저장된 원본 인덱스 (참조 수 관리)
+
+    동일한 바이트의 업로드가 하나의 원본과 하나의 렌디션 집합을 공유하도록
+    SHA-256 해시별로 최초 업로드의 content_id와 객체 이름을 기록한다.
+    """
+
+    def __init__(self, redis_client: RedisClient, prefix: str = "content"):
+        self.redis_client = redis_client
+        self.prefix = prefix
+
+    def _keys(self, content_hash: str):
+        return [f"{self.prefix}:{content_hash}", f"{self.prefix}-refs:{content_hash}"]
+
+    async def lookup(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """해시로 등록된 원본 조회"""
+        owner = await self.redis_client.get(self._keys(content_hash)[0])
+        return json.loads(owner) if owner else None
+
+    async def claim(
+        self, content_hash: str, content_id: str, object_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """해시에 대한 원본 등록 또는 참조
+
+        등록된 원본 정보를 반환하며, content_id가 일치하면 새로 등록된 것이다.
+        Redis 오류 시 None을 반환하므로 호출 측은 중복 제거 없이 진행한다.
+        """
+        owner = await self.redis_client.run_script(
+            CLAIM_CONTENT_SCRIPT,
+            self._keys(content_hash),
+            [json.dumps({"content_id": content_id, "object_name": object_name})],
+        )
+        return json.loads(owner) if owner else None
+
+    async def release(self, content_hash: str) -> Optional[int]:
+        """참조 해제 후 남은 참조 수 반환 (등록되지 않은 해시면 -1, 오류 시 None)"""
+        refs = await self.redis_client.run_script(
+            RELEASE_CONTENT_SCRIPT, self._keys(content_hash), []
+        )
+        return int(refs) if refs is not None else None
+
+
+_content_index: Optional[ContentIndex] = None
+
+
+def get_content_index() -> ContentIndex:
+    """프로세스 공용 콘텐츠 인덱스"""
+    global _content_index
+    if _content_index is None:
+        _content_index = ContentIndex(init_redis_client())
+    return _content_index
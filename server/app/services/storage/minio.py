@@ -1,10 +1,13 @@
+import urllib3
 from minio import Minio
 from minio.error import S3Error
 from app.core.config import settings
 from app.core.logging import get_logger
+import asyncio
+import functools
 import io
-import os
-from typing import Optional, List, Dict, Any, Union
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, BinaryIO, Optional, List, Dict, Any, Union
 
 logger = get_logger(__name__)
 
@@ -13,11 +16,25 @@ class MinioService:
     """Minio 스토리지 서비스"""
 
     def __init__(self):
+        # 프로세스 전체에서 공유하는 HTTP 커넥션 풀
+        self.http_client = urllib3.PoolManager(
+            maxsize=settings.MINIO_POOL_SIZE,
+            timeout=urllib3.Timeout(
+                connect=settings.MINIO_CONNECT_TIMEOUT,
+                read=settings.MINIO_READ_TIMEOUT,
+            ),
+            retries=urllib3.Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
         self.client = Minio(
             endpoint=settings.MINIO_ENDPOINT,
             access_key=settings.MINIO_ACCESS_KEY,
             secret_key=settings.MINIO_SECRET_KEY,
             secure=settings.MINIO_SECURE,
+            http_client=self.http_client,
         )
 
         self._ensure_buckets()
@@ -77,6 +94,32 @@ class MinioService:
             logger.error(f"Failed to upload file to MinIO: {str(e)}")
             return False
 
+    def upload_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        stream: BinaryIO,
+        content_type: Optional[str] = None,
+        part_size: Optional[int] = None,
+    ) -> bool:
+        """길이를 모르는 스트림을 멀티파트로 업로드 (메모리 사용량은 파트 크기로 제한)"""
+        try:
+            self.client.put_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                data=stream,
+                length=-1,
+                part_size=part_size or settings.MINIO_UPLOAD_PART_SIZE,
+                content_type=content_type or "application/octet-stream",
+            )
+
+            logger.debug(f"Uploaded stream to {bucket_name}/{object_name}")
+            return True
+
+        except S3Error as e:
+            logger.error(f"Failed to upload stream to MinIO: {str(e)}")
+            return False
+
     def download_file(self, bucket_name: str, object_name: str) -> Optional[bytes]:
         """파일 다운로드"""
         try:
@@ -99,6 +142,63 @@ class MinioService:
             logger.error(f"Failed to download file from MinIO: {str(e)}")
             return None
 
+    def stat_file(self, bucket_name: str, object_name: str) -> Optional[Dict[str, Any]]:
+        """객체 메타데이터 조회 (본문은 읽지 않음)"""
+        try:
+            stat = self.client.stat_object(
+                bucket_name=bucket_name, object_name=object_name
+            )
+
+            return {
+                "bucket_name": bucket_name,
+                "object_name": object_name,
+                "size": stat.size,
+                "etag": stat.etag,
+                "content_type": stat.content_type,
+                "last_modified": stat.last_modified,
+            }
+
+        except S3Error as e:
+            logger.debug(
+                f"Object not found in MinIO {bucket_name}/{object_name}: {str(e)}"
+            )
+            return None
+
+    async def iter_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[bytes]:
+        """객체를 청크 단위로 읽는 비동기 이터레이터 (종료 시 연결 반환)"""
+        loop = asyncio.get_running_loop()
+        chunk_size = chunk_size or settings.MINIO_DOWNLOAD_CHUNK_SIZE
+
+        response = await loop.run_in_executor(
+            executor,
+            lambda: self.client.get_object(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                offset=offset,
+                length=length or 0,
+            ),
+        )
+
+        try:
+            while True:
+                chunk = await loop.run_in_executor(executor, response.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+        finally:
+            response.close()
+            response.release_conn()
+            logger.debug(f"Streamed file from {bucket_name}/{object_name}")
+
     def list_objects(
         self, bucket_name: str, prefix: Optional[str] = None, recursive: bool = True
     ) -> List[Dict[str, Any]]:
@@ -137,7 +237,154 @@ class MinioService:
             logger.error(f"Failed to delete file from MinIO: {str(e)}")
             return False
 
+    def close(self):
+        """커넥션 풀 정리"""
+        self.http_client.clear()
+
+
+class AsyncMinioService:
+    """MinioService 호출을 제한된 스레드 풀에서 실행하는 비동기 스토리지 서비스"""
+
+    def __init__(self, service: MinioService, max_workers: Optional[int] = None):
+        self.service = service
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.MINIO_EXECUTOR_WORKERS,
+            thread_name_prefix="minio",
+        )
+
+    async def _run(self, func, *args, **kwargs):
+        """동기 MinIO 호출을 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def upload_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        file_data: Union[io.BytesIO, bytes],
+        content_type: Optional[str] = None,
+    ) -> bool:
+        """파일 업로드"""
+        return await self._run(
+            self.service.upload_file,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            file_data=file_data,
+            content_type=content_type,
+        )
+
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        stream: BinaryIO,
+        content_type: Optional[str] = None,
+        part_size: Optional[int] = None,
+    ) -> bool:
+        """스트림 업로드 (스트림 읽기도 스레드 풀에서 수행)"""
+        return await self._run(
+            self.service.upload_stream,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            stream=stream,
+            content_type=content_type,
+            part_size=part_size,
+        )
+
+    async def download_file(
+        self, bucket_name: str, object_name: str
+    ) -> Optional[bytes]:
+        """파일 다운로드"""
+        return await self._run(
+            self.service.download_file, bucket_name=bucket_name, object_name=object_name
+        )
+
+    async def stat_file(
+        self, bucket_name: str, object_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """객체 메타데이터 조회"""
+        return await self._run(
+            self.service.stat_file, bucket_name=bucket_name, object_name=object_name
+        )
+
+    def iter_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """객체를 청크 단위로 읽는 비동기 이터레이터"""
+        return self.service.iter_file(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            offset=offset,
+            length=length,
+            chunk_size=chunk_size,
+            executor=self.executor,
+        )
+
+    async def list_objects(
+        self, bucket_name: str, prefix: Optional[str] = None, recursive: bool = True
+    ) -> List[Dict[str, Any]]:
+        """버킷 내 객체 목록 조회"""
+        return await self._run(
+            self.service.list_objects,
+            bucket_name=bucket_name,
+            prefix=prefix,
+            recursive=recursive,
+        )
+
+    async def delete_file(self, bucket_name: str, object_name: str) -> bool:
+        """파일 삭제"""
+        return await self._run(
+            self.service.delete_file, bucket_name=bucket_name, object_name=object_name
+        )
+
+    def close(self):
+        """진행 중인 작업 완료 후 스레드 풀 종료"""
+        self.executor.shutdown(wait=True)
+
+
+_minio_service: Optional[MinioService] = None
+_async_minio_service: Optional[AsyncMinioService] = None
+
+
+def init_minio_client() -> MinioService:
+    """프로세스 공용 MinIO 서비스 생성"""
+    global _minio_service
+    if _minio_service is None:
+        _minio_service = MinioService()
+    return _minio_service
+
+
+def init_async_minio_client() -> AsyncMinioService:
+    """프로세스 공용 비동기 MinIO 서비스 생성"""
+    global _async_minio_service
+    if _async_minio_service is None:
+        _async_minio_service = AsyncMinioService(init_minio_client())
+    return _async_minio_service
+
+
+def close_minio_client():
+    """프로세스 공용 MinIO 서비스 종료"""
+    global _minio_service, _async_minio_service
+    if _async_minio_service is not None:
+        _async_minio_service.close()
+        _async_minio_service = None
+    if _minio_service is not None:
+        _minio_service.close()
+        _minio_service = None
+
+
+def get_minio_client() -> MinioService:
+    """종속성 주입용 함수"""
+    return init_minio_client()
+
 
-def get_minio_client():
+def get_async_minio_client() -> AsyncMinioService:
     """종속성 주입용 함수"""
-    return MinioService()
+    return init_async_minio_client()
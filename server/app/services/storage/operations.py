@@ -0,0 +1,81 @@
+import hashlib
+from typing import BinaryIO, Optional, Tuple
+from app.services.image.validation import ImageStreamValidator
+
+
+class HashingStreamReader:
+    """업로드 스트림 래퍼
+
+    put_object가 읽어가는 청크마다 크기와 SHA-256 해시를 계산하고,
+    검증기가 주어지면 청크를 전달해 유효성을 점진적으로 검사한다.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, validator: Optional[ImageStreamValidator] = None
+    ):
+        self.stream = stream
+        self.validator = validator
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+
+        if chunk:
+            if self.validator is not None:
+                self.validator.feed(chunk)
+            self._hash.update(chunk)
+            self.size += len(chunk)
+
+        return chunk
+
+    def drain(self, chunk_size: int = 256 * 1024) -> int:
+        """스트림을 끝까지 읽어 검증과 해시 계산만 수행하고 전체 크기 반환"""
+        while self.read(chunk_size):
+            pass
+        return self.size
+
+    @property
+    def content_hash(self) -> str:
+        """지금까지 읽은 데이터의 SHA-256 해시"""
+        return self._hash.hexdigest()
+
+
+def parse_range_header(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """단일 바이트 범위 Range 헤더 해석
+
+    (시작, 끝) 오프셋(끝 포함)을 반환하며, 헤더가 없거나 해석할 수 없으면
+    None을 반환한다. 만족할 수 없는 범위는 ValueError를 발생시킨다.
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+
+    spec = range_header[len("bytes=") :].strip()
+    if "," in spec or "-" not in spec:
+        # 다중 범위는 지원하지 않으므로 전체 응답
+        return None
+
+    start_str, end_str = (part.strip() for part in spec.split("-", 1))
+    if any(part and not part.isdigit() for part in (start_str, end_str)):
+        return None
+
+    if not start_str:
+        if not end_str:
+            return None
+        # 접미사 범위: 마지막 N 바이트
+        suffix = int(end_str)
+        if suffix == 0 or size == 0:
+            raise ValueError(f"만족할 수 없는 범위입니다: {range_header}")
+        return max(0, size - suffix), size - 1
+
+    start = int(start_str)
+    if end_str and int(end_str) < start:
+        return None
+    if start >= size:
+        raise ValueError(f"만족할 수 없는 범위입니다: {range_header}")
+
+    end = int(end_str) if end_str else size - 1
+
+    return start, min(end, size - 1)
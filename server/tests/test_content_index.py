@@ -0,0 +1,109 @@
+import asyncio
+import json
+from app.services.storage.dedup import (
+    CLAIM_CONTENT_SCRIPT,
+    RELEASE_CONTENT_SCRIPT,
+    ContentIndex,
+)
+
+
+class FakeRedisClient:
+    """콘텐츠 인덱스 Lua 스크립트와 같은 동작을 하는 메모리 Redis 클라이언트"""
+
+    def __init__(self, fail: bool = False):
+        self.values = {}
+        self.fail = fail
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def run_script(self, script, keys, args):
+        if self.fail:
+            return None
+
+        owner_key, refs_key = keys
+        if script == CLAIM_CONTENT_SCRIPT:
+            if owner_key in self.values:
+                self.values[refs_key] += 1
+                return self.values[owner_key]
+            self.values[owner_key] = args[0]
+            self.values[refs_key] = 1
+            return args[0]
+
+        if script == RELEASE_CONTENT_SCRIPT:
+            if refs_key not in self.values:
+                return -1
+            self.values[refs_key] -= 1
+            refs = self.values[refs_key]
+            if refs <= 0:
+                del self.values[owner_key]
+                del self.values[refs_key]
+            return refs
+
+        raise AssertionError("unexpected script")
+
+
+def test_first_claim_registers_owner():
+    async def scenario():
+        index = ContentIndex(FakeRedisClient())
+        owner = await index.claim("hash", "id-1", "id-1.jpg")
+        return owner, await index.lookup("hash")
+
+    owner, looked_up = asyncio.run(scenario())
+
+    assert owner == {"content_id": "id-1", "object_name": "id-1.jpg"}
+    assert looked_up == owner
+
+
+def test_duplicate_claim_returns_existing_owner():
+    async def scenario():
+        index = ContentIndex(FakeRedisClient())
+        await index.claim("hash", "id-1", "id-1.jpg")
+        return await index.claim("hash", "id-2", "id-2.jpg")
+
+    assert asyncio.run(scenario())["content_id"] == "id-1"
+
+
+def test_release_removes_entry_after_last_reference():
+    async def scenario():
+        redis_client = FakeRedisClient()
+        index = ContentIndex(redis_client)
+        await index.claim("hash", "id-1", "id-1.jpg")
+        await index.claim("hash", "id-2", "id-2.jpg")
+
+        first = await index.release("hash")
+        still_registered = await index.lookup("hash")
+        second = await index.release("hash")
+        return first, still_registered, second, await index.lookup("hash")
+
+    first, still_registered, second, after = asyncio.run(scenario())
+
+    assert first == 1
+    assert still_registered["content_id"] == "id-1"
+    assert second == 0
+    assert after is None
+
+
+def test_release_unknown_hash_returns_minus_one():
+    index = ContentIndex(FakeRedisClient())
+
+    assert asyncio.run(index.release("missing")) == -1
+
+
+def test_redis_failure_returns_none():
+    async def scenario():
+        index = ContentIndex(FakeRedisClient(fail=True))
+        return await index.claim("hash", "id-1", "id-1.jpg"), await index.release(
+            "hash"
+        )
+
+    assert asyncio.run(scenario()) == (None, None)
+
+
+def test_keys_are_prefixed_per_hash():
+    redis_client = FakeRedisClient()
+    index = ContentIndex(redis_client, prefix="content")
+    asyncio.run(index.claim("abc", "id-1", "id-1.jpg"))
+
+    assert json.loads(redis_client.values["content:abc"])["content_id"] == "id-1"
+    assert redis_client.values["content-refs:abc"] == 1
@@ -0,0 +1,53 @@
+import pytest
+from app.db.elasticsearch.operations import (
+    decode_cursor,
+    encode_cursor,
+    strip_pit_tiebreaker,
+)
+
+LIST_SORT = [
+    {"upload_time": {"order": "desc"}},
+    {"image_id": {"order": "asc"}},
+]
+
+
+def test_cursor_round_trip_with_pit():
+    cursor = encode_cursor([1700000000, "abc", 42], "pit-id")
+
+    assert decode_cursor(cursor) == {
+        "after": [1700000000, "abc", 42],
+        "pit": "pit-id",
+    }
+
+
+def test_cursor_round_trip_without_pit():
+    cursor = encode_cursor([1700000000, "abc"])
+
+    assert decode_cursor(cursor) == {"after": [1700000000, "abc"]}
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(["???>>>~~~"], "pit/+=")
+
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+# 잘못된 base64, JSON 배열("[1]"), after가 없는 객체("{}")
+@pytest.mark.parametrize("cursor", ["not-base64!", "WzFd", "e30"])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_strip_pit_tiebreaker_drops_shard_doc_value():
+    assert strip_pit_tiebreaker([1700000000, "abc", 42], LIST_SORT) == [
+        1700000000,
+        "abc",
+    ]
+
+
+def test_strip_pit_tiebreaker_keeps_matching_values():
+    assert strip_pit_tiebreaker([1700000000, "abc"], LIST_SORT) == [1700000000, "abc"]
+    assert strip_pit_tiebreaker(None, LIST_SORT) is None
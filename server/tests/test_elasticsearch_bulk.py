@@ -0,0 +1,95 @@
+import asyncio
+from app.core.config import settings
+from app.db.elasticsearch.client import ElasticsearchClient
+
+
+class FakeAsyncElasticsearch:
+    """bulk 요청마다 미리 정한 항목 상태를 돌려주는 가짜 클라이언트"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.requests = []
+
+    async def bulk(self, operations):
+        self.requests.append(operations)
+        ids = [next(iter(op.values()))["_id"] for op in operations[::2]]
+        statuses = self.statuses.pop(0) if self.statuses else {}
+        items = []
+        for doc_id in ids:
+            status = statuses.get(doc_id, 201)
+            item = {"_id": doc_id, "status": status}
+            if status >= 400:
+                item["error"] = {"type": "es_rejected_execution_exception"}
+            items.append({"index": item})
+        return {"errors": any("error" in i["index"] for i in items), "items": items}
+
+    async def close(self):
+        pass
+
+
+def make_client(monkeypatch, statuses):
+    monkeypatch.setattr(settings, "ELASTICSEARCH_BULK_RETRY_BACKOFF", 0.001)
+    monkeypatch.setattr(settings, "ELASTICSEARCH_BULK_MAX_RETRIES", 2)
+    client = ElasticsearchClient()
+    client.client = FakeAsyncElasticsearch(statuses)
+    client._known_indices.add("images")
+    return client
+
+
+def test_rejected_items_are_retried(monkeypatch):
+    async def scenario():
+        client = make_client(monkeypatch, [{"b": 429}])
+        client.enqueue_index("images", {"n": 1}, doc_id="a")
+        client.enqueue_index("images", {"n": 2}, doc_id="b")
+        await client.close()
+        return client.client.requests
+
+    requests = asyncio.run(scenario())
+
+    assert len(requests) == 2
+    # 재시도 요청에는 실패한 문서만 포함
+    assert [op["index"]["_id"] for op in requests[1][::2]] == ["b"]
+
+
+def test_non_retryable_items_are_not_retried(monkeypatch):
+    async def scenario():
+        client = make_client(monkeypatch, [{"a": 400}])
+        client.enqueue_index("images", {"n": 1}, doc_id="a")
+        await client.close()
+        return client.client.requests
+
+    assert len(asyncio.run(scenario())) == 1
+
+
+def test_retries_are_capped(monkeypatch):
+    async def scenario():
+        client = make_client(monkeypatch, [{"a": 503}] * 10)
+        client.enqueue_index("images", {"n": 1}, doc_id="a")
+        await client.close()
+        return client.client.requests
+
+    # 최초 요청 + 최대 재시도 2회
+    assert len(asyncio.run(scenario())) == 3
+
+
+def test_update_can_return_updated_source(monkeypatch):
+    async def scenario():
+        client = make_client(monkeypatch, [])
+        await client.bulk(
+            [
+                {
+                    "op": "update",
+                    "index": "images-000001",
+                    "id": "a",
+                    "script": {"source": "ctx._source.n = 1"},
+                    "source": True,
+                },
+                {"op": "update", "index": "images-000001", "id": "b", "doc": {"n": 2}},
+            ]
+        )
+        return client.client.requests
+
+    operations = asyncio.run(scenario())[0]
+
+    assert operations[1] == {"script": {"source": "ctx._source.n = 1"}, "_source": True}
+    assert operations[3] == {"doc": {"n": 2}}
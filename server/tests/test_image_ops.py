@@ -0,0 +1,103 @@
+import cv2
+import numpy as np
+import pytest
+from app.services.image import ops
+from app.services.image.processor import ImageProcessor
+
+RENDITIONS = [
+    {"width": 150, "height": 150},
+    {"width": 300},
+    {"height": 90, "filter": "sepia"},
+    {"width": 640, "filter": "grayscale"},
+    {"filter": "blur"},
+    {"width": 200, "filter": "edge"},
+    {"width": 320, "output_format": ops.build_output("webp", 70)},
+    {"width": 320, "output_format": ops.build_output("png")},
+    {"width": 500, "output_format": ops.build_output("jpeg", 90, progressive=True)},
+]
+
+
+@pytest.fixture(scope="module")
+def source_jpeg() -> bytes:
+    rng = np.random.default_rng(7)
+    gradient = np.linspace(0, 255, 1280, dtype=np.uint8)
+    img = np.dstack(
+        [
+            np.tile(gradient, (960, 1)),
+            np.tile(gradient[::-1], (960, 1)),
+            rng.integers(0, 256, (960, 1280), dtype=np.uint8),
+        ]
+    )
+    success, buffer = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 92])
+    assert success
+    return buffer.tobytes()
+
+
+def test_batch_rendering_matches_server_pipeline(source_jpeg):
+    """Spark 작업의 일괄 렌더링(디코딩 공유)과 서버 온디맨드 렌더링 결과가 같은지"""
+    results = ops.render_renditions(source_jpeg, RENDITIONS)
+
+    for rendition, data, error in results:
+        operations = ops.build_operations(
+            rendition.get("width"), rendition.get("height"), rendition.get("filter")
+        )
+        expected = ImageProcessor.process_pipeline(
+            source_jpeg, operations, rendition.get("output_format")
+        )
+
+        assert error is None
+        assert data == expected
+
+
+def test_resize_uses_reduced_decode(source_jpeg):
+    operations = ops.build_operations(150, 150)
+
+    assert ops.decode_flag(source_jpeg, operations) == cv2.IMREAD_REDUCED_COLOR_4
+    assert ops.decode_flag(source_jpeg, ops.build_operations(None, None, "blur")) == (
+        cv2.IMREAD_COLOR
+    )
+
+
+def test_render_renditions_reports_decode_errors():
+    results = ops.render_renditions(b"not an image", [{"width": 100}])
+
+    assert [(data, error is not None) for _, data, error in results] == [(None, True)]
+
+
+def test_build_rendition_key_keeps_default_key():
+    assert ops.build_rendition_key("abc", "sepia", 300) == "abc/sepia_300xorig.jpg"
+    assert (
+        ops.build_rendition_key("abc", None, 300, None, ops.build_output("webp", 70))
+        == "abc/original_300xorig_q70.webp"
+    )
+
+
+def make_transparent_png() -> bytes:
+    img = np.zeros((120, 160, 4), dtype=np.uint8)
+    img[:, :, 2] = 200
+    img[30:90, 40:120, 3] = 255
+    success, buffer = cv2.imencode(".png", img)
+    assert success
+    return buffer.tobytes()
+
+
+def decoded_channels(data: bytes) -> int:
+    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+    return 1 if img.ndim == 2 else img.shape[2]
+
+
+def test_transparency_is_kept_for_alpha_formats():
+    source = make_transparent_png()
+
+    for output in (ops.build_output("png"), ops.build_output("webp", 90)):
+        for filter_type in (None, "sepia", "grayscale", "edge"):
+            data = ops.render(
+                source, ops.build_operations(80, None, filter_type), output
+            )
+            assert decoded_channels(data) == 4
+
+
+def test_transparency_is_dropped_for_jpeg():
+    data = ops.render(make_transparent_png(), ops.build_operations(80))
+
+    assert decoded_channels(data) == 3
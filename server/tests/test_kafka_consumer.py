@@ -0,0 +1,237 @@
+import json
+from confluent_kafka import TopicPartition
+from app.services.kafka import consumer as consumer_module
+from app.services.kafka.consumer import (
+    ConsumedMessage,
+    KafkaConsumerService,
+    OffsetTracker,
+)
+
+
+def message(offset, partition=0, topic="requests"):
+    return ConsumedMessage(topic, partition, offset, None, {"n": offset})
+
+
+def positions(offsets):
+    return [(tp.topic, tp.partition, tp.offset) for tp in offsets]
+
+
+class FakeKafkaMessage:
+    def __init__(self, topic, partition, offset, value):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._value = json.dumps(value).encode("utf-8")
+
+    def error(self):
+        return None
+
+    def topic(self):
+        return self._topic
+
+    def partition(self):
+        return self._partition
+
+    def offset(self):
+        return self._offset
+
+    def key(self):
+        return None
+
+    def value(self):
+        return self._value
+
+
+class FakeConsumer:
+    """consume() 호출마다 미리 정한 메시지를 돌려주는 가짜 confluent_kafka Consumer"""
+
+    batches = []
+
+    def __init__(self, config):
+        self.commits = []
+        self.batches = list(FakeConsumer.batches)
+
+    def subscribe(self, topics, on_revoke=None, on_lost=None):
+        self.on_revoke = on_revoke
+
+    def consume(self, num_messages, timeout):
+        if not self.batches:
+            return []
+        if callable(self.batches[0]):
+            return self.batches.pop(0)(self)
+
+        # 요청 수를 넘는 메시지는 다음 호출에서 반환
+        batch = self.batches[0]
+        self.batches[0] = batch[num_messages:]
+        if not self.batches[0]:
+            self.batches.pop(0)
+        return batch[:num_messages]
+
+    def commit(self, offsets, asynchronous):
+        self.commits.append((positions(offsets), asynchronous))
+
+    def close(self):
+        pass
+
+
+class FakeProducer:
+    """produce()한 메시지를 기록하고 flush()에서 전달 결과를 알리는 가짜 Producer"""
+
+    error = None
+
+    def __init__(self, config):
+        self.produced = []
+        self.callbacks = []
+
+    def produce(self, topic, key, value, callback):
+        self.produced.append((topic, json.loads(value)))
+        self.callbacks.append(callback)
+
+    def flush(self, timeout=None):
+        while self.callbacks:
+            self.callbacks.pop(0)(FakeProducer.error, None)
+        return 0
+
+
+def make_service(monkeypatch, batches, dead_letter_error=None):
+    monkeypatch.setattr(consumer_module, "Consumer", FakeConsumer)
+    monkeypatch.setattr(consumer_module, "Producer", FakeProducer)
+    monkeypatch.setattr(FakeProducer, "error", dead_letter_error)
+    monkeypatch.setattr(FakeConsumer, "batches", batches)
+    monkeypatch.setattr(consumer_module.settings, "KAFKA_CONSUMER_RETRY_BACKOFF", 0)
+    return KafkaConsumerService(topics=["requests"], group_id="test")
+
+
+def test_commit_position_stops_at_first_unfinished_offset():
+    tracker = OffsetTracker()
+    for offset in range(5):
+        tracker.add(message(offset))
+
+    tracker.complete(message(0), True)
+    tracker.complete(message(2), True)
+    assert positions(tracker.committable()) == [("requests", 0, 1)]
+
+    tracker.complete(message(1), True)
+    tracker.complete(message(3), True)
+    tracker.complete(message(4), True)
+    assert positions(tracker.committable()) == [("requests", 0, 5)]
+
+
+def test_commit_position_only_reported_when_advanced():
+    tracker = OffsetTracker()
+    tracker.add(message(0))
+    tracker.add(message(0, partition=1))
+    tracker.complete(message(0), True)
+
+    assert positions(tracker.committable()) == [
+        ("requests", 0, 1),
+        ("requests", 1, 0),
+    ]
+    assert tracker.committable() == []
+    assert len(tracker.committable(force=True)) == 2
+
+
+def test_failed_offset_is_kept_out_of_commit_window():
+    tracker = OffsetTracker()
+    for offset in range(3):
+        tracker.add(message(offset))
+
+    tracker.complete(message(0), True)
+    tracker.complete(message(1), False)
+    tracker.complete(message(2), True)
+
+    assert positions(tracker.committable()) == [("requests", 0, 1)]
+
+
+def test_removed_partitions_are_forgotten():
+    tracker = OffsetTracker()
+    tracker.add(message(0))
+    tracker.add(message(0, partition=1))
+
+    assert tracker.in_flight([("requests", 0), ("requests", 1)]) == 2
+
+    tracker.remove([("requests", 1)])
+
+    assert positions(tracker.committable(force=True)) == [("requests", 0, 0)]
+
+
+def test_consume_messages_commits_contiguous_successes(monkeypatch):
+    batches = [[FakeKafkaMessage("requests", 0, offset, {}) for offset in range(5)]]
+    service = make_service(monkeypatch, batches)
+
+    def process(topic, key, value):
+        return True
+
+    assert service.consume_messages(process, timeout=0.01, max_messages=5) == 5
+    assert service.consumer.commits[-1] == ([("requests", 0, 5)], False)
+
+
+def failing_on(offset):
+    attempts = []
+
+    def process(topic, key, value):
+        attempts.append(value["n"])
+        return value["n"] != offset
+
+    return process, attempts
+
+
+def test_consume_messages_dead_letters_exhausted_messages(monkeypatch):
+    batches = [
+        [FakeKafkaMessage("requests", 0, offset, {"n": offset}) for offset in range(5)]
+    ]
+    service = make_service(monkeypatch, batches)
+    process, attempts = failing_on(2)
+
+    processed = service.consume_messages(
+        process, timeout=0.01, max_messages=4, max_retries=2
+    )
+
+    assert processed == 4
+    # 최초 시도 + 재시도 2회
+    assert attempts.count(2) == 3
+    # dead letter로 넘긴 메시지를 지나 커밋
+    assert service.consumer.commits[-1] == ([("requests", 0, 5)], False)
+    assert service._dead_letter_producer.produced == [
+        (
+            consumer_module.settings.KAFKA_DEAD_LETTER_TOPIC,
+            {"topic": "requests", "partition": 0, "offset": 2, "value": {"n": 2}},
+        )
+    ]
+
+
+def test_consume_messages_holds_offset_when_dead_letter_fails(monkeypatch):
+    batches = [
+        [FakeKafkaMessage("requests", 0, offset, {"n": offset}) for offset in range(5)]
+    ]
+    service = make_service(monkeypatch, batches, dead_letter_error="broker down")
+    process, _ = failing_on(2)
+
+    service.consume_messages(process, timeout=0.01, max_messages=4, max_retries=0)
+
+    assert service.consumer.commits[-1] == ([("requests", 0, 2)], False)
+
+
+def test_revoke_drains_and_commits_revoked_partitions(monkeypatch):
+    def revoke(fake):
+        fake.on_revoke(fake, [TopicPartition("requests", 0)])
+        return [FakeKafkaMessage("requests", 1, 7, {})]
+
+    batches = [
+        [
+            FakeKafkaMessage("requests", 0, 0, {}),
+            FakeKafkaMessage("requests", 0, 1, {}),
+        ],
+        revoke,
+    ]
+    service = make_service(monkeypatch, batches)
+
+    def process(topic, key, value):
+        return True
+
+    assert service.consume_messages(process, timeout=0.01, max_messages=3) == 3
+    commits = service.consumer.commits
+    # 해제된 파티션은 처리 완료 후 동기 커밋되고 이후 커밋에서 빠짐
+    assert ([("requests", 0, 2)], False) in commits
+    assert commits[-1] == ([("requests", 1, 8)], False)
+    assert service._tracker is None
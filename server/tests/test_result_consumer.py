@@ -0,0 +1,167 @@
+import asyncio
+from app.core.config import settings
+from app.services.kafka.consumer import ConsumedMessage
+from app.services.kafka.result_consumer import ResultConsumer
+
+
+def make_message(offset, image_id, processed_objects, status="completed", error=None):
+    return ConsumedMessage(
+        topic="image-processing-results",
+        partition=0,
+        offset=offset,
+        key=image_id,
+        value={
+            "image_id": image_id,
+            "original_bucket": "original-images",
+            "original_object": f"{image_id}.jpg",
+            "processed_bucket": "processed-images",
+            "processed_objects": processed_objects,
+            "processing_time": 0.1,
+            "status": status,
+            "error": error,
+        },
+    )
+
+
+class FakeElasticsearchClient:
+    """update_documents 요청을 기록하고 갱신 후 문서를 돌려주는 가짜 클라이언트"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.updates = []
+
+    async def update_documents(self, index_name, updates):
+        self.updates.append(updates)
+        items = {}
+        for image_id, update in updates.items():
+            if image_id not in self.documents:
+                items[image_id] = {"status": 404, "error": {"type": "not_found"}}
+                continue
+
+            params = update["script"]["params"]
+            document = self.documents[image_id]
+            for name in params["processed_objects"]:
+                if name not in document["processed_objects"]:
+                    document["processed_objects"].append(name)
+            document.update(status=params["status"], error=params["error"])
+            expected = (document.get("processing_params") or {}).get("outputs")
+            if (
+                params["status"] == "completed"
+                and document.get("processing_completed") is None
+                and set(expected or []) <= set(document["processed_objects"])
+            ):
+                document["processing_completed"] = params["completed_at"]
+            items[image_id] = {"status": 200, "get": {"_source": dict(document)}}
+        return items
+
+
+class FakeMetadataCache:
+    def __init__(self):
+        self.entries = {}
+        self.invalidated = []
+
+    async def set(self, image_id, metadata):
+        self.entries[image_id] = metadata
+
+    async def invalidate_many(self, image_ids):
+        self.invalidated.extend(image_ids)
+
+
+def test_merge_results_combines_messages_per_image():
+    merged = ResultConsumer.merge_results(
+        [
+            make_message(0, "a", ["a/thumb.jpg"]),
+            make_message(1, "b", [], status="failed", error="decode failed"),
+            make_message(2, "a", ["a/medium.jpg", "a/thumb.jpg"]),
+        ]
+    )
+
+    assert merged == {
+        "a": {
+            "processed_objects": ["a/thumb.jpg", "a/medium.jpg"],
+            "status": "completed",
+            "error": None,
+        },
+        "b": {"processed_objects": [], "status": "failed", "error": "decode failed"},
+    }
+
+
+def test_merge_results_is_idempotent_for_redelivered_messages():
+    messages = [
+        make_message(0, "a", ["a/thumb.jpg"]),
+        make_message(1, "a", ["a/medium.jpg"]),
+    ]
+
+    assert ResultConsumer.merge_results(messages + messages) == (
+        ResultConsumer.merge_results(messages)
+    )
+
+
+def test_merge_results_skips_invalid_messages():
+    invalid = ConsumedMessage("image-processing-results", 0, 5, "c", {"image_id": "c"})
+    empty = ConsumedMessage("image-processing-results", 0, 6, None, None)
+
+    assert ResultConsumer.merge_results([invalid, empty]) == {}
+
+
+def test_apply_results_caches_updated_documents(monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_CONSUMER_NOT_FOUND_WINDOW", 0)
+    es_client = FakeElasticsearchClient(
+        {"a": {"image_id": "a", "processed_objects": [], "status": "pending"}}
+    )
+    cache = FakeMetadataCache()
+    consumer = ResultConsumer(es_client, cache, consumer=object())
+    messages = [make_message(0, "a", ["a/thumb.jpg"]), make_message(1, "gone", [])]
+
+    assert asyncio.run(consumer.apply_results(messages))
+    # 같은 배치를 다시 적용해도 문서와 캐시 상태는 같음
+    assert asyncio.run(consumer.apply_results(messages))
+
+    completed_at = es_client.documents["a"]["processing_completed"]
+    expected = {
+        "image_id": "a",
+        "processed_objects": ["a/thumb.jpg"],
+        "status": "completed",
+        "error": None,
+        "processing_completed": completed_at,
+    }
+    assert isinstance(completed_at, int)
+    assert es_client.documents["a"] == expected
+    assert cache.entries == {"a": expected}
+    assert cache.invalidated == ["gone", "gone"]
+    assert es_client.updates[0]["a"]["source"] is True
+
+
+def test_apply_results_retries_documents_not_yet_indexed(monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_CONSUMER_NOT_FOUND_WINDOW", 60)
+    es_client = FakeElasticsearchClient({})
+    consumer = ResultConsumer(es_client, FakeMetadataCache(), consumer=object())
+    messages = [make_message(0, "new", ["new/thumb.jpg"])]
+
+    # 인덱싱 전(404)이면 커밋하지 않고 다시 시도
+    assert not asyncio.run(consumer.apply_results(messages))
+
+    es_client.documents["new"] = {"image_id": "new", "processed_objects": []}
+    assert asyncio.run(consumer.apply_results(messages))
+    assert es_client.documents["new"]["processed_objects"] == ["new/thumb.jpg"]
+    assert consumer._missing == {}
+
+
+def test_apply_results_completes_after_last_requested_rendition():
+    es_client = FakeElasticsearchClient(
+        {
+            "a": {
+                "image_id": "a",
+                "processed_objects": [],
+                "processing_params": {"outputs": ["a/thumb.jpg", "a/medium.jpg"]},
+                "processing_completed": None,
+            }
+        }
+    )
+    consumer = ResultConsumer(es_client, FakeMetadataCache(), consumer=object())
+
+    asyncio.run(consumer.apply_results([make_message(0, "a", ["a/thumb.jpg"])]))
+    assert es_client.documents["a"]["processing_completed"] is None
+
+    asyncio.run(consumer.apply_results([make_message(1, "a", ["a/medium.jpg"])]))
+    assert es_client.documents["a"]["processing_completed"] is not None
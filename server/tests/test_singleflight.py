@@ -0,0 +1,142 @@
+import asyncio
+import pytest
+from app.core.singleflight import DistributedSingleFlight, SingleFlight
+
+
+class FakeRedisClient:
+    """잠금 호출만 구현한 메모리 Redis 클라이언트"""
+
+    def __init__(self):
+        self.locks = {}
+        self.released = []
+
+    async def acquire_lock(self, name, token, ttl):
+        if name in self.locks:
+            return False
+        self.locks[name] = token
+        return True
+
+    async def release_lock(self, name, token):
+        if self.locks.get(name) != token:
+            return False
+        del self.locks[name]
+        self.released.append(name)
+        return True
+
+
+def test_concurrent_calls_share_one_execution():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "rendered"
+
+        results = await asyncio.gather(*(flight.do("key", fn) for _ in range(10)))
+        return calls, results, flight._calls
+
+    calls, results, pending = asyncio.run(scenario())
+
+    assert calls == 1
+    assert results == ["rendered"] * 10
+    assert pending == {}
+
+
+def test_exception_is_shared_with_all_waiters():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("key", fn) for _ in range(3)), return_exceptions=True
+        )
+        return results, flight._calls
+
+    results, pending = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert pending == {}
+
+
+def test_cancelled_leader_does_not_fail_waiters():
+    async def scenario():
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def fn():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "rendered"
+
+        leader = asyncio.create_task(flight.do("key", fn))
+        await started.wait()
+        waiters = [asyncio.create_task(flight.do("key", fn)) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(scenario()) == ["rendered"] * 5
+
+
+def test_new_call_after_completion_runs_again():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        first = await flight.do("key", fn)
+        second = await flight.do("key", fn)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
+
+
+def test_distributed_lock_released_by_worker_after_leader_cancel():
+    async def scenario():
+        redis_client = FakeRedisClient()
+        flight = DistributedSingleFlight(
+            redis_client, lock_ttl=5, poll_interval=0.01, wait_timeout=1
+        )
+        started = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def fn():
+            started.set()
+            await asyncio.sleep(0.05)
+            finished.set()
+            return "rendered"
+
+        leader = asyncio.create_task(flight.do("key", fn))
+        await started.wait()
+        waiter = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        # 작업이 끝나기 전에는 잠금이 유지됨
+        held = "singleflight:key" in redis_client.locks
+
+        result = await waiter
+        return held, finished.is_set(), result, redis_client
+
+    held, finished, result, redis_client = asyncio.run(scenario())
+
+    assert held
+    assert finished
+    assert result == "rendered"
+    assert redis_client.locks == {}
+    assert redis_client.released == ["singleflight:key"]
@@ -0,0 +1,342 @@
+"""렌디션 일괄 재생성 작업
+
+원본 버킷 전체를 객체 이름의 16진수 접두사 샤드로 나누어 병렬로 나열하고,
+(원본 × 렌디션) 중 아직 없는 렌디션만 골라 스트리밍 작업과 같은 Pandas UDF
+파이프라인으로 렌더링/업로드한다. 샤드는 --wave-size개씩 나누어 처리하며,
+한 묶음이 끝날 때마다 실패가 없는 샤드를 처리 버킷의 체크포인트 접두사에
+매니페스트로 기록한다. 작업이 중간에 멈춰도 같은 설정으로 다시 실행하면 남은
+샤드만 이어서 처리한다.
+
+    spark-submit jobs/backfill_renditions.py --presets thumbnail,medium
+    spark-submit jobs/backfill_renditions.py --presets large --format webp
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+from itertools import product
+from typing import Any, Dict, Iterator, List, Set
+
+from pyspark.sql import DataFrame, Row, SparkSession
+from pyspark.sql import functions as F
+
+from utils.image_utils.transformations import build_output, content_type
+from utils.image_utils.transformations import render_images, rendition_keys
+from utils.kafka_utils import RENDITION_SCHEMA
+from utils.spark_utils import create_spark_session
+from utils.storage_utils import MINIO_ORIGINAL_BUCKET, MINIO_PROCESSED_BUCKET
+from utils.storage_utils import fetch_objects, list_objects, store_objects
+from utils.storage_utils import write_json
+
+logger = logging.getLogger("backfill-renditions")
+
+# 서버 RENDITION_PRESETS와 같은 환경 변수/기본값
+RENDITION_PRESETS: Dict[str, Dict[str, Any]] = json.loads(
+    os.getenv(
+        "RENDITION_PRESETS",
+        json.dumps(
+            {
+                "thumbnail": {"width": 150, "height": 150},
+                "medium": {"width": 800},
+                "large": {"width": 1600},
+            }
+        ),
+    )
+)
+
+# 샤드 완료 매니페스트 위치 (처리 버킷 내 접두사)
+BACKFILL_CHECKPOINT_PREFIX = os.getenv("BACKFILL_CHECKPOINT_PREFIX", "_backfill")
+HEX_DIGITS = "0123456789abcdef"
+# 드라이버 로그에 남길 최대 실패 렌디션 수
+MAX_LOGGED_FAILURES = 100
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="렌디션 일괄 재생성")
+    parser.add_argument(
+        "--presets",
+        default=",".join(RENDITION_PRESETS),
+        help="생성할 프리셋 이름 (쉼표 구분)",
+    )
+    parser.add_argument("--format", dest="image_format", default=None)
+    parser.add_argument("--quality", type=int, default=None)
+    parser.add_argument("--progressive", action="store_true")
+    parser.add_argument("--subsampling", default=None)
+    parser.add_argument(
+        "--shard-depth",
+        type=int,
+        default=2,
+        help="샤드 접두사 길이 (16^depth개 샤드)",
+    )
+    parser.add_argument(
+        "--wave-size",
+        type=int,
+        default=16,
+        help="한 번에 처리하고 매니페스트를 기록할 샤드 수",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Python 워커가 한 번에 메모리에 올리는 원본 수 (Arrow 배치 크기)",
+    )
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=None,
+        help="렌더링 파티션 수 (기본값: 클러스터 기본 병렬도)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="이미 있는 렌디션도 다시 생성 (인코더 설정 변경 시)",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="체크포인트 실행 ID (기본값: 렌디션 설정 해시)",
+    )
+    return parser.parse_args()
+
+
+def build_renditions(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """프리셋 이름과 출력 형식 인자를 렌디션 목록으로 변환"""
+    output = build_output(
+        args.image_format, args.quality, args.progressive, args.subsampling
+    )
+
+    renditions = []
+    for name in filter(None, (name.strip() for name in args.presets.split(","))):
+        if name not in RENDITION_PRESETS:
+            raise ValueError(f"알 수 없는 프리셋입니다: {name}")
+
+        preset = RENDITION_PRESETS[name]
+        renditions.append(
+            {
+                "width": preset.get("width"),
+                "height": preset.get("height"),
+                "filter": preset.get("filter"),
+                "output_format": output,
+            }
+        )
+    return renditions
+
+
+def build_run_id(renditions: List[Dict[str, Any]], overwrite: bool) -> str:
+    """렌디션 설정 해시로 실행 ID 생성 (같은 설정의 재실행은 체크포인트 공유)"""
+    config = json.dumps(
+        {"renditions": renditions, "overwrite": overwrite}, sort_keys=True
+    )
+    return hashlib.sha1(config.encode("utf-8")).hexdigest()[:12]
+
+
+def manifest_name(run_id: str, shard: str) -> str:
+    return f"{BACKFILL_CHECKPOINT_PREFIX}/{run_id}/{shard}.json"
+
+
+def completed_shards(run_id: str) -> Set[str]:
+    """이미 완료된 샤드 목록"""
+    prefix = f"{BACKFILL_CHECKPOINT_PREFIX}/{run_id}/"
+    return {
+        name[len(prefix) : -len(".json")]
+        for name, _ in list_objects(MINIO_PROCESSED_BUCKET, prefix)
+        if name.endswith(".json")
+    }
+
+
+def list_shard(bucket_name: str, shard: str) -> Iterator[Row]:
+    """샤드 접두사 아래 객체 나열"""
+    for name, etag in list_objects(bucket_name, shard):
+        yield Row(shard=shard, object_name=name, etag=etag)
+
+
+def list_shards(spark: SparkSession, bucket_name: str, shards: List[str]) -> DataFrame:
+    """샤드별 객체 목록을 태스크에서 병렬로 나열"""
+    rows = spark.sparkContext.parallelize(shards, len(shards)).flatMap(
+        lambda shard: list_shard(bucket_name, shard)
+    )
+    return spark.createDataFrame(rows, "shard string, object_name string, etag string")
+
+
+def plan_renditions(
+    spark: SparkSession,
+    originals: DataFrame,
+    renditions: List[Dict[str, Any]],
+    shards: List[str],
+    overwrite: bool,
+) -> DataFrame:
+    """원본 × 렌디션 중 생성할 렌디션 행 (overwrite가 아니면 이미 있는 것은 제외)
+
+    렌디션 키는 콘텐츠 ID(원본 객체 이름에서 확장자를 뺀 값) 아래에 있으므로
+    처리 버킷도 같은 샤드 접두사로 나열해 기존 렌디션과 비교한다.
+    """
+    presets = spark.createDataFrame(renditions, RENDITION_SCHEMA).drop("output")
+    targets = (
+        originals.crossJoin(F.broadcast(presets))
+        .withColumn("content_id", F.regexp_replace("object_name", r"\.[^.]*$", ""))
+        .withColumn(
+            "output",
+            rendition_keys("content_id", "width", "height", "filter", "output_format"),
+        )
+    )
+    if overwrite:
+        return targets
+
+    existing = list_shards(spark, MINIO_PROCESSED_BUCKET, shards).select(
+        F.col("object_name").alias("output")
+    )
+    return targets.join(existing, "output", "left_anti")
+
+
+def render_targets(targets: DataFrame, partitions: int) -> DataFrame:
+    """원본별로 정렬해 렌더링/업로드하고 (shard, output, error) 반환
+
+    원본 ETag를 source-etag 메타데이터로 함께 기록해 원본 변경 여부를 확인할
+    수 있게 한다.
+    """
+    return (
+        targets.repartition(partitions, "object_name")
+        .sortWithinPartitions("object_name")
+        .withColumn("image", fetch_objects(F.lit(MINIO_ORIGINAL_BUCKET), "object_name"))
+        .withColumn(
+            "rendered",
+            render_images("image", "width", "height", "filter", "output_format"),
+        )
+        .withColumn(
+            "store_error",
+            store_objects(
+                F.lit(MINIO_PROCESSED_BUCKET),
+                "output",
+                "rendered.data",
+                content_type(F.col("output_format.format")),
+                "etag",
+            ),
+        )
+        .select(
+            "shard",
+            "output",
+            F.coalesce("rendered.error", "store_error").alias("error"),
+        )
+    )
+
+
+def shard_stats(
+    originals: DataFrame, statuses: DataFrame, renditions: int
+) -> Dict[str, Dict[str, int]]:
+    """샤드별 원본/렌더링/건너뜀/실패 수 집계"""
+    stats = {
+        row.shard: {"originals": row["count"], "rendered": 0, "failed": 0}
+        for row in originals.groupBy("shard").count().collect()
+    }
+
+    for row in (
+        statuses.groupBy("shard")
+        .agg(
+            F.count_if(F.col("error").isNull()).alias("rendered"),
+            F.count_if(F.col("error").isNotNull()).alias("failed"),
+        )
+        .collect()
+    ):
+        stats[row.shard].update(rendered=row.rendered, failed=row.failed)
+
+    failures = statuses.where(F.col("error").isNotNull()).select("output", "error")
+    for row in failures.take(MAX_LOGGED_FAILURES):
+        logger.error(f"Failed to render {row.output}: {row.error}")
+
+    for shard in stats.values():
+        shard["skipped"] = (
+            shard["originals"] * renditions - shard["rendered"] - shard["failed"]
+        )
+    return stats
+
+
+def backfill_wave(
+    spark: SparkSession,
+    shards: List[str],
+    renditions: List[Dict[str, Any]],
+    run_id: str,
+    partitions: int,
+    args: argparse.Namespace,
+) -> Dict[str, Dict[str, int]]:
+    """샤드 묶음 하나를 처리하고 실패가 없는 샤드의 매니페스트 기록
+
+    원본이 없는 샤드도 완료로 기록하고, 실패가 있는 샤드는 다음 실행에서
+    다시 처리한다.
+    """
+    started = time.time()
+    originals = list_shards(spark, MINIO_ORIGINAL_BUCKET, shards).persist()
+    targets = plan_renditions(spark, originals, renditions, shards, args.overwrite)
+    statuses = render_targets(targets, partitions).persist()
+    stats = shard_stats(originals, statuses, len(renditions))
+    elapsed = time.time() - started
+
+    for shard in shards:
+        stats.setdefault(
+            shard, {"originals": 0, "rendered": 0, "skipped": 0, "failed": 0}
+        )
+        if not stats[shard]["failed"]:
+            write_json(
+                MINIO_PROCESSED_BUCKET,
+                manifest_name(run_id, shard),
+                {**stats[shard], "elapsed": elapsed},
+            )
+
+    statuses.unpersist()
+    originals.unpersist()
+    return stats
+
+
+def main():
+    args = parse_args()
+    renditions = build_renditions(args)
+    run_id = args.run_id or build_run_id(renditions, args.overwrite)
+
+    shards = ["".join(chars) for chars in product(HEX_DIGITS, repeat=args.shard_depth)]
+    done = completed_shards(run_id)
+    pending = [shard for shard in shards if shard not in done]
+    logger.info(
+        f"Backfill {run_id}: {len(pending)} of {len(shards)} shards pending "
+        f"for {len(renditions)} renditions"
+    )
+    if not pending:
+        return
+
+    spark = create_spark_session("backfill-renditions")
+    partitions = args.partitions or spark.sparkContext.defaultParallelism
+    # 행은 (원본 × 렌디션) 단위이고 각 행이 원본 바이트를 가지므로, Arrow 배치에
+    # 원본 concurrency개 분량의 행만 담아 Python 워커 메모리를 제한
+    spark.conf.set(
+        "spark.sql.execution.arrow.maxRecordsPerBatch",
+        max(1, args.concurrency * len(renditions)),
+    )
+
+    totals = {"rendered": 0, "skipped": 0, "failed": 0}
+    incomplete = 0
+    for start in range(0, len(pending), args.wave_size):
+        wave = pending[start : start + args.wave_size]
+        stats = backfill_wave(spark, wave, renditions, run_id, partitions, args)
+
+        for shard in stats.values():
+            for key in totals:
+                totals[key] += shard[key]
+        incomplete += sum(1 for shard in stats.values() if shard["failed"])
+        logger.info(
+            f"Backfill {run_id}: {min(start + len(wave), len(pending))} of "
+            f"{len(pending)} pending shards processed"
+        )
+
+    logger.info(
+        f"Backfill {run_id} finished: "
+        f"rendered={totals['rendered']} "
+        f"skipped={totals['skipped']} "
+        f"failed={totals['failed']} "
+        f"incomplete_shards={incomplete}"
+    )
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
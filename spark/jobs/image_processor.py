@@ -0,0 +1,189 @@
+"""이미지 처리 요청 스트리밍 작업
+
+KAFKA_IMAGE_TOPIC의 처리 요청을 마이크로 배치로 읽어 렌디션 단위로 펼치고,
+원본 객체별로 파티션/정렬한 뒤 Pandas UDF로 원본을 내려받아 렌더링/업로드한다.
+렌디션 결과를 요청별로 다시 모아 KAFKA_RESULT_TOPIC에 기록한다.
+
+    spark-submit \\
+        --packages org.apache.spark:spark-sql-kafka-0-10_2.12:3.5.1 \\
+        jobs/image_processor.py
+"""
+
+import logging
+import os
+import time
+
+from pyspark.sql import Column, DataFrame
+from pyspark.sql import functions as F
+
+from utils.image_utils.transformations import content_type, render_images
+from utils.image_utils.transformations import rendition_keys
+from utils.spark_utils import create_spark_session
+from utils.kafka_utils import OUTPUT_FORMAT_SCHEMA, RESULT_SCHEMA
+from utils.kafka_utils import read_request_stream, write_results
+from utils.storage_utils import MINIO_PROCESSED_BUCKET, fetch_objects, store_objects
+
+logger = logging.getLogger("image-processor")
+
+CHECKPOINT_DIR = os.getenv(
+    "SPARK_CHECKPOINT_DIR", "/opt/bitnami/spark/data/checkpoints/image-processor"
+)
+TRIGGER_INTERVAL = os.getenv("SPARK_TRIGGER_INTERVAL", "5 seconds")
+
+
+def normalize_renditions() -> Column:
+    """단일 params 요청과 renditions 목록 요청을 같은 렌디션 배열로 변환"""
+    params = F.col("params")
+    legacy = F.array(
+        F.struct(
+            params["width"].cast("int").alias("width"),
+            params["height"].cast("int").alias("height"),
+            params["filter"].alias("filter"),
+            F.lit(None).cast(OUTPUT_FORMAT_SCHEMA).alias("output_format"),
+            F.lit(None).cast("string").alias("output"),
+        )
+    )
+    return F.when(F.size("renditions") > 0, F.col("renditions")).otherwise(legacy)
+
+
+def expand_renditions(requests: DataFrame) -> DataFrame:
+    """요청을 렌디션 단위 행으로 펼치고 결과 객체 이름 채우기"""
+    outputs = requests.select(
+        "request_id",
+        "bucket",
+        "object_name",
+        F.coalesce("content_id", "image_id").alias("content_id"),
+        F.posexplode(normalize_renditions()).alias("position", "rendition"),
+    ).select(
+        "request_id",
+        "bucket",
+        "object_name",
+        "content_id",
+        "position",
+        "rendition.*",
+    )
+
+    return outputs.withColumn(
+        "output",
+        F.coalesce(
+            "output",
+            rendition_keys("content_id", "width", "height", "filter", "output_format"),
+        ),
+    )
+
+
+def render_outputs(outputs: DataFrame) -> DataFrame:
+    """결과 객체별로 한 번씩 렌더링/업로드하고 (output, error) 반환
+
+    같은 원본의 렌디션이 한 파티션에 이어지도록 정렬하므로 UDF는 원본을 한 번만
+    내려받고 디코딩 결과를 재사용한다.
+    """
+    return (
+        outputs.dropDuplicates(["output"])
+        .repartition("bucket", "object_name")
+        .sortWithinPartitions("bucket", "object_name")
+        .withColumn("image", fetch_objects("bucket", "object_name"))
+        .withColumn(
+            "rendered",
+            render_images("image", "width", "height", "filter", "output_format"),
+        )
+        .withColumn(
+            "store_error",
+            store_objects(
+                F.lit(MINIO_PROCESSED_BUCKET),
+                "output",
+                "rendered.data",
+                content_type(F.col("output_format.format")),
+                F.lit(None).cast("string"),
+            ),
+        )
+        .select(
+            "output",
+            F.coalesce("rendered.error", "store_error").alias("error"),
+        )
+    )
+
+
+def collect_results(
+    requests: DataFrame,
+    outputs: DataFrame,
+    statuses: DataFrame,
+    processing_time: float,
+) -> DataFrame:
+    """렌디션 결과를 요청별로 모아 결과 메시지 컬럼 생성"""
+    per_request = (
+        outputs.select("request_id", "position", "output")
+        .join(statuses, "output", "left")
+        .groupBy("request_id")
+        .agg(
+            F.sort_array(F.collect_list(F.struct("position", "output", "error"))).alias(
+                "outputs"
+            )
+        )
+        .select(
+            "request_id",
+            F.transform(
+                F.filter("outputs", lambda item: item["error"].isNull()),
+                lambda item: item["output"],
+            ).alias("processed_objects"),
+            F.transform(
+                F.filter("outputs", lambda item: item["error"].isNotNull()),
+                lambda item: F.concat(item["output"], F.lit(": "), item["error"]),
+            ).alias("errors"),
+        )
+    )
+
+    failed = F.size("errors") > 0
+    return requests.join(per_request, "request_id").select(
+        "image_id",
+        F.col("bucket").alias("original_bucket"),
+        F.col("object_name").alias("original_object"),
+        F.lit(MINIO_PROCESSED_BUCKET).alias("processed_bucket"),
+        F.when(F.size("processed_objects") > 0, F.col("processed_objects")[0]).alias(
+            "processed_object"
+        ),
+        "processed_objects",
+        F.lit(processing_time).alias("processing_time"),
+        F.coalesce(
+            "params", F.create_map().cast(RESULT_SCHEMA["params"].dataType)
+        ).alias("params"),
+        F.when(failed, "failed").otherwise("completed").alias("status"),
+        F.when(failed, F.concat_ws("; ", "errors")).alias("error"),
+    )
+
+
+def process_batch(batch_df: DataFrame, batch_id: int):
+    """마이크로 배치 처리 (렌디션 펼치기 → 원본별 렌더링/업로드 → 결과 기록)"""
+    requests = batch_df.withColumn(
+        "request_id", F.monotonically_increasing_id()
+    ).persist()
+    outputs = expand_renditions(requests).persist()
+
+    started = time.time()
+    statuses = render_outputs(outputs).persist()
+    rendered = statuses.count()
+    processing_time = time.time() - started
+
+    write_results(collect_results(requests, outputs, statuses, processing_time))
+    logger.info(f"Processed image request batch {batch_id}: {rendered} renditions")
+
+    statuses.unpersist()
+    outputs.unpersist()
+    requests.unpersist()
+
+
+def main():
+    spark = create_spark_session("image-processor")
+
+    query = (
+        read_request_stream(spark)
+        .writeStream.foreachBatch(process_batch)
+        .option("checkpointLocation", CHECKPOINT_DIR)
+        .trigger(processingTime=TRIGGER_INTERVAL)
+        .start()
+    )
+    query.awaitTermination()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import os
+from itertools import chain
+from typing import Any, Dict, Iterator, Optional, Tuple
+import cv2
+import numpy as np
+import pandas as pd
+from pyspark.sql import Column
+from pyspark.sql import functions as F
+from pyspark.sql.functions import pandas_udf
+from pyspark.sql.types import BinaryType, StringType, StructField, StructType
+
+# 연산/인코딩은 서버와 같은 모듈을 사용해 온디맨드 렌더링과 같은 바이트를 생성
+from app.services.image.ops import (
+    DEFAULT_OUTPUT_FORMAT,
+    OUTPUT_FORMATS,
+    build_operations,
+    build_output,
+    build_rendition_key,
+    render,
+    source_size,
+)
+
+__all__ = [
+    "ARROW_MAX_RECORDS_PER_BATCH",
+    "DEFAULT_OUTPUT",
+    "OUTPUT_FORMATS",
+    "RENDER_RESULT_SCHEMA",
+    "build_output",
+    "content_type",
+    "render_images",
+    "rendition_keys",
+]
+
+# Pandas UDF Arrow 배치당 레코드 수 (레코드가 이미지 전체이므로 기본값보다 작게)
+ARROW_MAX_RECORDS_PER_BATCH = int(os.getenv("SPARK_ARROW_MAX_RECORDS_PER_BATCH", "64"))
+
+DEFAULT_OUTPUT = build_output()
+
+# render_images 결과 (성공 시 data, 실패 시 error)
+RENDER_RESULT_SCHEMA = StructType(
+    [
+        StructField("data", BinaryType()),
+        StructField("error", StringType()),
+    ]
+)
+
+
+def _optional(value: Any) -> Any:
+    """Arrow에서 변환된 null(None/NaN)을 None으로 정규화"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return value
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    value = _optional(value)
+    return int(value) if value is not None else None
+
+
+def _output_spec(row: pd.Series) -> Dict[str, Any]:
+    """출력 형식 구조체 행을 출력 사양으로 변환 (null이면 기본 출력)"""
+    image_format = _optional(row.get("format"))
+    if image_format is None:
+        return DEFAULT_OUTPUT
+
+    return {
+        "format": image_format,
+        "quality": _optional_int(row.get("quality")),
+        "progressive": bool(_optional(row.get("progressive"))),
+        "subsampling": _optional(row.get("subsampling")),
+    }
+
+
+def content_type(output_format: Column) -> Column:
+    """출력 형식 이름 컬럼을 MIME 타입 컬럼으로 변환"""
+    mapping = F.create_map(
+        *chain.from_iterable(
+            (F.lit(name), F.lit(spec["content_type"]))
+            for name, spec in OUTPUT_FORMATS.items()
+        )
+    )
+    return mapping[F.coalesce(output_format, F.lit(DEFAULT_OUTPUT_FORMAT))]
+
+
+@pandas_udf(StringType())
+def rendition_keys(
+    batches: Iterator[Tuple[pd.Series, pd.Series, pd.Series, pd.Series, pd.DataFrame]],
+) -> Iterator[pd.Series]:
+    """콘텐츠 ID, 너비, 높이, 필터, 출력 형식 컬럼으로 렌디션 객체 이름 생성"""
+    for content_ids, widths, heights, filter_types, outputs in batches:
+        yield pd.Series(
+            [
+                build_rendition_key(
+                    content_id,
+                    _optional(filter_types.iat[index]),
+                    _optional_int(widths.iat[index]),
+                    _optional_int(heights.iat[index]),
+                    _output_spec(outputs.iloc[index]),
+                )
+                for index, content_id in enumerate(content_ids)
+            ]
+        )
+
+
+@pandas_udf(RENDER_RESULT_SCHEMA)
+def render_images(
+    batches: Iterator[Tuple[pd.Series, pd.Series, pd.Series, pd.Series, pd.DataFrame]],
+) -> Iterator[pd.DataFrame]:
+    """Arrow 배치 단위 렌더링 Pandas UDF
+
+    원본 이미지, 너비, 높이, 필터, 출력 형식(OUTPUT_FORMAT_SCHEMA 구조체) 컬럼을
+    받아 (data, error) 구조체를 반환한다. 같은 원본의 행이 이어지면 디코딩
+    결과를 재사용하므로, 호출 측은 원본 기준으로 파티션/정렬해 전달한다.
+    """
+    # 익스큐터 코어마다 태스크가 실행되므로 OpenCV 내부 스레드는 사용하지 않음
+    cv2.setNumThreads(1)
+
+    last_image: Optional[bytes] = None
+    decoded: Dict[int, np.ndarray] = {}
+    size: Optional[Tuple[int, int]] = None
+
+    for images, widths, heights, filter_types, outputs in batches:
+        data, errors = [], []
+        for index, image_data in enumerate(images):
+            if image_data is None:
+                data.append(None)
+                errors.append("원본을 읽을 수 없습니다")
+                continue
+
+            if image_data is not last_image and image_data != last_image:
+                last_image, decoded = image_data, {}
+                size = (
+                    source_size(image_data) if image_data[:2] == b"\xff\xd8" else None
+                )
+
+            operations = build_operations(
+                _optional_int(widths.iat[index]),
+                _optional_int(heights.iat[index]),
+                _optional(filter_types.iat[index]),
+            )
+            try:
+                data.append(
+                    render(
+                        image_data,
+                        operations,
+                        _output_spec(outputs.iloc[index]),
+                        decoded,
+                        size,
+                    )
+                )
+                errors.append(None)
+
+            except Exception as e:
+                data.append(None)
+                errors.append(str(e))
+
+        yield pd.DataFrame({"data": data, "error": errors})
@@ -0,0 +1,104 @@
+import os
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.types import (
+    ArrayType,
+    BooleanType,
+    DoubleType,
+    IntegerType,
+    MapType,
+    StringType,
+    StructField,
+    StructType,
+)
+
+# Kafka 설정 (서버와 같은 환경 변수 사용)
+KAFKA_BOOTSTRAP_SERVERS = os.getenv(
+    "KAFKA_BOOTSTRAP_SERVERS", "kafka1:9092,kafka2:9093,kafka3:9094"
+)
+KAFKA_IMAGE_TOPIC = os.getenv("KAFKA_IMAGE_TOPIC", "image-processing-requests")
+KAFKA_RESULT_TOPIC = os.getenv("KAFKA_RESULT_TOPIC", "image-processing-results")
+# 마이크로 배치당 최대 처리 메시지 수
+KAFKA_MAX_OFFSETS_PER_TRIGGER = int(os.getenv("KAFKA_MAX_OFFSETS_PER_TRIGGER", "10000"))
+
+OUTPUT_FORMAT_SCHEMA = StructType(
+    [
+        StructField("format", StringType()),
+        StructField("quality", IntegerType()),
+        StructField("progressive", BooleanType()),
+        StructField("subsampling", StringType()),
+    ]
+)
+
+RENDITION_SCHEMA = StructType(
+    [
+        StructField("width", IntegerType()),
+        StructField("height", IntegerType()),
+        StructField("filter", StringType()),
+        StructField("output_format", OUTPUT_FORMAT_SCHEMA),
+        StructField("output", StringType()),
+    ]
+)
+
+# 서버가 보내는 처리 요청 메시지 (단일 params 또는 renditions 목록)
+REQUEST_SCHEMA = StructType(
+    [
+        StructField("image_id", StringType()),
+        StructField("content_id", StringType()),
+        StructField("bucket", StringType()),
+        StructField("object_name", StringType()),
+        StructField("params", MapType(StringType(), StringType())),
+        StructField("renditions", ArrayType(RENDITION_SCHEMA)),
+    ]
+)
+
+# 서버 ImageProcessingResult와 같은 필드의 처리 결과 메시지
+RESULT_SCHEMA = StructType(
+    [
+        StructField("image_id", StringType()),
+        StructField("original_bucket", StringType()),
+        StructField("original_object", StringType()),
+        StructField("processed_bucket", StringType()),
+        StructField("processed_object", StringType()),
+        StructField("processed_objects", ArrayType(StringType())),
+        StructField("processing_time", DoubleType()),
+        StructField("params", MapType(StringType(), StringType())),
+        StructField("status", StringType()),
+        StructField("error", StringType()),
+    ]
+)
+
+
+def read_request_stream(spark: SparkSession) -> DataFrame:
+    """처리 요청 토픽 스트림을 읽어 요청 컬럼으로 파싱"""
+    raw = (
+        spark.readStream.format("kafka")
+        .option("kafka.bootstrap.servers", KAFKA_BOOTSTRAP_SERVERS)
+        .option("subscribe", KAFKA_IMAGE_TOPIC)
+        .option("startingOffsets", "earliest")
+        .option("maxOffsetsPerTrigger", KAFKA_MAX_OFFSETS_PER_TRIGGER)
+        .option("failOnDataLoss", "false")
+        .load()
+    )
+
+    return (
+        raw.select(
+            F.from_json(F.col("value").cast("string"), REQUEST_SCHEMA).alias("request")
+        )
+        .select("request.*")
+        .where(F.col("image_id").isNotNull() & F.col("object_name").isNotNull())
+    )
+
+
+def write_results(results: DataFrame):
+    """처리 결과를 결과 토픽에 기록 (image_id를 키로 사용)"""
+    (
+        results.select(
+            F.col("image_id").alias("key"),
+            F.to_json(F.struct(*results.columns)).alias("value"),
+        )
+        .write.format("kafka")
+        .option("kafka.bootstrap.servers", KAFKA_BOOTSTRAP_SERVERS)
+        .option("topic", KAFKA_RESULT_TOPIC)
+        .save()
+    )
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import zipfile
+from pyspark.sql import SparkSession
+from utils.image_utils.transformations import ARROW_MAX_RECORDS_PER_BATCH
+
+# 서버와 공유하는 이미지 연산 모듈 위치 (app 패키지의 상위 디렉터리)
+# 드라이버는 이 디렉터리를 PYTHONPATH에 포함해 실행한다
+SERVER_APP_ROOT = os.getenv("SERVER_APP_ROOT", "/opt/bitnami/spark/server")
+
+# 익스큐터에 배포할 서버 모듈 (app 패키지 중 외부 의존성이 없는 부분만)
+SHARED_SERVER_MODULES = (
+    "app/__init__.py",
+    "app/services/__init__.py",
+    "app/services/image/__init__.py",
+    "app/services/image/ops.py",
+)
+
+
+def ship_utils(spark: SparkSession):
+    """utils 패키지와 공유 이미지 연산 모듈을 압축해 익스큐터에 배포"""
+    jobs_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    archive = os.path.join(tempfile.mkdtemp(), "utils.zip")
+
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as bundle:
+        for root, _, files in os.walk(os.path.join(jobs_dir, "utils")):
+            for name in files:
+                if name.endswith(".py"):
+                    path = os.path.join(root, name)
+                    bundle.write(path, os.path.relpath(path, jobs_dir))
+
+        for name in SHARED_SERVER_MODULES:
+            bundle.write(os.path.join(SERVER_APP_ROOT, name), name)
+
+    spark.sparkContext.addPyFile(archive)
+
+
+def create_spark_session(app_name: str) -> SparkSession:
+    """작업 공용 SparkSession 생성"""
+    spark = (
+        SparkSession.builder.appName(app_name)
+        .config(
+            "spark.sql.execution.arrow.maxRecordsPerBatch", ARROW_MAX_RECORDS_PER_BATCH
+        )
+        .getOrCreate()
+    )
+    ship_utils(spark)
+    return spark
@@ -0,0 +1,156 @@
+import io
+import json
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple
+import pandas as pd
+import urllib3
+from minio import Minio
+from minio.error import S3Error
+from pyspark.sql.functions import pandas_udf
+from pyspark.sql.types import BinaryType, StringType
+
+# MinIO 설정 (서버와 같은 환경 변수 사용)
+MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "minio:9000")
+MINIO_ACCESS_KEY = os.getenv("MINIO_SERVER_ACCESS_KEY", "root-user")
+MINIO_SECRET_KEY = os.getenv("MINIO_SERVER_SECRET_KEY", "root-password")
+MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() == "true"
+MINIO_ORIGINAL_BUCKET = os.getenv("MINIO_ORIGINAL_BUCKET", "original-images")
+MINIO_PROCESSED_BUCKET = os.getenv("MINIO_PROCESSED_BUCKET", "processed-images")
+MINIO_POOL_SIZE = int(os.getenv("MINIO_POOL_SIZE", "16"))
+
+_client: Optional[Minio] = None
+
+
+def get_minio_client() -> Minio:
+    """파이썬 워커 프로세스 공용 MinIO 클라이언트
+
+    워커 프로세스는 태스크 간에 재사용되므로 파티션마다 연결을 새로 만들지 않는다.
+    """
+    global _client
+    if _client is None:
+        _client = Minio(
+            MINIO_ENDPOINT,
+            access_key=MINIO_ACCESS_KEY,
+            secret_key=MINIO_SECRET_KEY,
+            secure=MINIO_SECURE,
+            http_client=urllib3.PoolManager(
+                maxsize=MINIO_POOL_SIZE,
+                retries=urllib3.Retry(
+                    total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+                ),
+            ),
+        )
+    return _client
+
+
+def download_object(bucket_name: str, object_name: str) -> Optional[bytes]:
+    """객체 다운로드 (없으면 None)"""
+    response = None
+    try:
+        response = get_minio_client().get_object(bucket_name, object_name)
+        return response.read()
+
+    except S3Error as e:
+        if e.code == "NoSuchKey":
+            return None
+        raise
+
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+
+def upload_object(
+    bucket_name: str,
+    object_name: str,
+    data: bytes,
+    content_type: str,
+    metadata: Optional[Dict[str, str]] = None,
+) -> str:
+    """객체 업로드 후 ETag 반환"""
+    result = get_minio_client().put_object(
+        bucket_name,
+        object_name,
+        io.BytesIO(data),
+        length=len(data),
+        content_type=content_type,
+        metadata=metadata,
+    )
+    return result.etag
+
+
+def list_objects(bucket_name: str, prefix: str) -> Iterator[Tuple[str, str]]:
+    """접두사 아래 객체의 (이름, ETag) 목록"""
+    for obj in get_minio_client().list_objects(
+        bucket_name, prefix=prefix, recursive=True
+    ):
+        if not obj.is_dir:
+            yield obj.object_name, obj.etag
+
+
+def write_json(bucket_name: str, object_name: str, value: Any) -> str:
+    """JSON 객체 쓰기"""
+    return upload_object(
+        bucket_name,
+        object_name,
+        json.dumps(value).encode("utf-8"),
+        "application/json",
+    )
+
+
+# 외부 저장소를 읽고 쓰는 UDF는 옵티마이저가 중복 실행하거나 순서를 바꾸지 않도록
+# 비결정적으로 표시한다
+@pandas_udf(BinaryType())
+def _fetch_objects(
+    batches: Iterator[Tuple[pd.Series, pd.Series]],
+) -> Iterator[pd.Series]:
+    """버킷, 객체 이름 컬럼으로 객체를 내려받는 Pandas UDF (없거나 실패하면 null)
+
+    직전 객체를 기억하므로 같은 객체의 행이 이어지면 한 번만 내려받는다.
+    """
+    last_key: Optional[Tuple[str, str]] = None
+    last_data: Optional[bytes] = None
+
+    for buckets, names in batches:
+        objects = []
+        for key in zip(buckets, names):
+            if key != last_key:
+                last_key = key
+                try:
+                    last_data = download_object(*key)
+                except Exception:
+                    last_data = None
+            objects.append(last_data)
+        yield pd.Series(objects, dtype=object)
+
+
+@pandas_udf(StringType())
+def _store_objects(
+    batches: Iterator[Tuple[pd.Series, pd.Series, pd.Series, pd.Series, pd.Series]],
+) -> Iterator[pd.Series]:
+    """버킷, 객체 이름, 데이터, MIME 타입, 원본 ETag 컬럼을 업로드하는 Pandas UDF
+
+    원본 ETag가 있으면 source-etag 메타데이터로 기록한다. 행마다 업로드 오류
+    메시지를 반환한다 (성공했거나 데이터가 null이면 null).
+    """
+    for buckets, names, objects, content_types, etags in batches:
+        errors = []
+        for bucket_name, object_name, data, content_type, etag in zip(
+            buckets, names, objects, content_types, etags
+        ):
+            if data is None:
+                errors.append(None)
+                continue
+
+            metadata = {"source-etag": etag} if isinstance(etag, str) else None
+            try:
+                upload_object(bucket_name, object_name, data, content_type, metadata)
+                errors.append(None)
+            except Exception as e:
+                errors.append(str(e))
+        yield pd.Series(errors, dtype=object)
+
+
+fetch_objects = _fetch_objects.asNondeterministic()
+store_objects = _store_objects.asNondeterministic()